@@ -1,2087 +1,1656 @@
-import os
-import sqlite3
-from PyQt6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QCheckBox, QScrollArea, QFrame, QLabel, QLineEdit, QHeaderView,
-    QMessageBox, QTabWidget, QGraphicsView, QGraphicsScene
-)
-from PyQt6.QtGui import QPainter, QPen, QIntValidator, QFont
-from PyQt6.QtCore import Qt, QEvent
-
-# Definiši putanju do baze
-DB_PATH = "data/baza.db"
-
-# --- POMOĆNE KLASE ---
-
-class UppercaseLineEdit(QLineEdit):
-    """Custom klasa za unos teksta koji se automatski konvertuje u velika slova."""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.textChanged.connect(self.to_uppercase)
-
-    def to_uppercase(self):
-        self.blockSignals(True)
-        self.setText(self.text().upper())
-        self.blockSignals(False)
-
-# --- GLAVNA APLIKACIJA ---
-
-class SimpleApp(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Turnusi_VV")
-        self.resize(1400, 900)
-        self.init_database()
-        
-        # Promenljive za režim uređivanja
-        self.trenutni_broj_za_izmenu = None
-        self.trenutni_turnus_za_izmenu = None
-        
-        # Informacije o sortiranju
-        self.vozi_sort_info = {'column': 0, 'order': Qt.SortOrder.AscendingOrder} # Default: broj voza ASC
-        self.turnusi_sort_info = {'column': 0, 'order': Qt.SortOrder.AscendingOrder} # Default: naziv ASC
-        
-        # Informacije o grafiku
-        self.godina_za_grafik = "" # Atribut za čuvanje unete godine
-        self.godina_input = None # Atribut za referencu na QLineEdit
-        
-        # Inicijalizacija UI
-        self.init_ui()
-        
-        # Popunjavanje filtera i učitavanje podataka
-        self.populate_filters_and_load_data()
-
-    def populate_filters_and_load_data(self):
-        """Centralizovana funkcija za popunjavanje svih filtera i učitavanje početnih podataka."""
-        # Tab Vozovi
-        self.populate_vozovi_filter()
-        self.populate_sekcije_filter()
-        self.populate_serije_filter()
-        self.ucitaj_podatke(sort_column=None, sort_order=None) # Inicijalno bez sortiranja
-        
-        # Tab Turnusi
-        self.populate_nazivi_filter()
-        self.populate_sekcije_turnusi_filter()
-        self.populate_serije_vv_filter()
-        self.ucitaj_turnuse(sort_column=None, sort_order=None) # Inicijalno bez sortiranja
-        
-        # Tab Grafik
-        self.populate_grafik_filter()
-
-    # --- BAZA PODATAKA ---
-
-    def init_database(self):
-        """Inicijalizuje bazu podataka i tabele."""
-        os.makedirs("data", exist_ok=True)
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Tabela za vozove
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS vozovi (
-                broj_voza TEXT PRIMARY KEY,
-                pocetna_stanica TEXT,
-                krajnja_stanica TEXT,
-                sat_polaska INTEGER,
-                minut_polaska INTEGER,
-                sat_dolaska INTEGER,
-                minut_dolaska INTEGER,
-                status TEXT,
-                sekcija TEXT,
-                serija_vozila TEXT
-            )
-        ''')
-        
-        # Tabela za turnuse
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS turnusi (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                naziv TEXT UNIQUE,
-                sekcija TEXT,
-                serija_vv TEXT
-            )
-        ''')
-        
-        # Tabela za veze između turnusa i voza
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS turnus_vozovi (
-                turnus_id INTEGER,
-                broj_voza TEXT,
-                redosled INTEGER,
-                PRIMARY KEY (turnus_id, broj_voza),
-                FOREIGN KEY (turnus_id) REFERENCES turnusi(id),
-                FOREIGN KEY (broj_voza) REFERENCES vozovi(broj_voza)
-            )
-        ''')
-        conn.commit()
-        conn.close()
-        
-        # --- DODANO ---
-        # Učitaj prethodno sačuvanu godinu prilikom inicijalizacije baze
-        #self.ucitaj_godinu_za_grafik()
-        # ---
-
-    # --- KORISNIČKI INTERFEJS ---
-    def init_ui(self):
-        """Inicijalizuje korisnički interfejs sa tabovima."""
-        main_layout = QVBoxLayout()
-        self.tabs = QTabWidget()
-        self.tabs.addTab(self.create_tab_vozovi(), "Vozovi")
-        self.tabs.addTab(self.create_tab_turnusi(), "Turnusi")
-        self.tabs.addTab(self.create_tab_grafik(), "Pregled Grafika")
-        # DODAVANJE NOVOG TABA
-        self.tabs.addTab(self.create_tab_stampa(), "Stampa turnusa") 
-        main_layout.addWidget(self.tabs)
-        self.setLayout(main_layout)
-
-    def create_tab_vozovi(self):
-        """Kreira tab za upravljanje vozovima."""
-        widget = QWidget()
-        main_layout = QVBoxLayout()
-        
-        # --- GORNJI DEO (30%) ---
-        top_frame = QFrame()
-        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        top_layout = QHBoxLayout(top_frame)
-        
-        # === Forma za unos voza (55%) ===
-        left_frame = QFrame()
-        left_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        left_layout = QVBoxLayout(left_frame)
-        naslov = QLabel("Unos voza")
-        naslov.setStyleSheet("font-size: 16px; font-weight: bold;")
-        left_layout.addWidget(naslov)
-        
-        # Input polja
-        self.broj_voza_input = UppercaseLineEdit()
-        self.pocetna_input = UppercaseLineEdit()
-        self.krajnja_input = UppercaseLineEdit()
-        self.sat_p_input = UppercaseLineEdit()
-        self.minut_p_input = UppercaseLineEdit()
-        self.sat_d_input = UppercaseLineEdit()
-        self.minut_d_input = UppercaseLineEdit()
-        self.serija_input = UppercaseLineEdit()
-        self.status_input = UppercaseLineEdit()
-        self.sekcija_input = UppercaseLineEdit()
-        
-        # Validatori
-        self.sat_p_input.setValidator(QIntValidator(0, 23))
-        self.minut_p_input.setValidator(QIntValidator(0, 59))
-        self.sat_d_input.setValidator(QIntValidator(0, 23))
-        self.minut_d_input.setValidator(QIntValidator(0, 59))
-        
-        # Layout forme
-        form_inner = QHBoxLayout()
-        levo_forme = QVBoxLayout()
-        desno_forme = QVBoxLayout()
-        
-        levo_forme.addWidget(QLabel("Broj voza (3-6 alfanumerička znaka, npr. R4655):"))
-        levo_forme.addWidget(self.broj_voza_input)
-        levo_forme.addWidget(QLabel("Početna stanica (2-3 slova):"))
-        levo_forme.addWidget(self.pocetna_input)
-        levo_forme.addWidget(QLabel("Krajnja stanica (2-3 slova):"))
-        levo_forme.addWidget(self.krajnja_input)
-        levo_forme.addWidget(QLabel("Sat polaska (hh):"))
-        levo_forme.addWidget(self.sat_p_input)
-        levo_forme.addWidget(QLabel("Minut polaska (mm):"))
-        levo_forme.addWidget(self.minut_p_input)
-        
-        desno_forme.addWidget(QLabel("Sat dolaska (hh):"))
-        desno_forme.addWidget(self.sat_d_input)
-        desno_forme.addWidget(QLabel("Minut dolaska (mm):"))
-        desno_forme.addWidget(self.minut_d_input)
-        desno_forme.addWidget(QLabel("Serija vučnog vozila:"))
-        desno_forme.addWidget(self.serija_input)
-        desno_forme.addWidget(QLabel("Status (R, L, RE, S, V):"))
-        desno_forme.addWidget(self.status_input)
-        desno_forme.addWidget(QLabel("Sekcija (npr. KV):"))
-        desno_forme.addWidget(self.sekcija_input)
-        
-        form_inner.addLayout(levo_forme)
-        form_inner.addLayout(desno_forme)
-        left_layout.addLayout(form_inner)
-        
-        # Dugmad
-        btn_layout = QHBoxLayout()
-        self.btn_dodaj = QPushButton("Dodaj voz")
-        self.btn_dodaj.clicked.connect(self.dodaj_voz)
-        self.btn_azuriraj = QPushButton("Ažuriraj voz")
-        self.btn_azuriraj.clicked.connect(self.azuriraj_voz)
-        self.btn_azuriraj.setVisible(False)
-        self.btn_odustani = QPushButton("Odustani od uređivanja")
-        self.btn_odustani.clicked.connect(self.odustani_od_uredjivanja)
-        self.btn_odustani.setVisible(False)
-        btn_layout.addWidget(self.btn_dodaj)
-        btn_layout.addWidget(self.btn_azuriraj)
-        btn_layout.addWidget(self.btn_odustani)
-        left_layout.addLayout(btn_layout)
-        top_layout.addWidget(left_frame, 55)
-        
-        # === Filteri ===
-        # Filter po vozovima (15%)
-        center_frame = QFrame()
-        center_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        center_layout = QVBoxLayout(center_frame)
-        label_voz = QLabel("Filter po vozovima:")
-        center_layout.addWidget(label_voz)
-        self.voz_filter_widget = QWidget()
-        self.voz_filter_layout = QVBoxLayout()
-        self.voz_filter_layout.setSpacing(2)
-        self.all_vozovi_cb = QCheckBox("Označi sve")
-        self.all_vozovi_cb.setChecked(True)
-        self.all_vozovi_cb.stateChanged.connect(self.on_all_vozovi_toggled)
-        self.voz_filter_layout.addWidget(self.all_vozovi_cb)
-        self.voz_filter_widget.setLayout(self.voz_filter_layout)
-        scroll_voz = QScrollArea()
-        scroll_voz.setWidgetResizable(True)
-        scroll_voz.setWidget(self.voz_filter_widget)
-        center_layout.addWidget(scroll_voz)
-        top_layout.addWidget(center_frame, 15)
-
-        # Filter po sekcijama (15%)
-        right_frame = QFrame()
-        right_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        right_layout = QVBoxLayout(right_frame)
-        label_sekcija = QLabel("Filter po sekciji:")
-        right_layout.addWidget(label_sekcija)
-        self.sekcije_filter_widget = QWidget()
-        self.sekcije_filter_layout = QVBoxLayout()
-        self.sekcije_filter_layout.setSpacing(2)
-        self.all_sekcije_cb = QCheckBox("Označi sve")
-        self.all_sekcije_cb.setChecked(True)
-        self.all_sekcije_cb.stateChanged.connect(self.on_all_sekcije_toggled)
-        self.sekcije_filter_layout.addWidget(self.all_sekcije_cb)
-        self.sekcije_filter_widget.setLayout(self.sekcije_filter_layout)
-        scroll_sekcija = QScrollArea()
-        scroll_sekcija.setWidgetResizable(True)
-        scroll_sekcija.setWidget(self.sekcije_filter_widget)
-        right_layout.addWidget(scroll_sekcija)
-        top_layout.addWidget(right_frame, 15)
-
-        # Filter po serijama (15%)
-        serija_frame = QFrame()
-        serija_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        serija_layout = QVBoxLayout(serija_frame)
-        label_serija = QLabel("Filter po seriji:")
-        serija_layout.addWidget(label_serija)
-        self.serije_filter_widget = QWidget()
-        self.serije_filter_layout = QVBoxLayout()
-        self.serije_filter_layout.setSpacing(2)
-        self.all_serije_cb = QCheckBox("Označi sve")
-        self.all_serije_cb.setChecked(True)
-        self.all_serije_cb.stateChanged.connect(self.on_all_serije_toggled)
-        self.serije_filter_layout.addWidget(self.all_serije_cb)
-        self.serije_filter_widget.setLayout(self.serije_filter_layout)
-        scroll_serija = QScrollArea()
-        scroll_serija.setWidgetResizable(True)
-        scroll_serija.setWidget(self.serije_filter_widget)
-        serija_layout.addWidget(scroll_serija)
-        top_layout.addWidget(serija_frame, 15)
-        
-        main_layout.addWidget(top_frame, 30)
-
-        # --- DONJI DEO (70%) ---
-        bottom_frame = QFrame()
-        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        bottom_layout = QVBoxLayout(bottom_frame)
-        bottom_layout.addWidget(QLabel("Postojeći vozovi:"))
-        self.tabela = QTableWidget()
-        self.tabela.setColumnCount(10)
-        self.tabela.setHorizontalHeaderLabels([
-            "Broj voza", "Poč. st.", "Kraj. st.", "Polazak", "Dolazak",
-            "Serija", "Status", "Sekcija", "Uredi", "Obriši"
-        ])
-        self.tabela.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        # ONEMOGUĆI Qt SORTIRANJE
-        self.tabela.setSortingEnabled(False) 
-        
-        # Poveži klik na zaglavlje sa funkcijom za rukovanje sortiranjem
-        self.tabela.horizontalHeader().sectionClicked.connect(self.handle_vozovi_header_click)
-        
-        bottom_layout.addWidget(self.tabela)
-        main_layout.addWidget(bottom_frame, 70)
-        
-        widget.setLayout(main_layout)
-        return widget
-
-    def create_tab_turnusi(self):
-        """Kreira tab za upravljanje turnusima."""
-        widget = QWidget()
-        main_layout = QVBoxLayout()
-        
-        # --- GORNJI DEO (30%) ---
-        top_frame = QFrame()
-        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        top_layout = QHBoxLayout(top_frame)
-        
-        # === Forma za unos turnusa (55%) ===
-        left_frame = QFrame()
-        left_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        left_layout = QVBoxLayout(left_frame)
-        naslov = QLabel("Unos turnusa")
-        naslov.setStyleSheet("font-size: 16px; font-weight: bold;")
-        left_layout.addWidget(naslov)
-        
-        # Polja forme
-        self.naziv_turnusa_input = QLineEdit()
-        self.naziv_turnusa_input.setPlaceholderText("Npr. TUR1")
-        self.serija_vv_input = UppercaseLineEdit()
-        self.serija_vv_input.setPlaceholderText("Npr. 441, 442")
-        self.vozovi_input = QLineEdit()
-        self.vozovi_input.setPlaceholderText("Npr. 4830, 4831, 4832")
-        self.sekcija_voza_input = UppercaseLineEdit()
-        self.sekcija_voza_input.setPlaceholderText("Npr. KV")
-        
-        left_layout.addWidget(QLabel("Naziv turnusa:"))
-        left_layout.addWidget(self.naziv_turnusa_input)
-        left_layout.addWidget(QLabel("Serija VV:"))
-        left_layout.addWidget(self.serija_vv_input)
-        left_layout.addWidget(QLabel("Vozovi u turnusu:"))
-        left_layout.addWidget(self.vozovi_input)
-        left_layout.addWidget(QLabel("Sekcija za vuču vozova:"))
-        left_layout.addWidget(self.sekcija_voza_input)
-        
-        # Dugmad
-        self.btn_proveri = QPushButton("Proveri turnus")
-        self.btn_proveri.clicked.connect(self.proveri_turnus)
-        left_layout.addWidget(self.btn_proveri)
-        self.btn_odustani_turnus = QPushButton("Odustani od uređivanja")
-        self.btn_odustani_turnus.clicked.connect(self.odustani_od_uredjivanja_turnusa)
-        self.btn_odustani_turnus.setVisible(False)
-        left_layout.addWidget(self.btn_odustani_turnus)
-        
-        self.status_label = QLabel("")
-        self.status_label.setWordWrap(True)
-        self.status_label.setStyleSheet("padding: 10px; background-color: #f0f0f0; border-radius: 5px;")
-        left_layout.addWidget(self.status_label)
-        top_layout.addWidget(left_frame, 55)
-        
-        # === Filteri ===
-        # Filter po nazivu (15%)
-        center_frame = QFrame()
-        center_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        center_layout = QVBoxLayout(center_frame)
-        label_naziv = QLabel("Filter po nazivu:")
-        center_layout.addWidget(label_naziv)
-        self.naziv_filter_widget = QWidget()
-        self.naziv_filter_layout = QVBoxLayout()
-        self.naziv_filter_layout.setSpacing(2)
-        self.all_nazivi_cb = QCheckBox("Označi sve")
-        self.all_nazivi_cb.setChecked(True)
-        self.all_nazivi_cb.stateChanged.connect(self.on_all_nazivi_toggled)
-        self.naziv_filter_layout.addWidget(self.all_nazivi_cb)
-        self.naziv_filter_widget.setLayout(self.naziv_filter_layout)
-        scroll_naziv = QScrollArea()
-        scroll_naziv.setWidgetResizable(True)
-        scroll_naziv.setWidget(self.naziv_filter_widget)
-        center_layout.addWidget(scroll_naziv)
-        top_layout.addWidget(center_frame, 15)
-
-        # Filter po sekciji (15%)
-        right_frame = QFrame()
-        right_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        right_layout = QVBoxLayout(right_frame)
-        label_sekcija = QLabel("Filter po sekciji:")
-        right_layout.addWidget(label_sekcija)
-        self.sekcije_turnusi_filter_widget = QWidget()
-        self.sekcije_turnusi_filter_layout = QVBoxLayout()
-        self.sekcije_turnusi_filter_layout.setSpacing(2)
-        self.all_sekcije_turnusi_cb = QCheckBox("Označi sve")
-        self.all_sekcije_turnusi_cb.setChecked(True)
-        self.all_sekcije_turnusi_cb.stateChanged.connect(self.on_all_sekcije_turnusi_toggled)
-        self.sekcije_turnusi_filter_layout.addWidget(self.all_sekcije_turnusi_cb)
-        self.sekcije_turnusi_filter_widget.setLayout(self.sekcije_turnusi_filter_layout)
-        scroll_sekcija = QScrollArea()
-        scroll_sekcija.setWidgetResizable(True)
-        scroll_sekcija.setWidget(self.sekcije_turnusi_filter_widget)
-        right_layout.addWidget(scroll_sekcija)
-        top_layout.addWidget(right_frame, 15)
-
-        # Filter po seriji VV (15%)
-        serija_frame = QFrame()
-        serija_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        serija_layout = QVBoxLayout(serija_frame)
-        label_serija = QLabel("Filter po seriji VV:")
-        serija_layout.addWidget(label_serija)
-        self.serije_vv_filter_widget = QWidget()
-        self.serije_vv_filter_layout = QVBoxLayout()
-        self.serije_vv_filter_layout.setSpacing(2)
-        self.all_serije_vv_cb = QCheckBox("Označi sve")
-        self.all_serije_vv_cb.setChecked(True)
-        self.all_serije_vv_cb.stateChanged.connect(self.on_all_serije_vv_toggled)
-        self.serije_vv_filter_layout.addWidget(self.all_serije_vv_cb)
-        self.serije_vv_filter_widget.setLayout(self.serije_vv_filter_layout)
-        scroll_serija = QScrollArea()
-        scroll_serija.setWidgetResizable(True)
-        scroll_serija.setWidget(self.serije_vv_filter_widget)
-        serija_layout.addWidget(scroll_serija)
-        top_layout.addWidget(serija_frame, 15)
-        
-        main_layout.addWidget(top_frame, 30)
-
-        # --- DONJI DEO (70%) ---
-        bottom_frame = QFrame()
-        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        bottom_layout = QVBoxLayout(bottom_frame)
-        bottom_layout.addWidget(QLabel("Postojeći turnusi:"))
-        self.tabela_turnusa = QTableWidget()
-        self.tabela_turnusa.setColumnCount(5)
-        self.tabela_turnusa.setHorizontalHeaderLabels([
-            "Naziv", "Serija VV", "Vozovi", "Sekcija", "Akcije"
-        ])
-        self.tabela_turnusa.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        # ONEMOGUĆI Qt SORTIRANJE
-        self.tabela_turnusa.setSortingEnabled(False)
-        
-        # Poveži klik na zaglavlje sa funkcijom za rukovanje sortiranjem
-        self.tabela_turnusa.horizontalHeader().sectionClicked.connect(self.handle_turnusi_header_click)
-        
-        bottom_layout.addWidget(self.tabela_turnusa)
-        main_layout.addWidget(bottom_frame, 70)
-        
-        widget.setLayout(main_layout)
-        return widget
-
-    def create_tab_grafik(self):
-        """Kreira tab za grafički prikaz turnusa."""
-        widget = QWidget()
-        main_layout = QVBoxLayout()
-        
-        # --- GORNJI DEO (30%) ---
-        top_frame = QFrame()
-        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        top_layout = QHBoxLayout(top_frame)
-        
-        # === Filteri ===
-        # Filter po turnusima (25%)
-        left_frame = QFrame()
-        left_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        left_layout = QVBoxLayout(left_frame)
-        label_turnusi = QLabel("Izaberite turnuse za prikaz:")
-        left_layout.addWidget(label_turnusi)
-        self.grafik_filter_widget = QWidget()
-        self.grafik_filter_layout = QVBoxLayout()
-        self.grafik_filter_layout.setSpacing(2)
-        self.all_turnusi_cb = QCheckBox("Označi sve")
-        self.all_turnusi_cb.setChecked(True)
-        self.all_turnusi_cb.stateChanged.connect(self.on_all_turnusi_toggled)
-        self.grafik_filter_layout.addWidget(self.all_turnusi_cb)
-        self.grafik_filter_widget.setLayout(self.grafik_filter_layout)
-        scroll_turnusi = QScrollArea()
-        scroll_turnusi.setWidgetResizable(True)
-        scroll_turnusi.setWidget(self.grafik_filter_widget)
-        left_layout.addWidget(scroll_turnusi)
-        top_layout.addWidget(left_frame, 25)
-
-        # Filter po sekcijama (25%)
-        center_frame = QFrame()
-        center_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        center_layout = QVBoxLayout(center_frame)
-        label_sekcije = QLabel("Filter po sekcijama:")
-        center_layout.addWidget(label_sekcije)
-        self.sekcije_grafik_widget = QWidget()
-        self.sekcije_grafik_layout = QVBoxLayout()
-        self.sekcije_grafik_layout.setSpacing(2)
-        self.all_sekcije_grafik_cb = QCheckBox("Označi sve")
-        self.all_sekcije_grafik_cb.setChecked(True)
-        self.all_sekcije_grafik_cb.stateChanged.connect(self.on_all_sekcije_grafik_toggled)
-        self.sekcije_grafik_layout.addWidget(self.all_sekcije_grafik_cb)
-        self.sekcije_grafik_widget.setLayout(self.sekcije_grafik_layout)
-        scroll_sekcije = QScrollArea()
-        scroll_sekcije.setWidgetResizable(True)
-        scroll_sekcije.setWidget(self.sekcije_grafik_widget)
-        center_layout.addWidget(scroll_sekcije)
-        top_layout.addWidget(center_frame, 25)
-
-        # Filter po seriji VV (25%)
-        right_frame = QFrame()
-        right_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        right_layout = QVBoxLayout(right_frame)
-        label_serije_vv = QLabel("Filter po seriji VV:")
-        right_layout.addWidget(label_serije_vv)
-        self.serije_vv_grafik_widget = QWidget()
-        self.serije_vv_grafik_layout = QVBoxLayout()
-        self.serije_vv_grafik_layout.setSpacing(2)
-        self.all_serije_vv_grafik_cb = QCheckBox("Označi sve")
-        self.all_serije_vv_grafik_cb.setChecked(True)
-        self.all_serije_vv_grafik_cb.stateChanged.connect(self.on_all_serije_vv_grafik_toggled)
-        self.serije_vv_grafik_layout.addWidget(self.all_serije_vv_grafik_cb)
-        self.serije_vv_grafik_widget.setLayout(self.serije_vv_grafik_layout)
-        scroll_serije_vv = QScrollArea()
-        scroll_serije_vv.setWidgetResizable(True)
-        scroll_serije_vv.setWidget(self.serije_vv_grafik_widget)
-        right_layout.addWidget(scroll_serije_vv)
-        top_layout.addWidget(right_frame, 25)
-
-        # === Forma za unos godine (25%) ===
-        empty_frame = QFrame()
-        empty_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        empty_layout = QVBoxLayout(empty_frame) # Koristi QVBoxLayout za vertikalni raspored
-
-        # Naslov
-        naslov_label = QLabel("GRAFIČKI TURNUS VUČNIH VOZILA ZA RED VOŽNJE")
-        naslov_label.setAlignment(Qt.AlignmentFlag.AlignCenter) # Centriraj tekst
-        naslov_label.setStyleSheet("font-weight: bold;") # Opcionalno: podebljaj tekst
-        empty_layout.addWidget(naslov_label)
-
-                # Horizontalni layout za input i label "GODINU"
-        input_layout = QHBoxLayout()
-        input_layout.addStretch() # Dodaj fleksibilni prostor levo
-
-        self.godina_input = QLineEdit() # Inicijalizuj referencu
-        # --- DODANO ---
-        # Podebljaj font i centriraj tekst u QLineEdit-u
-        font = self.godina_input.font()
-        font.setBold(True)
-        self.godina_input.setFont(font)
-        self.godina_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # --- KRAJ DODAVANJA ---
-        self.godina_input.setPlaceholderText("Npr. 09.12.2025/26") # Placeholder
-        # Poveži promenu teksta sa funkcijom za čuvanje
-        self.godina_input.textChanged.connect(self.snimi_godinu_za_grafik)
-
-        input_layout.addWidget(self.godina_input)
-        # input_layout.addWidget(QLabel("GODINU")) # Dodaj labelu "GODINU" ispod inputa, ne pored
-        input_layout.addStretch() # Dodaj fleksibilni prostor desno
-
-        empty_layout.addLayout(input_layout) # Dodaj horizontalni layout u glavni (vertikalni) layout
-
-        # Dodaj labelu "GODINU" ispod inputa
-        label_godina = QLabel("GODINU")
-        label_godina.setAlignment(Qt.AlignmentFlag.AlignCenter) # Centriraj tekst labela
-        label_godina.setStyleSheet("font-weight: bold;") # Podebljaj tekst
-        empty_layout.addWidget(label_godina)
-
-        top_layout.addWidget(empty_frame, 25) # ← 25%
-        
-        main_layout.addWidget(top_frame, 30) # ← Gornji deo zauzima 30% visine
-
-        # --- DONJI DEO (70%) ---
-        bottom_frame = QFrame()
-        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        bottom_layout = QVBoxLayout(bottom_frame)
-        naslov = QLabel("Grafički prikaz turnusa")
-        naslov.setStyleSheet("font-size: 16px; font-weight: bold;")
-        bottom_layout.addWidget(naslov)
-        self.scene = QGraphicsScene()
-        self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
-        bottom_layout.addWidget(self.view)
-        self.btn_azuriraj_grafik = QPushButton("Ažuriraj grafik")
-        self.btn_azuriraj_grafik.clicked.connect(self.crtaj_grafik)
-        bottom_layout.addWidget(self.btn_azuriraj_grafik)
-        main_layout.addWidget(bottom_frame, 70)
-        
-        widget.setLayout(main_layout)
-
-        # --- DODATO: Učitaj vrednost odmah nakon što je input inicijalizovan ---
-        # Ovo osigurava da se vrednost učita *nakon* što self.godina_input postoji
-        self.ucitaj_godinu_za_grafik()
-        # ---
-
-        return widget
-    
-    def create_tab_stampa(self):
-        """Kreira tab za prikaz i štampu turnusa."""
-        widget = QWidget()
-        main_layout = QVBoxLayout()
-
-        # --- GORNJI DEO (25%) ---
-        top_frame = QFrame()
-        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        # KORISTIMO QHBoxLayout za tri jednaka dela
-        top_layout = QHBoxLayout(top_frame)
-
-        # === Kontrole za izbor turnusa (33.33%) ===
-        left_top_frame = QFrame()
-        left_top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        left_top_layout = QVBoxLayout(left_top_frame)
-        left_top_layout.addWidget(QLabel("Kontrole za izbor turnusa (33.33% širine gornjeg dela)"))
-        # TODO: Dodati kontrole za izbor sekcije, filtriranje turnusa itd.
-        top_layout.addWidget(left_top_frame) # Qt automatski dodeljuje težinu
-
-        # === Pregled selekcije (33.33%) ===
-        middle_top_frame = QFrame()
-        middle_top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        middle_top_layout = QVBoxLayout(middle_top_frame)
-        middle_top_layout.addWidget(QLabel("Pregled selekcije (33.33% širine gornjeg dela)"))
-        # TODO: Dodati widget za prikaz izabranih turnusa
-        top_layout.addWidget(middle_top_frame) # Qt automatski dodeljuje težinu
-
-        # === REZERVA (33.33%) ===
-        right_top_frame = QFrame()
-        right_top_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        right_top_layout = QVBoxLayout(right_top_frame)
-        right_top_layout.addWidget(QLabel("Rezervni prostor (33.33% širine gornjeg dela)"))
-        # TODO: Rezervni prostor za buduću funkcionalnost
-        top_layout.addWidget(right_top_frame) # Qt automatski dodeljuje težinu
-
-        main_layout.addWidget(top_frame, 20) # 25% visine
-
-        # --- DONJI DEO (75%) ---
-        bottom_frame = QFrame()
-        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        bottom_layout = QVBoxLayout(bottom_frame)
-        bottom_layout.addWidget(QLabel("Prikaz za štampu (A4 format) - 100% širine donjeg dela"))
-        # TODO: Dodati QGraphicsView ili drugi widget za prikaz A4
-        self.stampa_scene = QGraphicsScene()
-        self.stampa_view = QGraphicsView(self.stampa_scene)
-        self.stampa_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        # Postaviti fiksnu veličinu za A4 (210mm x 297mm) na ekranu
-        # Primer: 1mm = 3.78 px na ekranu (96 DPI), pa je A4 ~ 794 x 1123 px
-        # self.stampa_view.setFixedSize(794, 1123) # Ako želiš fiksnu veličinu
-        bottom_layout.addWidget(self.stampa_view)
-        main_layout.addWidget(bottom_frame, 80) # 75% visine
-
-        widget.setLayout(main_layout)
-        return widget
-
-    # --- FUNKCIJE ZA FILTRIRANJE (CHECKBOX KONTROLE) ---
-    def on_individual_checkbox_changed(self, state, checkbox, all_checkbox, reload_function):
-        """Kada se promeni individualni checkbox, ažuriraj 'Označi sve' i osveži prikaz."""
-        # Ako je neki checkbox ručno rasčekiran, rasčekiraj "Označi sve"
-        if state == Qt.CheckState.Unchecked.value:
-            all_checkbox.blockSignals(True)
-            all_checkbox.setChecked(False)
-            all_checkbox.blockSignals(False)
-        # Ako su svi checkboxovi čekirani, čekiraj "Označi sve"
-        # Pronađi sve checkboxove u istom layoutu (osim "Označi sve")
-        layout = checkbox.parentWidget().layout()
-        all_checked = True
-        for i in range(1, layout.count()): # Počinjemo od 1 da preskočimo "Označi sve"
-            w = layout.itemAt(i).widget()
-            if isinstance(w, QCheckBox) and not w.isChecked():
-                all_checked = False
-                break
-                
-        if all_checked and layout.count() > 1: # Proveri da li postoji bar jedan checkbox osim "Označi sve"
-            all_checkbox.blockSignals(True)
-            all_checkbox.setChecked(True)
-            all_checkbox.blockSignals(False)
-            
-        reload_function()
-
-    def on_all_vozovi_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(self.voz_filter_layout.count()):
-            widget = self.voz_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget != self.all_vozovi_cb:
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        # Osveži bez sortiranja
-        self.ucitaj_podatke(sort_column=None, sort_order=None)
-
-    def on_all_sekcije_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(self.sekcije_filter_layout.count()):
-            widget = self.sekcije_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget != self.all_sekcije_cb:
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        # Osveži bez sortiranja
-        self.ucitaj_podatke(sort_column=None, sort_order=None)
-
-    def on_all_serije_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(1, self.serije_filter_layout.count()):
-            widget = self.serije_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        # Osveži bez sortiranja
-        self.ucitaj_podatke(sort_column=None, sort_order=None)
-
-    def on_all_nazivi_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(self.naziv_filter_layout.count()):
-            widget = self.naziv_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget != self.all_nazivi_cb:
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        # Osveži bez sortiranja
-        self.ucitaj_turnuse(sort_column=None, sort_order=None)
-
-    def on_all_sekcije_turnusi_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(self.sekcije_turnusi_filter_layout.count()):
-            widget = self.sekcije_turnusi_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget != self.all_sekcije_turnusi_cb:
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        # Osveži bez sortiranja
-        self.ucitaj_turnuse(sort_column=None, sort_order=None)
-
-    def on_all_serije_vv_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(1, self.serije_vv_filter_layout.count()):
-            widget = self.serije_vv_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        # Osveži bez sortiranja
-        self.ucitaj_turnuse(sort_column=None, sort_order=None)
-
-    def on_all_turnusi_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(1, self.grafik_filter_layout.count()):
-            widget = self.grafik_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        self.crtaj_grafik()
-
-    def on_all_sekcije_grafik_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(1, self.sekcije_grafik_layout.count()):
-            widget = self.sekcije_grafik_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        self.filter_turnuse_po_sekciji()
-
-    def on_all_serije_vv_grafik_toggled(self, state):
-        is_checked = state == Qt.CheckState.Checked.value
-        for i in range(1, self.serije_vv_grafik_layout.count()):
-            widget = self.serije_vv_grafik_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                widget.blockSignals(True)
-                widget.setChecked(is_checked)
-                widget.blockSignals(False)
-        self.filter_turnuse_po_seriji_vv()
-
-    # --- POPUNJAVANJE FILTARA ---
-
-    def populate_vozovi_filter(self):
-        """Popunjava filter za vozove u tabu 'Vozovi'."""
-        for i in reversed(range(self.voz_filter_layout.count())):
-            item = self.voz_filter_layout.itemAt(i)
-            if item and item.widget() != self.all_vozovi_cb:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                    
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT broj_voza FROM vozovi ORDER BY broj_voza")
-        brojevi = [str(row[0]) for row in cursor.fetchall()]
-        conn.close()
-        
-        for b in brojevi:
-            cb = QCheckBox(b)
-            cb.setChecked(True)
-            cb.stateChanged.connect(
-                lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                    state, checkbox, self.all_vozovi_cb, lambda: self.ucitaj_podatke(sort_column=None, sort_order=None)
-                )
-            )
-            self.voz_filter_layout.addWidget(cb)
-
-    def populate_sekcije_filter(self):
-        """Popunjava filter za sekcije u tabu 'Vozovi'."""
-        for i in reversed(range(self.sekcije_filter_layout.count())):
-            item = self.sekcije_filter_layout.itemAt(i)
-            if item and item.widget() != self.all_sekcije_cb:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                    
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT sekcija FROM vozovi WHERE sekcija IS NOT NULL ORDER BY sekcija")
-        sekcije = [str(row[0]) for row in cursor.fetchall() if row[0] is not None]
-        conn.close()
-        
-        for s in sekcije:
-            cb = QCheckBox(s)
-            cb.setChecked(True)
-            cb.stateChanged.connect(
-                lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                    state, checkbox, self.all_sekcije_cb, lambda: self.ucitaj_podatke(sort_column=None, sort_order=None)
-                )
-            )
-            self.sekcije_filter_layout.addWidget(cb)
-
-    def populate_serije_filter(self):
-        """Popunjava filter za serije u tabu 'Vozovi'."""
-        if hasattr(self, 'serije_filter_layout'):
-            while self.serije_filter_layout.count() > 1:
-                item = self.serije_filter_layout.takeAt(1)
-                if item and item.widget():
-                    item.widget().deleteLater()
-                    
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT serija_vozila FROM vozovi WHERE serija_vozila IS NOT NULL ORDER BY serija_vozila")
-        serije = [str(row[0]) for row in cursor.fetchall() if row[0]]
-        conn.close()
-        
-        for s in serije:
-            cb = QCheckBox(s)
-            cb.setChecked(True)
-            cb.stateChanged.connect(
-                lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                    state, checkbox, self.all_serije_cb, lambda: self.ucitaj_podatke(sort_column=None, sort_order=None)
-                )
-            )
-            self.serije_filter_layout.addWidget(cb)
-
-    def populate_nazivi_filter(self):
-        """Popunjava filter za nazive turnusa u tabu 'Turnusi'."""
-        for i in reversed(range(self.naziv_filter_layout.count())):
-            item = self.naziv_filter_layout.itemAt(i)
-            if item and item.widget() != self.all_nazivi_cb:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                    
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT naziv FROM turnusi WHERE naziv IS NOT NULL ORDER BY naziv")
-        nazivi = [str(row[0]) for row in cursor.fetchall() if row[0] is not None]
-        conn.close()
-        
-        for n in nazivi:
-            cb = QCheckBox(n)
-            cb.setChecked(True)
-            cb.stateChanged.connect(
-                lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                    state, checkbox, self.all_nazivi_cb, lambda: self.ucitaj_turnuse(sort_column=None, sort_order=None)
-                )
-            )
-            self.naziv_filter_layout.addWidget(cb)
-
-    def populate_sekcije_turnusi_filter(self):
-        """Popunjava filter za sekcije u tabu 'Turnusi'."""
-        for i in reversed(range(self.sekcije_turnusi_filter_layout.count())):
-            item = self.sekcije_turnusi_filter_layout.itemAt(i)
-            if item and item.widget() != self.all_sekcije_turnusi_cb:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                    
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT sekcija FROM turnusi WHERE sekcija IS NOT NULL ORDER BY sekcija")
-        sekcije = [str(row[0]) for row in cursor.fetchall() if row[0] is not None]
-        conn.close()
-        
-        for s in sekcije:
-            cb = QCheckBox(s)
-            cb.setChecked(True)
-            cb.stateChanged.connect(
-                lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                    state, checkbox, self.all_sekcije_turnusi_cb, lambda: self.ucitaj_turnuse(sort_column=None, sort_order=None)
-                )
-            )
-            self.sekcije_turnusi_filter_layout.addWidget(cb)
-
-    def populate_serije_vv_filter(self):
-        """Popunjava filter za serije VV u tabu 'Turnusi'."""
-        if hasattr(self, 'serije_vv_filter_layout'):
-            while self.serije_vv_filter_layout.count() > 1:
-                item = self.serije_vv_filter_layout.takeAt(1)
-                if item and item.widget():
-                    item.widget().deleteLater()
-                    
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT serija_vv FROM turnusi WHERE serija_vv IS NOT NULL ORDER BY serija_vv")
-        serije = [str(row[0]) for row in cursor.fetchall() if row[0]]
-        conn.close()
-        
-        for s in serije:
-            cb = QCheckBox(s)
-            cb.setChecked(True)
-            cb.stateChanged.connect(
-                lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                    state, checkbox, self.all_serije_vv_cb, lambda: self.ucitaj_turnuse(sort_column=None, sort_order=None)
-                )
-            )
-            self.serije_vv_filter_layout.addWidget(cb)
-
-    def populate_grafik_filter(self):
-        """Popunjava sve filtere u tabu 'Grafik'."""
-        # --- Popuni filter po turnusima ---
-        if hasattr(self, 'grafik_filter_layout'):
-            while self.grafik_filter_layout.count() > 1:
-                item = self.grafik_filter_layout.takeAt(1)
-                if item and item.widget():
-                    item.widget().deleteLater()
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, naziv, sekcija, serija_vv FROM turnusi ORDER BY naziv")
-            turnusi = cursor.fetchall()
-            conn.close()
-            for turnus in turnusi:
-                cb = QCheckBox(f"{turnus[1]}")
-                cb.setChecked(True)
-                cb.turnus_id = turnus[0]
-                cb.sekcija = turnus[2] or ""
-                cb.serija_vv = turnus[3] or ""
-                cb.stateChanged.connect(
-                    lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                        state, checkbox, self.all_turnusi_cb, self.crtaj_grafik
-                    )
-                )
-                self.grafik_filter_layout.addWidget(cb)
-                
-        # --- Popuni filter po sekcijama ---
-        if hasattr(self, 'sekcije_grafik_layout'):
-            while self.sekcije_grafik_layout.count() > 1:
-                item = self.sekcije_grafik_layout.takeAt(1)
-                if item and item.widget():
-                    item.widget().deleteLater()
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT sekcija FROM turnusi WHERE sekcija IS NOT NULL ORDER BY sekcija")
-            sekcije = [row[0] for row in cursor.fetchall() if row[0]]
-            conn.close()
-            for s in sekcije:
-                cb = QCheckBox(s)
-                cb.setChecked(True)
-                cb.stateChanged.connect(
-                    lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                        state, checkbox, self.all_sekcije_grafik_cb, self.filter_turnuse_po_sekciji
-                    )
-                )
-                self.sekcije_grafik_layout.addWidget(cb)
-                
-        # --- Popuni filter po seriji VV ---
-        if hasattr(self, 'serije_vv_grafik_layout'):
-            while self.serije_vv_grafik_layout.count() > 1:
-                item = self.serije_vv_grafik_layout.takeAt(1)
-                if item and item.widget():
-                    item.widget().deleteLater()
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT serija_vv FROM turnusi WHERE serija_vv IS NOT NULL ORDER BY serija_vv")
-            serije_vv = [row[0] for row in cursor.fetchall() if row[0]]
-            conn.close()
-            for s in serije_vv:
-                cb = QCheckBox(s)
-                cb.setChecked(True)
-                cb.stateChanged.connect(
-                    lambda state, checkbox=cb: self.on_individual_checkbox_changed(
-                        state, checkbox, self.all_serije_vv_grafik_cb, self.filter_turnuse_po_seriji_vv
-                    )
-                )
-                self.serije_vv_grafik_layout.addWidget(cb)
-
-    def handle_vozovi_header_click(self, logical_index):
-        """Rukuje klikom na zaglavlje kolone u tabeli vozova."""
-        # Dobij prethodno zapamćene informacije o sortiranju za vozove
-        last_sorted_section = self.vozi_sort_info['column']
-        last_order = self.vozi_sort_info['order']
-
-        # Ako je kliknuta ista kolona, obrni smer, inače koristi ASCENDING
-        if last_sorted_section == logical_index:
-            # Istа kolona - promeni smer
-            new_order = Qt.SortOrder.DescendingOrder if last_order == Qt.SortOrder.AscendingOrder else Qt.SortOrder.AscendingOrder
-        else:
-            # Druga kolona - default je Ascending
-            new_order = Qt.SortOrder.AscendingOrder
-            
-        # Ažuriraj zapamćene informacije
-        self.vozi_sort_info['column'] = logical_index
-        self.vozi_sort_info['order'] = new_order
-            
-        # Pozovi ucitaj_podatke sa informacijama o sortiranju
-        self.ucitaj_podatke(sort_column=logical_index, sort_order=new_order)
-
-    def ucitaj_podatke(self, sort_column=None, sort_order=None):
-        """Učitava podatke o vozovima u tabelu, opciono sortirane."""
-        if not hasattr(self, 'tabela') or self.tabela is None:
-            return
-        self.tabela.setRowCount(0)
-        if (not hasattr(self, 'voz_filter_layout') or self.voz_filter_layout is None or
-                not hasattr(self, 'sekcije_filter_layout') or self.sekcije_filter_layout is None):
-            return
-            
-        selektovani_vozovi = []
-        try:
-            for i in range(1, self.voz_filter_layout.count()):
-                widget = self.voz_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox) and widget.isChecked():
-                    selektovani_vozovi.append(widget.text())
-        except RuntimeError:
-            return
-            
-        selektovane_sekcije = []
-        try:
-            for i in range(1, self.sekcije_filter_layout.count()):
-                widget = self.sekcije_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox) and widget.isChecked():
-                    selektovane_sekcije.append(widget.text())
-        except RuntimeError:
-            return
-            
-        # Selektovane serije
-        selektovane_serije = []
-        try:
-            for i in range(1, self.serije_filter_layout.count()):
-                widget = self.serije_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox) and widget.isChecked():
-                    selektovane_serije.append(widget.text())
-        except RuntimeError:
-            return
-            
-        if not self.all_vozovi_cb.isChecked() and not selektovani_vozovi:
-            return
-        if not self.all_sekcije_cb.isChecked() and not selektovane_sekcije:
-            return
-        if not self.all_serije_cb.isChecked() and not selektovane_serije:
-             return
-            
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Pripremi ORDER BY deo SQL upita
-        order_by_clause = ""
-        if sort_column is not None and sort_order is not None:
-            # Mapiraj logički indeks kolone na naziv kolone u bazi
-            column_map = {
-                0: "broj_voza",
-                1: "pocetna_stanica",
-                2: "krajnja_stanica",
-                3: "sat_polaska, minut_polaska", # Polazak kao kombinacija
-                4: "sat_dolaska, minut_dolaska", # Dolazak kao kombinacija
-                5: "serija_vozila",
-                6: "status",
-                7: "sekcija"
-                # Kolone 8 (Uredi) i 9 (Obriši) nisu za sortiranje
-            }
-            db_column = column_map.get(sort_column)
-            if db_column:
-                order_direction = "ASC" if sort_order == Qt.SortOrder.AscendingOrder else "DESC"
-                order_by_clause = f" ORDER BY {db_column} {order_direction}"
-        
-        # Ako nije zadato sortiranje, koristi defaultno sortiranje koje je zapamćeno
-        if not order_by_clause:
-             default_col = self.vozi_sort_info['column']
-             default_order = self.vozi_sort_info['order']
-             column_map = {
-                0: "broj_voza",
-                1: "pocetna_stanica",
-                2: "krajnja_stanica",
-                3: "sat_polaska, minut_polaska",
-                4: "sat_dolaska, minut_dolaska",
-                5: "serija_vozila",
-                6: "status",
-                7: "sekcija"
-             }
-             db_column = column_map.get(default_col, "broj_voza")
-             order_direction = "ASC" if default_order == Qt.SortOrder.AscendingOrder else "DESC"
-             order_by_clause = f" ORDER BY {db_column} {order_direction}"
-        
-        # Izvrši upit sa ORDER BY
-        sql_query = f"SELECT * FROM vozovi{order_by_clause}"
-        cursor.execute(sql_query)
-        svi_podaci = cursor.fetchall()
-        conn.close()
-        
-        for red in svi_podaci:
-            if len(red) < 10:
-                continue
-            broj = str(red[0])
-            sekcija_val = str(red[8]) if red[8] is not None else ""
-            serija_val = str(red[9]) if red[9] is not None else ""
-            status_val = str(red[7]) if red[7] is not None else "R"
-            
-            voz_odabran = self.all_vozovi_cb.isChecked() or (broj in selektovani_vozovi)
-            sekcija_odabrana = self.all_sekcije_cb.isChecked() or (not selektovane_sekcije) or (sekcija_val in selektovane_sekcije)
-            serija_odabrana = self.all_serije_cb.isChecked() or (not selektovane_serije) or (serija_val in selektovane_serije)
-            
-            if voz_odabran and sekcija_odabrana and serija_odabrana:
-                row_position = self.tabela.rowCount()
-                self.tabela.insertRow(row_position)
-                
-                sat_p = red[3] if red[3] is not None else 0
-                min_p = red[4] if red[4] is not None else 0
-                sat_d = red[5] if red[5] is not None else 0
-                min_d = red[6] if red[6] is not None else 0
-                podaci = [
-                    broj, red[1] or "", red[2] or "",
-                    f"{sat_p:02}:{min_p:02}", f"{sat_d:02}:{min_d:02}",
-                    serija_val, status_val, sekcija_val
-                ]
-                for col, vrednost in enumerate(podaci):
-                    item = QTableWidgetItem(str(vrednost))
-                    item.setFlags(item.flags() ^ Qt.ItemFlag.ItemIsEditable)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.tabela.setItem(row_position, col, item)
-                    
-                btn_uredi = QPushButton("Uredi")
-                btn_uredi.clicked.connect(lambda _, r=red: self.uredi_voz(r))
-                self.tabela.setCellWidget(row_position, 8, btn_uredi)
-                btn_obrisi = QPushButton("Obriši")
-                btn_obrisi.clicked.connect(lambda _, b=broj: self.obrisi_voz(b))
-                self.tabela.setCellWidget(row_position, 9, btn_obrisi)
-        
-        # Uvek postavi indikator sortiranja na zaglavlju na osnovu trenutno aktivnog sortiranja
-        # Koristi informacije iz self.vozi_sort_info ako nisu eksplicitno prosleđene
-        if sort_column is not None and sort_order is not None:
-            self.tabela.horizontalHeader().setSortIndicator(sort_column, sort_order)
-        else:
-             col = self.vozi_sort_info['column']
-             order = self.vozi_sort_info['order']
-             self.tabela.horizontalHeader().setSortIndicator(col, order)
-
-    def handle_turnusi_header_click(self, logical_index):
-        """Rukuje klikom na zaglavlje kolone u tabeli turnusa."""
-        # Dobij prethodno zapamćene informacije o sortiranju za turnuse
-        last_sorted_section = self.turnusi_sort_info['column']
-        last_order = self.turnusi_sort_info['order']
-
-        # Ako je kliknuta ista kolona, obrni smer, inače koristi ASCENDING
-        if last_sorted_section == logical_index:
-            # Istа kolona - promeni smer
-            new_order = Qt.SortOrder.DescendingOrder if last_order == Qt.SortOrder.AscendingOrder else Qt.SortOrder.AscendingOrder
-        else:
-            # Druga kolona - default je Ascending
-            new_order = Qt.SortOrder.AscendingOrder
-            
-        # Ažuriraj zapamćene informacije
-        self.turnusi_sort_info['column'] = logical_index
-        self.turnusi_sort_info['order'] = new_order
-            
-        # Pozovi ucitaj_turnuse sa informacijama o sortiranju
-        self.ucitaj_turnuse(sort_column=logical_index, sort_order=new_order)
-
-    def ucitaj_turnuse(self, sort_column=None, sort_order=None):
-        """Učitava podatke o turnusima u tabelu, opciono sortirane."""
-        if not hasattr(self, 'tabela_turnusa') or self.tabela_turnusa is None:
-            return
-        self.tabela_turnusa.setRowCount(0)
-        if (not hasattr(self, 'naziv_filter_layout') or self.naziv_filter_layout is None or
-                not hasattr(self, 'sekcije_turnusi_filter_layout') or self.sekcije_turnusi_filter_layout is None or
-                not hasattr(self, 'serije_vv_filter_layout') or self.serije_vv_filter_layout is None):
-            return
-            
-        selektovani_nazivi = []
-        try:
-            for i in range(1, self.naziv_filter_layout.count()):
-                widget = self.naziv_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox) and widget.isChecked():
-                    selektovani_nazivi.append(widget.text())
-        except RuntimeError:
-            return
-            
-        selektovane_sekcije = []
-        try:
-            for i in range(1, self.sekcije_turnusi_filter_layout.count()):
-                widget = self.sekcije_turnusi_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox) and widget.isChecked():
-                    selektovane_sekcije.append(widget.text())
-        except RuntimeError:
-            return
-            
-        selektovane_serije_vv = []
-        try:
-            for i in range(1, self.serije_vv_filter_layout.count()):
-                widget = self.serije_vv_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox) and widget.isChecked():
-                    selektovane_serije_vv.append(widget.text())
-        except RuntimeError:
-            return
-            
-        if not self.all_nazivi_cb.isChecked() and not selektovani_nazivi:
-            return
-        if not self.all_sekcije_turnusi_cb.isChecked() and not selektovane_sekcije:
-            return
-        if not self.all_serije_vv_cb.isChecked() and not selektovane_serije_vv:
-            return
-            
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Pripremi ORDER BY deo SQL upita
-        order_by_clause = ""
-        if sort_column is not None and sort_order is not None:
-            # Mapiraj logički indeks kolone na naziv kolone u bazi
-            column_map = {
-                0: "naziv",
-                1: "serija_vv",
-                2: "vozovi_placeholder", # Ova kolona je složena, možda nije idealna za sortiranje preko SQL
-                3: "sekcija"
-                # Kolona 4 (Akcije) nije za sortiranje
-            }
-            db_column = column_map.get(sort_column)
-            if db_column and db_column != "vozovi_placeholder": # Za sada preskoči sortiranje po vozovima
-                order_direction = "ASC" if sort_order == Qt.SortOrder.AscendingOrder else "DESC"
-                order_by_clause = f" ORDER BY {db_column} {order_direction}"
-        
-        # Ako nije zadato sortiranje, koristi defaultno sortiranje koje je zapamćeno
-        if not order_by_clause:
-             default_col = self.turnusi_sort_info['column']
-             default_order = self.turnusi_sort_info['order']
-             column_map = {
-                0: "naziv",
-                1: "serija_vv",
-                3: "sekcija"
-             }
-             db_column = column_map.get(default_col, "naziv")
-             order_direction = "ASC" if default_order == Qt.SortOrder.AscendingOrder else "DESC"
-             order_by_clause = f" ORDER BY {db_column} {order_direction}"
-        
-        # Izvrši upit sa ORDER BY
-        sql_query = f"SELECT id, naziv, serija_vv, sekcija FROM turnusi{order_by_clause}"
-        cursor.execute(sql_query)
-        turnusi = cursor.fetchall()
-        conn.close()
-        
-        for turnus in turnusi:
-            naziv = str(turnus[1])
-            serija_vv_val = str(turnus[2]) if turnus[2] else ""
-            sekcija_val = str(turnus[3]) if turnus[3] else ""
-            
-            naziv_odabran = self.all_nazivi_cb.isChecked() or (naziv in selektovani_nazivi)
-            sekcija_odabrana = self.all_sekcije_turnusi_cb.isChecked() or (not selektovane_sekcije) or (sekcija_val in selektovane_sekcije)
-            serija_vv_odabrana = self.all_serije_vv_cb.isChecked() or (not selektovane_serije_vv) or (serija_vv_val in selektovane_serije_vv)
-            
-            if naziv_odabran and sekcija_odabrana and serija_vv_odabrana:
-                conn_inner = sqlite3.connect(DB_PATH)
-                cursor_inner = conn_inner.cursor()
-                cursor_inner.execute("""SELECT v.broj_voza FROM turnus_vozovi tv JOIN vozovi v ON tv.broj_voza = v.broj_voza
-                                        WHERE tv.turnus_id = ? ORDER BY tv.redosled""", (turnus[0],))
-                vozovi_str = ", ".join([v[0] for v in cursor_inner.fetchall()])
-                conn_inner.close()
-                
-                r = self.tabela_turnusa.rowCount()
-                self.tabela_turnusa.insertRow(r)
-                self.tabela_turnusa.setItem(r, 0, QTableWidgetItem(naziv))
-                self.tabela_turnusa.setItem(r, 1, QTableWidgetItem(serija_vv_val))
-                self.tabela_turnusa.setItem(r, 2, QTableWidgetItem(vozovi_str))
-                self.tabela_turnusa.setItem(r, 3, QTableWidgetItem(sekcija_val))
-                
-                akcije = QWidget()
-                akcije_layout = QHBoxLayout(akcije)
-                akcije_layout.setContentsMargins(0, 0, 0, 0)
-                btn_u = QPushButton("Uredi")
-                btn_u.clicked.connect(lambda _, t=turnus: self.uredi_turnus(t))
-                btn_o = QPushButton("Obriši")
-                btn_o.clicked.connect(lambda _, t=turnus: self.obrisi_turnus(t))
-                btn_g = QPushButton("Grafik")
-                btn_g.clicked.connect(lambda _, t=turnus: self.prikazi_grafik_turnusa(t))
-                akcije_layout.addWidget(btn_u)
-                akcije_layout.addWidget(btn_o)
-                akcije_layout.addWidget(btn_g)
-                self.tabela_turnusa.setCellWidget(r, 4, akcije)
-        
-        # Uvek postavi indikator sortiranja na zaglavlju na osnovu trenutno aktivnog sortiranja
-        # Koristi informacije iz self.turnusi_sort_info ako nisu eksplicitno prosleđene
-        if sort_column is not None and sort_order is not None and column_map.get(sort_column) != "vozovi_placeholder":
-            self.tabela_turnusa.horizontalHeader().setSortIndicator(sort_column, sort_order)
-        else:
-             col = self.turnusi_sort_info['column']
-             order = self.turnusi_sort_info['order']
-             self.tabela_turnusa.horizontalHeader().setSortIndicator(col, order)
-
-    # --- OPERACIJE SA VOZOVIMA ---
-
-    def uredi_voz(self, podaci):
-        """Postavlja podatke vozova u formu za uređivanje."""
-        self.broj_voza_input.setText(str(podaci[0]))
-        self.pocetna_input.setText(str(podaci[1]))
-        self.krajnja_input.setText(str(podaci[2]))
-        self.sat_p_input.setText(str(podaci[3]))
-        self.minut_p_input.setText(str(podaci[4]))
-        self.sat_d_input.setText(str(podaci[5]))
-        self.minut_d_input.setText(str(podaci[6]))
-        self.serija_input.setText(str(podaci[9] or ""))
-        self.status_input.setText(str(podaci[7]))
-        self.sekcija_input.setText(str(podaci[8] or ""))
-        self.trenutni_broj_za_izmenu = str(podaci[0])
-        
-        self.btn_dodaj.setVisible(False)
-        self.btn_azuriraj.setVisible(True)
-        self.btn_odustani.setVisible(True)
-        print(f"REŽIM IZMENE: Uređujem voz {podaci[0]}")
-
-    def azuriraj_voz(self):
-        """Pokreće proces ažuriranja vozova."""
-        self.dodaj_voz()
-
-    def odustani_od_uredjivanja(self):
-        """Odustaje od uređivanja vozova i vraća formu u početno stanje."""
-        self.ocisti_formu()
-        self.btn_dodaj.setVisible(True)
-        self.btn_azuriraj.setVisible(False)
-        self.btn_odustani.setVisible(False)
-        self.trenutni_broj_za_izmenu = None
-
-    def dodaj_voz(self):
-        """Dodaje novi voz ili ažurira postojeći."""
-        try:
-            broj = self.broj_voza_input.text().strip()
-            pocetna = self.pocetna_input.text().strip()
-            krajnja = self.krajnja_input.text().strip()
-            sat_p = self.sat_p_input.text().strip()
-            min_p = self.minut_p_input.text().strip()
-            sat_d = self.sat_d_input.text().strip()
-            min_d = self.minut_d_input.text().strip()
-            serija = self.serija_input.text().strip() or None
-            status = (self.status_input.text().strip() or 'R').upper()
-            sekcija = self.sekcija_input.text().strip()
-            
-            obavezna_polja = [
-                ("Broj voza", broj), ("Početna stanica", pocetna), ("Krajnja stanica", krajnja),
-                ("Sat polaska", sat_p), ("Minut polaska", min_p),
-                ("Sat dolaska", sat_d), ("Minut dolaska", min_d),
-                ("Sekcija", sekcija),
-            ]
-            
-            nedostajuci = []
-            for naziv, vrednost in obavezna_polja:
-                if not vrednost:
-                    nedostajuci.append(naziv)
-            if nedostajuci:
-                QMessageBox.critical(self, "Greška u unosu", f"Neophodno je popuniti sledeća polja:\n- " + "\n- ".join(nedostajuci))
-                return
-                
-            if not broj.isalnum() or len(broj) < 3 or len(broj) > 6:
-                raise ValueError("Broj voza mora biti alfanumerički (3-6 karaktera).")
-            if not (2 <= len(pocetna) <= 3) or not pocetna.isalpha():
-                raise ValueError("Početna stanica: 2–3 slova.")
-            if not (2 <= len(krajnja) <= 3) or not krajnja.isalpha():
-                raise ValueError("Krajnja stanica: 2–3 slova.")
-            if not sat_p.isdigit() or not (0 <= int(sat_p) <= 23):
-                raise ValueError("Sat polaska mora biti broj između 0 i 23.")
-            if not min_p.isdigit() or not (0 <= int(min_p) <= 59):
-                raise ValueError("Minut polaska mora biti broj između 0 i 59.")
-            if not sat_d.isdigit() or not (0 <= int(sat_d) <= 23):
-                raise ValueError("Sat dolaska mora biti broj između 0 i 23.")
-            if not min_d.isdigit() or not (0 <= int(min_d) <= 59):
-                raise ValueError("Minut dolaska mora biti broj između 0 i 59.")
-                
-            sat_p = int(sat_p); min_p = int(min_p); sat_d = int(sat_d); min_d = int(min_d)
-            
-            conn = None
-            try:
-                conn = sqlite3.connect(DB_PATH)
-                cursor = conn.cursor()
-                if self.trenutni_broj_za_izmenu is not None:
-                    cursor.execute('''
-                        UPDATE vozovi SET 
-                            broj_voza = ?, pocetna_stanica = ?, krajnja_stanica = ?,
-                            sat_polaska = ?, minut_polaska = ?, sat_dolaska = ?, minut_dolaska = ?,
-                            serija_vozila = ?, status = ?, sekcija = ?
-                        WHERE broj_voza = ?
-                    ''', (broj, pocetna, krajnja, sat_p, min_p, sat_d, min_d, serija, status, sekcija, self.trenutni_broj_za_izmenu))
-                    poruka = f"Voz {broj} uspešno ažuriran!"
-                else:
-                    try:
-                        cursor.execute('''
-                            INSERT INTO vozovi (broj_voza, pocetna_stanica, krajnja_stanica,
-                                sat_polaska, minut_polaska, sat_dolaska, minut_dolaska,
-                                serija_vozila, status, sekcija)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (broj, pocetna, krajnja, sat_p, min_p, sat_d, min_d, serija, status, sekcija))
-                        poruka = f"Voz {broj} uspešno dodat!"
-                    except sqlite3.IntegrityError:
-                        QMessageBox.critical(self, "Greška", f"Voz broj {broj} već postoji!")
-                        return
-                conn.commit()
-            finally:
-                if conn:
-                    conn.close()
-                    
-            # OSVEŽI SVE FILTERE I TABELU
-            self.populate_filters_and_load_data()
-            QMessageBox.information(self, "Uspeh", poruka)
-            self.ocisti_formu()
-            
-            self.btn_dodaj.setVisible(True)
-            self.btn_azuriraj.setVisible(False)
-            self.btn_odustani.setVisible(False)
-            self.trenutni_broj_za_izmenu = None
-            
-        except ValueError as e:
-            QMessageBox.critical(self, "Greška u unosu", str(e))
-        except Exception as e:
-            QMessageBox.critical(self, "Greška", f"Greška pri čuvanju: {e}")
-
-    def obrisi_voz(self, broj_voza):
-        """Briše voz iz baze."""
-        potvrda = QMessageBox.question(self, "Potvrda", f"Obriši voz {broj_voza}?")
-        if potvrda == QMessageBox.StandardButton.Yes:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM vozovi WHERE broj_voza = ?", (broj_voza,))
-            conn.commit()
-            conn.close()
-            
-            # OSVEŽI SVE FILTERE I TABELU
-            self.populate_filters_and_load_data()
-            self.ocisti_formu()
-            QMessageBox.information(self, "Obrađeno", f"Voz {broj_voza} obrisan.")
-
-    def ocisti_formu(self):
-        """Čisti sva input polja u formi za vozove."""
-        self.broj_voza_input.clear()
-        self.pocetna_input.clear()
-        self.krajnja_input.clear()
-        self.sat_p_input.clear()
-        self.minut_p_input.clear()
-        self.sat_d_input.clear()
-        self.minut_d_input.clear()
-        self.serija_input.clear()
-        self.status_input.clear()
-        self.sekcija_input.clear()
-
-    # --- OPERACIJE SA TURNUSIMA ---
-    def proveri_turnus(self):
-        """Proverava ispravnost unetih podataka za turnus."""
-        self.status_label.setText("")
-        self.status_label.setStyleSheet("padding: 10px; background-color: #f0f0f0; border-radius: 5px;")
-        
-        naziv = self.naziv_turnusa_input.text().strip()
-        serija_vv = self.serija_vv_input.text().strip()
-        vozovi_text = self.vozovi_input.text().strip()
-        sekcija = self.sekcija_voza_input.text().strip()
-        
-        # ✅ Provera da li su sva polja prazna
-        if not any([naziv, serija_vv, vozovi_text, sekcija]):
-            self.btn_proveri.setText("Sačuvaj ažuriran turnus")
-            try:
-                self.btn_proveri.clicked.disconnect()
-            except TypeError:
-                pass
-            self.btn_odustani_turnus.setVisible(True)
-            self.status_label.setText("Polja su prazna. Kliknite 'Odustani od uređivanja' za izlaz iz režima uređivanja.")
-            self.status_label.setStyleSheet("padding: 10px; background-color: #ffeb99; border-radius: 5px;")
-            return
-            
-        obavezna_polja = [
-            ("Naziv turnusa", naziv),
-            ("Vozovi u turnusu", vozovi_text),
-            ("Sekcija za vuču vozova", sekcija),
-            ("Serija VV", serija_vv)
-        ]
-        
-        nedostajuci = []
-        for naziv_p, vrednost in obavezna_polja:
-            if not vrednost:
-                nedostajuci.append(naziv_p)
-        if nedostajuci:
-            poruka = "Neophodno je popuniti sledeća polja:\n- " + "\n- ".join(nedostajuci)
-            self.status_label.setText(poruka)
-            self.status_label.setStyleSheet("padding: 10px; background-color: #ffcccc; border-radius: 5px;")
-            self.btn_odustani_turnus.setVisible(True)
-            return
-            
-        vozovi = [v.strip() for v in vozovi_text.split(",") if v.strip()]
-        if not vozovi:
-            self.status_label.setText("Greška: Morate uneti bar jedan voz!")
-            self.status_label.setStyleSheet("padding: 10px; background-color: #ffcccc; border-radius: 5px;")
-            self.btn_odustani_turnus.setVisible(True)
-            return
-            
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        vozovi_info = {}
-        for broj in vozovi:
-            cursor.execute("""
-                SELECT pocetna_stanica, krajnja_stanica, sat_polaska, minut_polaska, sat_dolaska, minut_dolaska, serija_vozila
-                FROM vozovi WHERE broj_voza = ?
-            """, (broj,))
-            info = cursor.fetchone()
-            if info:
-                vozovi_info[broj] = {
-                    "pocetna": info[0],
-                    "krajnja": info[1],
-                    "polazak": (info[2], info[3]),
-                    "dolazak": (info[4], info[5]),
-                    "serija_vozila": info[6] or "N/A"
-                }
-            else:
-                self.status_label.setText(f"Greška: Voz {broj} ne postoji u bazi!")
-                self.status_label.setStyleSheet("padding: 10px; background-color: #ffcccc; border-radius: 5px;")
-                conn.close()
-                self.btn_odustani_turnus.setVisible(True)
-                return
-                
-        greske_serija = []
-        for broj, info in vozovi_info.items():
-            serija_vozila = info["serija_vozila"]
-            if serija_vozila != serija_vv:
-                greske_serija.append(
-                    f"Voz {broj} pripada seriji {serija_vozila}, a turnus je za seriju {serija_vv}!"
-                )
-        if greske_serija:
-            poruka = "Greške u serijama:\n" + "\n".join(greske_serija)
-            self.status_label.setText(poruka)
-            self.status_label.setStyleSheet("padding: 10px; background-color: #ffcccc; border-radius: 5px;")
-            conn.close()
-            self.btn_odustani_turnus.setVisible(True)
-            return
-            
-        greske = []
-        # ✅ PROVERA: Redosled i preklapanje vremena (susedni vožnje)
-        for i in range(len(vozovi) - 1):
-            broj_trenutni = vozovi[i]
-            broj_sledeci = vozovi[i + 1]
-            if broj_trenutni not in vozovi_info or broj_sledeci not in vozovi_info:
-                continue
-            voz_trenutni = vozovi_info[broj_trenutni]
-            voz_sledeci = vozovi_info[broj_sledeci]
-            
-            if voz_trenutni["krajnja"] != voz_sledeci["pocetna"]:
-                greske.append(
-                    f"Voz {broj_trenutni} i {broj_sledeci}: Stanica {voz_trenutni['krajnja']} ≠ {voz_sledeci['pocetna']}")
-
-            # Proveri vreme - konvertuj u minute od ponoći za trenutni dan
-            dolazak_trenutni_m = voz_trenutni["dolazak"][0] * 60 + voz_trenutni["dolazak"][1]
-            polazak_sledeci_m = voz_sledeci["polazak"][0] * 60 + voz_sledeci["polazak"][1]
-
-            # Provera da li je trenutni voz prelazni (dolazak < polazak)
-            sat_d_trenutni, min_d_trenutni = voz_trenutni["dolazak"]
-            sat_p_trenutni, min_p_trenutni = voz_trenutni["polazak"]
-            prelazni_trenutni = (sat_d_trenutni < sat_p_trenutni) or (sat_d_trenutni == sat_p_trenutni and min_d_trenutni < min_p_trenutni)
-
-            # Konverzija dolaska trenutnog voza u minute, uzimajući u obzir prelaz
-            if prelazni_trenutni:
-                 # Ako je prelazni, dolazak je u narednom danu
-                 dolazak_trenutni_m_corr = dolazak_trenutni_m + 24*60
-            else:
-                 dolazak_trenutni_m_corr = dolazak_trenutni_m
-
-            # Provera preklapanja: dolazak_trenutni (korigovan) >= polazak_sledeci
-            if dolazak_trenutni_m_corr >= polazak_sledeci_m:
-                greske.append(
-                    f"Voz {broj_trenutni} i {broj_sledeci}: Dolazak {voz_trenutni['dolazak'][0]:02d}:{voz_trenutni['dolazak'][1]:02d} ≥ Polazak {voz_sledeci['polazak'][0]:02d}:{voz_sledeci['polazak'][1]:02d} (preklapanje vremena u turnusu!)")
-
-        # ✅ PROVERA: Prelazni voz na kraju niza (SPECIFIČNA PROVERA)
-        if not greske and len(vozovi) > 1:
-            # Ako nema grešaka do sada i ima više od jednog voza, proveri specijalni slučaj
-            poslednji_voz_broj = vozovi[-1]
-            prvi_voz_broj = vozovi[0]
-            
-            if poslednji_voz_broj in vozovi_info and prvi_voz_broj in vozovi_info:
-                poslednji_info = vozovi_info[poslednji_voz_broj]
-                prvi_info = vozovi_info[prvi_voz_broj]
-                
-                # Proveri da li je poslednji voz prelazni
-                sat_d_poslednji, min_d_poslednji = poslednji_info["dolazak"]
-                sat_p_poslednji, min_p_poslednji = poslednji_info["polazak"]
-                prelazni_poslednji = (sat_d_poslednji < sat_p_poslednji) or (sat_d_poslednji == sat_p_poslednji and min_d_poslednji < min_p_poslednji)
-                
-                if prelazni_poslednji:
-                    # --- SPECIFIČNA LOGIKA ---
-                    # Ako je poslednji voz prelazni, proveri da li se njegov dolazak preklapa sa polaskom prvog voz u turnusu.
-                    # Preklapanje: dolazak_poslednjeg < polazak_prvog (kada se gledaju kao vremena u 24h ciklusu).
-                    # Npr: 3333 (dolazak 01:20), 4444 (polazak 01:01). 01:20 NIJE < 01:01 -> Nema preklapanja po ovoj logici.
-                    # Ali ako je 3333 (dolazak 01:01), 4444 (polazak 01:20). 01:01 < 01:20 -> Preklapanje.
-                    # Dakle, ako je dolazak_poslednjeg_voza < polazak_prvog_voza, onda se preklapaju.
-                    # Ovo je suprotno od onoga što si tražio u poslednjem primeru.
-                    # ---
-                    # Ponovo pročitaj zahtev:
-                    # "...da je vreme dolaska voza (3333) <= od vremena polaska voza (4444)"
-                    # 3333 dolazak 01:20, 4444 polazak 01:01.
-                    # 01:20 <= 01:01 -> FALSE.
-                    # To znači da nema preklapanja? Ne, to znači da 3333 stigne *posle* što 4444 počne.
-                    # Ako voz 3333 stigne u 01:20, a voz 4444 (koji ide odmah nakon) polazi u 01:01,
-                    # to znači da se voz 4444 mora čekati dok 3333 ne stigne. To je preklapanje.
-                    # Dakle, preklapanje je ako: dolazak_poslednjeg_voza >= polazak_prvog_voza.
-                    # U primeru: 01:20 >= 01:01 -> TRUE. Preklapanje!
-                    # U primeru: 3333 (01:01), 4444 (01:20). 01:01 >= 01:20 -> FALSE. Nema preklapanja.
-                    # Ovo deluje tačno.
-                    # ---
-                    dolazak_poslednji_min = sat_d_poslednji * 60 + min_d_poslednji
-                    polazak_prvi_min = prvi_info["polazak"][0] * 60 + prvi_info["polazak"][1]
-                    
-                    if dolazak_poslednji_min >= polazak_prvi_min:
-                         # Preklapanje: Dolazak poslednjeg voz >= Polazak prvog voz
-                         greske.append(
-                             f"Prelazni voz {poslednji_voz_broj} na kraju turnusa: Dolazak {sat_d_poslednji:02d}:{min_d_poslednji:02d} ≥ Polazak {prvi_voz_broj} {prvi_info['polazak'][0]:02d}:{prvi_info['polazak'][1]:02d} (preklapanje između poslednjeg i prvog voza u turnusu!)")
-
-        # Ako ima grešaka (bilo iz susedne provere, bilo iz poslednji-prvi), prikaži ih
-        if greske:
-            poruka = "Greške u redosledu/preklapanju:\n" + "\n".join(greske)
-            self.status_label.setText(poruka)
-            self.status_label.setStyleSheet("padding: 10px; background-color: #ffcccc; border-radius: 5px;")
-            self.btn_odustani_turnus.setVisible(True)
-            conn.close()
-            return
-
-        # Ako nema grešaka → aktiviraj "Sačuvaj ažuriran turnus"
-        self.status_label.setText(f"Turnus '{naziv}' je ispravan! Možete ga sačuvati.")
-        self.status_label.setStyleSheet("padding: 10px; background-color: #ddffdd; border-radius: 5px;")
-        self.btn_proveri.setText("Sačuvaj ažuriran turnus")
-        try:
-            self.btn_proveri.clicked.disconnect()
-        except TypeError:
-            pass
-        self.btn_proveri.clicked.connect(self.sacuvaj_izmene_turnusa)
-        self.btn_odustani_turnus.setVisible(True)
-        conn.close()
-
-    def sacuvaj_izmene_turnusa(self):
-        """Čuva novi turnus ili ažurira postojeći."""
-        naziv = self.naziv_turnusa_input.text().strip()
-        serija_vv = self.serija_vv_input.text().strip()
-        vozovi_text = self.vozovi_input.text().strip()
-        sekcija = self.sekcija_voza_input.text().strip()
-        
-        if not naziv:
-            QMessageBox.critical(self, "Greška", "Naziv turnusa je obavezan!")
-            return
-            
-        vozovi = [v.strip() for v in vozovi_text.split(",") if v.strip()]
-        if not vozovi:
-            QMessageBox.critical(self, "Greška", "Morate uneti bar jedan voz!")
-            return
-            
-        conn = None
-        try:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            if self.trenutni_turnus_za_izmenu is not None:
-                cursor.execute("UPDATE turnusi SET naziv = ?, serija_vv = ?, sekcija = ? WHERE id = ?",
-                               (naziv, serija_vv, sekcija, self.trenutni_turnus_za_izmenu))
-                cursor.execute("DELETE FROM turnus_vozovi WHERE turnus_id = ?", (self.trenutni_turnus_za_izmenu,))
-                for redosled, broj_voza in enumerate(vozovi, 1):
-                    cursor.execute("""
-                        INSERT INTO turnus_vozovi (turnus_id, broj_voza, redosled)
-                        VALUES (?, ?, ?)
-                    """, (self.trenutni_turnus_za_izmenu, broj_voza, redosled))
-                poruka = f"Turnus '{naziv}' uspešno ažuriran!"
-            else:
-                cursor.execute("SELECT id FROM turnusi WHERE naziv = ?", (naziv,))
-                if cursor.fetchone():
-                    QMessageBox.critical(self, "Greška", f"Turnus '{naziv}' već postoji!")
-                    return
-                cursor.execute("INSERT INTO turnusi (naziv, serija_vv, sekcija) VALUES (?, ?, ?)",
-                               (naziv, serija_vv, sekcija))
-                cursor.execute("SELECT id FROM turnusi WHERE naziv = ?", (naziv,))
-                turnus_id = cursor.fetchone()[0]
-                for redosled, broj_voza in enumerate(vozovi, 1):
-                    cursor.execute("""
-                        INSERT INTO turnus_vozovi (turnus_id, broj_voza, redosled)
-                        VALUES (?, ?, ?)
-                    """, (turnus_id, broj_voza, redosled))
-                poruka = f"Turnus '{naziv}' uspešno dodat!"
-            conn.commit()
-            
-            # OSVEŽI SVE FILTERE I TABELU
-            self.populate_filters_and_load_data()
-            QMessageBox.information(self, "Uspeh", poruka)
-            
-            self.naziv_turnusa_input.clear()
-            self.serija_vv_input.clear()
-            self.vozovi_input.clear()
-            self.sekcija_voza_input.clear()
-            self.status_label.setText("")
-            self.btn_proveri.setText("Proveri turnus")
-            try:
-                self.btn_proveri.clicked.disconnect()
-            except TypeError:
-                pass
-            self.btn_proveri.clicked.connect(self.proveri_turnus)
-            self.btn_odustani_turnus.setVisible(False)
-            self.trenutni_turnus_za_izmenu = None
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Greška", f"Greška pri čuvanju: {e}")
-        finally:
-            if conn:
-                conn.close()
-
-    def odustani_od_uredjivanja_turnusa(self):
-        """Odustaje od uređivanja turnusa i vraća formu u početno stanje."""
-        self.naziv_turnusa_input.clear()
-        self.serija_vv_input.clear()
-        self.vozovi_input.clear()
-        self.sekcija_voza_input.clear()
-        self.status_label.setText("")
-        
-        try:
-            self.btn_proveri.clicked.disconnect()
-        except TypeError:
-            pass
-            
-        self.btn_proveri.setText("Proveri turnus")
-        self.btn_proveri.clicked.connect(self.proveri_turnus)
-        self.btn_odustani_turnus.setVisible(False)
-        self.trenutni_turnus_za_izmenu = None
-
-    def uredi_turnus(self, turnus):
-        """Postavlja podatke turnusa u formu za uređivanje."""
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT v.broj_voza
-            FROM turnus_vozovi tv
-            JOIN vozovi v ON tv.broj_voza = v.broj_voza
-            WHERE tv.turnus_id = ?
-            ORDER BY tv.redosled
-        """, (turnus[0],))
-        vozovi = [v[0] for v in cursor.fetchall()]
-        vozovi_str = ", ".join(vozovi)
-        
-        cursor.execute("SELECT sekcija, serija_vv FROM turnusi WHERE id = ?", (turnus[0],))
-        row = cursor.fetchone()
-        sekcija_val = row[0] or "" if row else ""
-        serija_vv_val = row[1] or "" if row else ""
-        conn.close()
-        
-        self.naziv_turnusa_input.setText(turnus[1])
-        self.serija_vv_input.setText(serija_vv_val)
-        self.vozovi_input.setText(vozovi_str)
-        self.sekcija_voza_input.setText(sekcija_val)
-        self.trenutni_turnus_za_izmenu = turnus[0]
-        
-        self.btn_proveri.setText("Proveri turnus")
-        try:
-            self.btn_proveri.clicked.disconnect()
-        except TypeError:
-            pass
-        self.btn_proveri.clicked.connect(self.proveri_turnus)
-        self.btn_odustani_turnus.setVisible(True)
-
-    def obrisi_turnus(self, turnus):
-        """Briše turnus iz baze."""
-        potvrda = QMessageBox.question(self, "Potvrda", f"Obriši turnus '{turnus[1]}'?")
-        if potvrda == QMessageBox.StandardButton.Yes:
-            conn = sqlite3.connect(DB_PATH)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM turnus_vozovi WHERE turnus_id = ?", (turnus[0],))
-            cursor.execute("DELETE FROM turnusi WHERE id = ?", (turnus[0],))
-            conn.commit()
-            conn.close()
-            QMessageBox.information(self, "Obrađeno", f"Turnus '{turnus[1]}' obrisan.")
-            # OSVEŽI SVE FILTERE I TABELU
-            self.populate_filters_and_load_data()
-
-    # --- GRAFIČKI PRIKAZ (GRAFIK) ---
-
-    def prikazi_grafik_turnusa(self, turnus):
-        """Prikazuje grafik za određeni turnus."""
-        self.tabs.setCurrentIndex(2)
-        
-        try:
-            for i in range(1, self.grafik_filter_layout.count()): 
-                widget = self.grafik_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox):
-                     widget.blockSignals(True)
-                     widget.setChecked(False)
-                     widget.blockSignals(False)
-        except Exception as e:
-            print(f"Greška prilikom resetovanja filtera u grafiku: {e}")
-            
-        turnus_id_trazeni = turnus[0]
-        try:
-            for i in range(1, self.grafik_filter_layout.count()):
-                widget = self.grafik_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox):
-                    if hasattr(widget, 'turnus_id') and widget.turnus_id == turnus_id_trazeni:
-                        widget.blockSignals(True)
-                        widget.setChecked(True)
-                        widget.blockSignals(False)
-                        break
-        except Exception as e:
-             print(f"Greška prilikom selektovanja turnusa u grafiku: {e}")
-             
-        self.crtaj_grafik()
-
-    def filter_turnuse_po_sekciji(self):
-        """Filtrira turnuse u grafiku po sekciji."""
-        selektovane_sekcije = []
-        for i in range(1, self.sekcije_grafik_layout.count()):
-            widget = self.sekcije_grafik_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                selektovane_sekcije.append(widget.text())
-                
-        if not selektovane_sekcije:
-            for i in range(1, self.grafik_filter_layout.count()):
-                widget = self.grafik_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox):
-                    widget.blockSignals(True)
-                    widget.setChecked(False)
-                    widget.blockSignals(False)
-            return
-            
-        for i in range(1, self.grafik_filter_layout.count()):
-            widget = self.grafik_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                should_check = widget.sekcija in selektovane_sekcije
-                widget.blockSignals(True)
-                widget.setChecked(should_check)
-                widget.blockSignals(False)
-
-    def filter_turnuse_po_seriji_vv(self):
-        """Filtrira turnuse u grafiku po seriji VV."""
-        selektovane_serije_vv = []
-        for i in range(1, self.serije_vv_grafik_layout.count()):
-            widget = self.serije_vv_grafik_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                selektovane_serije_vv.append(widget.text())
-                
-        if not selektovane_serije_vv:
-            for i in range(1, self.grafik_filter_layout.count()):
-                widget = self.grafik_filter_layout.itemAt(i).widget()
-                if isinstance(widget, QCheckBox):
-                    widget.blockSignals(True)
-                    widget.setChecked(False)
-                    widget.blockSignals(False)
-            return
-            
-        for i in range(1, self.grafik_filter_layout.count()):
-            widget = self.grafik_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox):
-                should_check = widget.serija_vv in selektovane_serije_vv
-                widget.blockSignals(True)
-                widget.setChecked(should_check)
-                widget.blockSignals(False)
-
-    def crtaj_grafik(self):
-        """Crtanje grafičkog prikaza turnusa."""
-        self.scene.clear()
-        
-        sirina_sata = 60
-        # ukupna_sirina = 24 * sirina_sata  # 1440 px  <-- OVA LINIJA SE MENJA
-        ukupna_sirina = 25 * sirina_sata  # 1500 px za 0-24
-        visina_turnusa = 120
-        y_pocetak = 50
-        
-        # --- 1. GLAVNA VREMENSKA OSA ---
-        # ✅ HORIZONTALNA LINIJA [0] od 00 do 24 (NE do 25)
-        # self.scene.addLine(0, 0, ukupna_sirina, 0, QPen(Qt.GlobalColor.black, 1.2)) # y=0  <-- OVA LINIJA SE MENJA
-        self.scene.addLine(0, 0, 24 * sirina_sata, 0, QPen(Qt.GlobalColor.black, 1.2)) # y=0, do 24h
-        # Sada crtamo vertikalne podelice i brojeve sati
-        for h in range(25): # <-- OVA LINIJA OSTAJE: range(25) za 0-24
-            x = h * sirina_sata
-            # Kratka vertikalna podelica: dužina ~9px (≈3mm)
-            self.scene.addLine(x, 0, x, 9, QPen(Qt.GlobalColor.black, 0.8))
-            # Broj sata iznad podelice
-            sat_tekst = f"{h:02d}" # <-- OVA LINIJA OSTAJE: prikazuje 00, 01, ..., 23, 24
-            text = self.scene.addText(sat_tekst)
-            text.setFont(QFont("Arial", 8))
-            text.setPos(x - 10, -30)
-            
-        selektovani_turnusi = []
-        for i in range(self.grafik_filter_layout.count()):
-            widget = self.grafik_filter_layout.itemAt(i).widget()
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                if hasattr(widget, 'turnus_id'):
-                    selektovani_turnusi.append(widget.turnus_id)
-        if not selektovani_turnusi:
-            return
-            
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        placeholders = ','.join('?' * len(selektovani_turnusi))
-        cursor.execute(f"""
-            SELECT tv.turnus_id, tv.redosled, tv.broj_voza, 
-                v.pocetna_stanica, v.krajnja_stanica,
-                v.sat_polaska, v.minut_polaska, v.sat_dolaska, v.minut_dolaska, v.status
-            FROM turnus_vozovi tv
-            JOIN vozovi v ON tv.broj_voza = v.broj_voza
-            WHERE tv.turnus_id IN ({placeholders})
-            ORDER BY tv.turnus_id, tv.redosled
-        """, selektovani_turnusi)
-        podaci = cursor.fetchall()
-        conn.close()
-        
-        y_trenutni = y_pocetak
-        trenutni_turnus_id = None
-        vozovi_u_turnusu = []
-        for red in podaci:
-            turnus_id, redosled, broj_voza, pocetna, krajnja, sat_p, min_p, sat_d, min_d, status = red
-            if turnus_id != trenutni_turnus_id and vozovi_u_turnusu:
-                self._crtaj_jedan_turnus(
-                    vozovi_u_turnusu, y_trenutni, sirina_sata, visina_turnusa
-                )
-                y_trenutni += visina_turnusa
-                vozovi_u_turnusu = []
-            trenutni_turnus_id = turnus_id
-            vozovi_u_turnusu.append({
-                'broj': broj_voza,
-                'pocetna': pocetna,
-                'krajnja': krajnja,
-                'sat_p': sat_p,
-                'min_p': min_p,
-                'sat_d': sat_d,
-                'min_d': min_d,
-                'status': status
-            })
-        if vozovi_u_turnusu:
-            self._crtaj_jedan_turnus(vozovi_u_turnusu, y_trenutni, sirina_sata, visina_turnusa)
-            
-        # Postavi granice scene - OVA LINIJA SE MENJA
-        # max_visina = y_trenutni + visina_turnusa + 50
-        # self.scene.setSceneRect(0, 0, ukupna_sirina, max_visina) # <-- OVA LINIJA SE MENJA
-        max_visina = y_trenutni + visina_turnusa + 50
-        self.scene.setSceneRect(0, 0, 25 * sirina_sata, max_visina) # <-- NOVA LINIJA
-
-    def _crtaj_jedan_turnus(self, vozovi, y, sirina_sata, visina_turnusa):
-        """Pomoćna funkcija za crtanje jednog turnusa u grafiku."""
-        gornja_linija_y = y + 30
-        donja_linija_y = gornja_linija_y + 20  # Razmak ~20px ≈ 5mm
-        tekst_gore_y = gornja_linija_y - 25
-        tekst_dole_y = donja_linija_y + 10
-        broj_vozila_x = 10
-        broj_vozila_y = gornja_linija_y - 5
-        # Broj vucnog vozila (1)
-        self.scene.addText("1").setPos(broj_vozila_x, broj_vozila_y)
-        # Gornja i donja linija puta turnusa - CRTAJ DO 24h (ne do 25h)
-        # self.scene.addLine(0, gornja_linija_y, 25 * sirina_sata, gornja_linija_y, QPen(Qt.GlobalColor.black, 1.2)) # <-- OVA LINIJA SE MENJA
-        # self.scene.addLine(0, donja_linija_y, 25 * sirina_sata, donja_linija_y, QPen(Qt.GlobalColor.black, 1.2)) # <-- OVA LINIJA SE MENJA
-        self.scene.addLine(0, gornja_linija_y, 24 * sirina_sata, gornja_linija_y, QPen(Qt.GlobalColor.black, 1.2))
-        self.scene.addLine(0, donja_linija_y, 24 * sirina_sata, donja_linija_y, QPen(Qt.GlobalColor.black, 1.2))
-        # Dodaj kratke vertikalne podelice na [3] i [5] za sve sate (0-24)
-        # ALI NE I ZA POSLEDNJU POZICIJU (24h) - NE, CRTAJ I ZA 24h KAO ŠTO SI ZADNJOM PRIMEDBOM OBJASNIO
-        for h in range(25): # <-- OVA LINIJA OSTAJE: range(25) za 0-24
-            x = h * sirina_sata
-            # Na [3]: 6px (3mm) ukupno, centrirano
-            self.scene.addLine(x, gornja_linija_y - 3, x, gornja_linija_y + 3, QPen(Qt.GlobalColor.black, 0.8))
-            # Na [5]: isto
-            self.scene.addLine(x, donja_linija_y - 3, x, donja_linija_y + 3, QPen(Qt.GlobalColor.black, 0.8))
-        # ... (ostatak funkcije ostaje isti, ali sada zna da je max x = 24*sirina_sata)
-        # Stilovi linija
-        pen = QPen(Qt.GlobalColor.black, 2)
-        style_map = {
-            'R': Qt.PenStyle.SolidLine,
-            'L': Qt.PenStyle.DashLine,
-            'RE': Qt.PenStyle.DotLine,
-            'S': Qt.PenStyle.DashDotLine,
-            'V': Qt.PenStyle.DashDotDotLine
-        }
-        for i, voz in enumerate(vozovi):
-            # Računanje x koordinata za polazak i dolazak
-            x_p = (voz['sat_p'] * 60 + voz['min_p']) / 60 * sirina_sata
-            x_d = (voz['sat_d'] * 60 + voz['min_d']) / 60 * sirina_sata
-
-            # Provera da li je prelazna vožnja
-            # Prelazna vožnja: sat_dolaska < sat_polaska, ili sat_dolaska == sat_polaska i min_dolaska < min_polaska
-            # (Ako su sati i minuti isti, nije prelazna, ali to je edge case)
-            # Sledeći uslov detektuje prelaz: sat_d < sat_p ili (sat_d == sat_p i min_d < min_p)
-            # Ako sat_d > sat_p, nije prelazna.
-            # Ako sat_d == sat_p, onda zavisi od minuta.
-            # Dakle, prelazna ako: (sat_d < sat_p) ili (sat_d == sat_p i min_d < min_p)
-            # Alternativno, ako pretvorimo u minute od 00:00, prelazna je ako je dolazak_m < polazak_m
-            # minute_polazak = voz['sat_p'] * 60 + voz['min_p']
-            # minute_dolazak = voz['sat_d'] * 60 + voz['min_d']
-            # prelazna = minute_dolazak < minute_polazak
-            # Ali može i ovako:
-            prelazna = (voz['sat_d'] < voz['sat_p']) or (voz['sat_d'] == voz['sat_p'] and voz['min_d'] < voz['min_p'])
-
-            if prelazna:
-                # Crtanje dva segmenta za prelaznu vožnju
-                # Prvi segment: od polaska do kraja dana (24:00 = 25*sirina_sata)
-                linija_y = gornja_linija_y + 10
-                pen.setStyle(style_map.get(voz['status'], Qt.PenStyle.SolidLine))
-                self.scene.addLine(x_p, linija_y, 24 * sirina_sata, linija_y, pen) # CRTAJ DO OZNAKE 24, NE DO KRAJA SCENE
-                #self.scene.addLine(x_p, linija_y, 25 * sirina_sata, linija_y, pen) # Do kraja scene
-
-                # Drugi segment: od početka dana (00:00 = 0) do dolaska
-                self.scene.addLine(0, linija_y, x_d, linija_y, pen) # Od početka scene
-
-                # Broj voza (podeljen između dva segmenta, možda centriran u "sredini prelaza")
-                # Centralna tačka je 24h (ili 25*sirina_sata - ali logički je 24h)
-                # Podelimo rastojanje između polaska i dolaska preko 24h granice
-                # x_sredina = (x_p + 25*sirina_sata + 0 + x_d) / 2 NE, to ne daje dobar centar
-                # Bolje je da nacrtamo tekst na oba mesta
-                # Tekst na prvom segmentu (desnoj strani)
-                text_broj_prvi = self.scene.addText(voz['broj'])
-                text_broj_prvi.setPos((x_p + 25 * sirina_sata) / 2 - 20, tekst_gore_y) # Približno centriran
-
-                # Tekst na drugom segmentu (levoj strani)
-                text_broj_drugi = self.scene.addText(voz['broj'])
-                text_broj_drugi.setPos((0 + x_d) / 2 - 20, tekst_gore_y) # Približno centriran
-
-                # Minuti (na mestima polaska i dolaska)
-                # Minut polaska (desna strana - pored x_p)
-                text_min_p = self.scene.addText(f"{voz['min_p']:02}")
-                text_min_p.setPos(x_p - 10, tekst_dole_y)
-                # Minut dolaska (leva strana - pored x_d)
-                text_min_d = self.scene.addText(f"{voz['min_d']:02}")
-                text_min_d.setPos(x_d - 10, tekst_dole_y)
-
-            else:
-                # Crtanje jednog segmenta za običnu vožnju
-                linija_y = gornja_linija_y + 10
-                pen.setStyle(style_map.get(voz['status'], Qt.PenStyle.SolidLine))
-                self.scene.addLine(x_p, linija_y, x_d, linija_y, pen)
-
-                # Broj voza (centrirano između x_p i x_d)
-                text_broj = self.scene.addText(voz['broj'])
-                text_broj.setPos((x_p + x_d) / 2 - 20, tekst_gore_y)
-
-                # Minuti (pored x_p i x_d)
-                text_min_p = self.scene.addText(f"{voz['min_p']:02}")
-                text_min_p.setPos(x_p - 10, tekst_dole_y)
-                text_min_d = self.scene.addText(f"{voz['min_d']:02}")
-                text_min_d.setPos(x_d - 10, tekst_dole_y)
-
-            # Stanice (samo za prvi i poslednji voz u turnusu)
-            if i == 0:  # Prvi voz
-                text_pocetna = self.scene.addText(voz['pocetna'])
-                text_pocetna.setPos(x_p - 20, tekst_gore_y - 15)
-            if i == len(vozovi) - 1:  # Poslednji voz
-                text_krajnja = self.scene.addText(voz['krajnja'])
-                text_krajnja.setPos(x_d - 20, tekst_gore_y - 15)
-            else:  # Srednji vozi (stanica dolaska trenutnog = stanica polaska sledećeg)
-                if i < len(vozovi) - 1:
-                    sledeci = vozovi[i + 1]
-                    # x_sledeci_p = (sledeci['sat_p'] * 60 + sledeci['min_p']) / 60 * sirina_sata # Ovo je isto kao x_d trenutnog voza?
-                    # Ne, to je sledeći voz. Znači, stanica se piše između trenutnog i sledećeg.
-                    # Dakle, između x_d trenutnog i x_p sledećeg. Ako su isti, nacrtaj na x_d.
-                    x_d_trenutni = x_d
-                    x_p_sledeci = (sledeci['sat_p'] * 60 + sledeci['min_p']) / 60 * sirina_sata
-                    x_sredina = (x_d_trenutni + x_p_sledeci) / 2
-                    text_srednja = self.scene.addText(voz['krajnja'])
-                    text_srednja.setPos(x_sredina - 20, tekst_gore_y - 15)
-                    # U slučaju prelazne vožnje, ovo može biti konfuzno. Ako je sledeći voz običan i počinje rano,
-                    # npr. trenutni 23:45 -> 00:15 (prelaz), sledeći 00:30 -> 05:00.
-                    # x_d_trenutnog (00:15) je mali broj, x_p_sledećeg (00:30) je mali broj.
-                    # x_sredina je tada između 00:15 i 00:30, što je ispravno na levoj strani.
-                    # Ako je sledeći voz takodje prelazni, npr. 00:30 -> 01:15, opet je x_p_sledećeg mali broj.
-                    # Dakle, logika ostaje ista.
-
-    def snimi_godinu_za_grafik(self):
-        """Čuva trenutno unetu godinu u atribut i fajl."""
-        godina = self.godina_input.text().strip()
-        self.godina_za_grafik = godina
-        # Čuvanje u tekstualni fajl
-        try:
-            with open("data/godina_grafik.txt", "w", encoding="utf-8") as f:
-                f.write(godina)
-        except Exception as e:
-            print(f"Greška pri čuvanju godine za grafik: {e}")
-
-    def ucitaj_godinu_za_grafik(self):
-        """Učitava prethodno sačuvanu godinu iz fajla."""
-        try:
-            with open("data/godina_grafik.txt", "r", encoding="utf-8") as f:
-                godina = f.read().strip()
-                self.godina_za_grafik = godina
-                # Ako je input već inicijalizovan (nakon što se kreira UI), ažuriraj ga
-                # Proveri da li atribut postoji pre nego što ga koristiš
-                if hasattr(self, 'godina_input') and self.godina_input:
-                    self.godina_input.setText(godina)
-        except FileNotFoundError:
-            # Ako fajl ne postoji, koristi prazan string ili podrazumevanu vrednost
-            self.godina_za_grafik = ""
-            # Isto, ažuriraj input samo ako postoji
-            if hasattr(self, 'godina_input') and self.godina_input:
-                self.godina_input.setText("")
-        except Exception as e:
-            print(f"Greška pri učitavanju godine za grafik: {e}")
-
-# --- POKRETANJE APLIKACIJE ---
-
-if __name__ == "__main__":
-    app = QApplication([])
-    window = SimpleApp()
-    window.show()
-    app.exec()
+import logging
+import os
+import sqlite3
+from collections import Counter
+from datetime import date
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTableView, QListView, QPushButton, QCheckBox, QFrame, QLabel, QLineEdit, QHeaderView,
+    QMessageBox, QTabWidget, QGraphicsView, QGraphicsScene, QSpinBox, QFileDialog, QProgressDialog
+)
+from PyQt6.QtGui import QPainter, QIntValidator
+from PyQt6.QtCore import Qt, QTimer, QSortFilterProxyModel, pyqtSignal
+
+from jezgro import (
+    Baza, DB_PATH, SIRINA_SATA, postojeci_vozovi, procitaj_km_vozova, procitaj_poslednje_preglede,
+    procitaj_potrebu_lokomotiva, procitaj_turnus, procitaj_vozila, procitaj_vozove, procitaj_turnuse,
+    procitaj_turnuse_za_filter, procitaj_turnuse_za_stampu, procitaj_vozove_po_broju, procitaj_vozove_za_grafik,
+    procitaj_vrednosti_filtera, proveri_obavezna_polja, proveri_turnus, proveri_voz, razdvoji_vozove, upisi_voz,
+    upisi_vozove_turnusa, vozovi_po_turnusu, y_turnusa
+)
+from jezgro.odrzavanje import PlanPregleda
+from jezgro.provera import IndeksTurnusa, IzvestajProvere
+from jezgro.sukobi import IndeksVoznji
+from grafik import GrafikPogled, GrafikScena, TurnusGraphicItem, KORAK_UVECANJA
+from stampa import (
+    StranaStampe, TURNUSA_PO_STRANI, broj_strana, izvezi_pdf, izvezi_pdf_paralelno, izvezi_svg, naslov_stampe,
+    procitaj_stranu
+)
+from modeli import DugmadDelegate, FilterModel, RedoviProxyModel, TurnusiModel, VozoviModel
+from ucitavac import Ucitavac
+
+log = logging.getLogger(__name__)
+
+# Koliko se čeka posle poslednje promene filtera pre osvežavanja (niz klikova = jedno osvežavanje)
+ODLAGANJE_FILTERA_MS = 150
+
+# Filteri tabova 'Vozovi' i 'Turnusi' čije vrednosti daje procitaj_vrednosti_filtera
+FILTERI_TABELA = ('vozovi', 'sekcije', 'serije', 'nazivi', 'sekcije_turnusi', 'serije_vv')
+
+# Najviše redova izveštaja "Proveri sve turnuse" u poruci (ostali se vide u tabeli)
+MAX_REDOVA_PROVERE = 30
+
+# --- POMOĆNE KLASE ---
+
+class UppercaseLineEdit(QLineEdit):
+    """Custom klasa za unos teksta koji se automatski konvertuje u velika slova."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.textChanged.connect(self.to_uppercase)
+
+    def to_uppercase(self):
+        self.blockSignals(True)
+        self.setText(self.text().upper())
+        self.blockSignals(False)
+
+class FilterPanel(QFrame):
+    """Panel filtera: naslov, pretraga, 'Označi sve' i lista vrednosti sa checkboxovima.
+
+    Vrednosti su u FilterModel-u (bez widgeta po vrednosti); polje za pretragu sužava
+    prikaz liste, a ne i izbor. Signal 'promenjeno' se šalje samo za promene korisnika.
+    """
+    promenjeno = pyqtSignal()
+
+    def __init__(self, naslov, parent=None):
+        super().__init__(parent)
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(naslov))
+        self.pretraga = QLineEdit()
+        self.pretraga.setPlaceholderText("Pretraga...")
+        self.pretraga.setClearButtonEnabled(True)
+        layout.addWidget(self.pretraga)
+        self.all_cb = QCheckBox("Označi sve")
+        self.all_cb.setChecked(True)
+        self.all_cb.stateChanged.connect(self.on_all_toggled)
+        layout.addWidget(self.all_cb)
+
+        self.model = FilterModel(self)
+        self.model.promenjeno.connect(self.on_vrednost_promenjena)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.pretraga.textChanged.connect(self.proxy.setFilterFixedString)
+        self.lista = QListView()
+        self.lista.setModel(self.proxy)
+        self.lista.setUniformItemSizes(True)
+        layout.addWidget(self.lista)
+
+    def _postavi_oznaci_sve(self, cekirano):
+        self.all_cb.blockSignals(True)
+        self.all_cb.setChecked(cekirano)
+        self.all_cb.blockSignals(False)
+
+    def _azuriraj_oznaci_sve(self):
+        """'Označi sve' je čekirano kada nijedna vrednost nije rasčekirana (prazna lista ga ne menja)."""
+        if not self.model.sve_cekirano():
+            self._postavi_oznaci_sve(False)
+        elif self.model.rowCount():
+            self._postavi_oznaci_sve(True)
+
+    def on_vrednost_promenjena(self):
+        self._azuriraj_oznaci_sve()
+        self.promenjeno.emit()
+
+    def on_all_toggled(self, state):
+        is_checked = state == Qt.CheckState.Checked.value
+        self.model.postavi_cekirane(self.model.vrednosti() if is_checked else ())
+        self.promenjeno.emit()
+
+    def postavi_vrednosti(self, vrednosti, podaci=None):
+        """Zamenjuje sve vrednosti (sortirane); posle toga je sve čekirano."""
+        self.model.postavi_vrednosti(vrednosti, podaci)
+        self._postavi_oznaci_sve(True)
+
+    def sve_cekirano(self):
+        """True ako je čekirano 'Označi sve' (tada se filter ne primenjuje)."""
+        return self.all_cb.isChecked()
+
+    def cekirane_vrednosti(self):
+        return self.model.cekirane()
+
+    def propusta(self, vrednost):
+        """Da li red sa datom vrednošću prolazi filter (isto kao IN (...) u SQL-u, NULL ne prolazi)."""
+        if self.sve_cekirano():
+            return True
+        return vrednost is not None and self.model.je_cekirano(str(vrednost))
+
+    def postavi_cekirane(self, vrednosti):
+        """Programski izbor vrednosti, bez signala 'promenjeno'."""
+        self.model.postavi_cekirane(vrednosti)
+        self._azuriraj_oznaci_sve()
+
+    def dodaj_vrednost(self, vrednost, podatak=None, cekirano=None):
+        """Dodaje vrednost; podrazumevano je čekirana samo ako je čekirano 'Označi sve'."""
+        if cekirano is None:
+            cekirano = self.sve_cekirano()
+        self.model.dodaj(vrednost, podatak, cekirano)
+        self._azuriraj_oznaci_sve()
+
+    def ukloni_vrednost(self, vrednost):
+        self.model.ukloni(vrednost)
+        self._azuriraj_oznaci_sve()
+
+# --- GLAVNA APLIKACIJA ---
+
+class SimpleApp(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Turnusi_VV")
+        self.resize(1400, 900)
+        self.init_database()
+        
+        # Promenljive za režim uređivanja
+        self.trenutni_broj_za_izmenu = None
+        self.trenutni_turnus_za_izmenu = None
+        
+        # Informacije o sortiranju
+        self.vozi_sort_info = {'column': 0, 'order': Qt.SortOrder.AscendingOrder} # Default: broj voza ASC
+        self.turnusi_sort_info = {'column': 0, 'order': Qt.SortOrder.AscendingOrder} # Default: naziv ASC
+        
+        # Informacije o grafiku
+        self.godina_za_grafik = "" # Atribut za čuvanje unete godine
+        self.godina_input = None # Atribut za referencu na QLineEdit
+        
+        # Broj redova po vrednosti filtera (sekcija, serija...) - checkbox nestaje kad broj padne na 0
+        self.brojaci_filtera = {}
+        # Tajmer po funkciji osvežavanja (vidi zakazi_osvezavanje)
+        self.tajmeri_osvezavanja = {}
+        # Nacrtani turnusi po id-ju (None ako turnus nema vozova) i oni koji su trenutno na sceni
+        self.grafik_kes = {}
+        self.grafik_na_sceni = {}
+        # Svi vozovi i turnusi u memoriji (jezgro.provera), za proveru turnusa pogođenih izmenom voza
+        self.indeks_turnusa = None
+        self.prikazi_proveru_svih = False
+        # Plan pregleda za tekući mesec nad indeksom turnusa (jezgro.odrzavanje), pravi se na zahtev
+        self.plan_pregleda = None
+        
+        # Inicijalizacija UI
+        self.init_ui()
+        
+        # Popunjavanje filtera i učitavanje podataka
+        self.populate_filters_and_load_data()
+
+    def populate_filters_and_load_data(self):
+        """Centralizovana funkcija za popunjavanje svih filtera i učitavanje početnih podataka."""
+        # Filteri tabova Vozovi i Turnusi; vrednosti stižu iz pozadine, a do tada su postojeće
+        # vrednosti sve čekirane, pa se tabele ispod učitavaju bez filtera kao i ranije
+        self.ucitaj_filtere()
+        for naziv in FILTERI_TABELA:
+            panel = self.filter_paneli[naziv]
+            panel.postavi_vrednosti(panel.model.vrednosti())
+
+        # Tab Vozovi
+        self.ucitaj_podatke(sort_column=None, sort_order=None) # Inicijalno bez sortiranja
+        
+        # Tab Turnusi
+        self.ucitaj_turnuse(sort_column=None, sort_order=None) # Inicijalno bez sortiranja
+        
+        # Tab Grafik
+        self.populate_grafik_filter()
+        
+        # Indeks za proveru turnusa (neispravni turnusi se označavaju u tabeli)
+        self.ucitaj_indeks_turnusa()
+
+    def closeEvent(self, event):
+        """Otkazuje pozadinska učitavanja i zatvara deljenu konekciju ka bazi pri zatvaranju prozora."""
+        self.ucitavac.otkazi_sve()
+        self.ucitavac.pool.waitForDone()
+        self.baza.zatvori()
+        super().closeEvent(event)
+
+    # --- BAZA PODATAKA ---
+
+    def init_database(self):
+        """Inicijalizuje bazu podataka i tabele."""
+        self.baza = Baza(DB_PATH)
+        # Tabele i indeksi se prave kroz verzionisane migracije (preskaču se ako su već primenjene)
+        self.baza.migriraj()
+        # Upiti za prikaz idu u pozadinske niti, svaki na svojoj konekciji
+        self.ucitavac = Ucitavac(self.baza, self)
+        
+        # --- DODANO ---
+        # Učitaj prethodno sačuvanu godinu prilikom inicijalizacije baze
+        #self.ucitaj_godinu_za_grafik()
+        # ---
+
+    # --- KORISNIČKI INTERFEJS ---
+    def init_ui(self):
+        """Inicijalizuje korisnički interfejs sa tabovima."""
+        main_layout = QVBoxLayout()
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.create_tab_vozovi(), "Vozovi")
+        self.tabs.addTab(self.create_tab_turnusi(), "Turnusi")
+        self.tabs.addTab(self.create_tab_grafik(), "Pregled Grafika")
+        # DODAVANJE NOVOG TABA
+        self.tab_stampa = self.create_tab_stampa()
+        self.tabs.addTab(self.tab_stampa, "Stampa turnusa")
+        self.tabs.currentChanged.connect(self.on_tab_promenjen)
+        main_layout.addWidget(self.tabs)
+        self.setLayout(main_layout)
+        self.napravi_filter_panele()
+
+    def create_tab_vozovi(self):
+        """Kreira tab za upravljanje vozovima."""
+        widget = QWidget()
+        main_layout = QVBoxLayout()
+        
+        # --- GORNJI DEO (30%) ---
+        top_frame = QFrame()
+        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        top_layout = QHBoxLayout(top_frame)
+        
+        # === Forma za unos voza (55%) ===
+        left_frame = QFrame()
+        left_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        left_layout = QVBoxLayout(left_frame)
+        naslov = QLabel("Unos voza")
+        naslov.setStyleSheet("font-size: 16px; font-weight: bold;")
+        left_layout.addWidget(naslov)
+        
+        # Input polja
+        self.broj_voza_input = UppercaseLineEdit()
+        self.pocetna_input = UppercaseLineEdit()
+        self.krajnja_input = UppercaseLineEdit()
+        self.sat_p_input = UppercaseLineEdit()
+        self.minut_p_input = UppercaseLineEdit()
+        self.sat_d_input = UppercaseLineEdit()
+        self.minut_d_input = UppercaseLineEdit()
+        self.serija_input = UppercaseLineEdit()
+        self.status_input = UppercaseLineEdit()
+        self.sekcija_input = UppercaseLineEdit()
+        
+        # Validatori
+        self.sat_p_input.setValidator(QIntValidator(0, 23))
+        self.minut_p_input.setValidator(QIntValidator(0, 59))
+        self.sat_d_input.setValidator(QIntValidator(0, 23))
+        self.minut_d_input.setValidator(QIntValidator(0, 59))
+        
+        # Layout forme
+        form_inner = QHBoxLayout()
+        levo_forme = QVBoxLayout()
+        desno_forme = QVBoxLayout()
+        
+        levo_forme.addWidget(QLabel("Broj voza (3-6 alfanumerička znaka, npr. R4655):"))
+        levo_forme.addWidget(self.broj_voza_input)
+        levo_forme.addWidget(QLabel("Početna stanica (2-3 slova):"))
+        levo_forme.addWidget(self.pocetna_input)
+        levo_forme.addWidget(QLabel("Krajnja stanica (2-3 slova):"))
+        levo_forme.addWidget(self.krajnja_input)
+        levo_forme.addWidget(QLabel("Sat polaska (hh):"))
+        levo_forme.addWidget(self.sat_p_input)
+        levo_forme.addWidget(QLabel("Minut polaska (mm):"))
+        levo_forme.addWidget(self.minut_p_input)
+        
+        desno_forme.addWidget(QLabel("Sat dolaska (hh):"))
+        desno_forme.addWidget(self.sat_d_input)
+        desno_forme.addWidget(QLabel("Minut dolaska (mm):"))
+        desno_forme.addWidget(self.minut_d_input)
+        desno_forme.addWidget(QLabel("Serija vučnog vozila:"))
+        desno_forme.addWidget(self.serija_input)
+        desno_forme.addWidget(QLabel("Status (R, L, RE, S, V):"))
+        desno_forme.addWidget(self.status_input)
+        desno_forme.addWidget(QLabel("Sekcija (npr. KV):"))
+        desno_forme.addWidget(self.sekcija_input)
+        
+        form_inner.addLayout(levo_forme)
+        form_inner.addLayout(desno_forme)
+        left_layout.addLayout(form_inner)
+        
+        # Dugmad
+        btn_layout = QHBoxLayout()
+        self.btn_dodaj = QPushButton("Dodaj voz")
+        self.btn_dodaj.clicked.connect(self.dodaj_voz)
+        self.btn_azuriraj = QPushButton("Ažuriraj voz")
+        self.btn_azuriraj.clicked.connect(self.azuriraj_voz)
+        self.btn_azuriraj.setVisible(False)
+        self.btn_odustani = QPushButton("Odustani od uređivanja")
+        self.btn_odustani.clicked.connect(self.odustani_od_uredjivanja)
+        self.btn_odustani.setVisible(False)
+        btn_layout.addWidget(self.btn_dodaj)
+        btn_layout.addWidget(self.btn_azuriraj)
+        btn_layout.addWidget(self.btn_odustani)
+        left_layout.addLayout(btn_layout)
+        top_layout.addWidget(left_frame, 55)
+        
+        # === Filteri ===
+        # Filter po vozovima, sekcijama i serijama (po 15%)
+        self.vozovi_filter = FilterPanel("Filter po vozovima:")
+        top_layout.addWidget(self.vozovi_filter, 15)
+        self.sekcije_filter = FilterPanel("Filter po sekciji:")
+        top_layout.addWidget(self.sekcije_filter, 15)
+        self.serije_filter = FilterPanel("Filter po seriji:")
+        top_layout.addWidget(self.serije_filter, 15)
+        
+        main_layout.addWidget(top_frame, 30)
+
+        # --- DONJI DEO (70%) ---
+        bottom_frame = QFrame()
+        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        bottom_layout = QVBoxLayout(bottom_frame)
+        bottom_layout.addWidget(QLabel("Postojeći vozovi:"))
+        # Model/view: podaci su u modelu, filtriranje i sortiranje radi proxy model
+        self.vozovi_model = VozoviModel(self)
+        self.vozovi_proxy = RedoviProxyModel(self)
+        self.vozovi_proxy.setSourceModel(self.vozovi_model)
+        self.tabela = QTableView()
+        self.tabela.setModel(self.vozovi_proxy)
+        self.tabela.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Fiksna visina redova - view ne mora da meri svaki red
+        self.tabela.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        # ONEMOGUĆI Qt SORTIRANJE (sortiranje se radi preko handle_vozovi_header_click)
+        self.tabela.setSortingEnabled(False) 
+        self.tabela.horizontalHeader().setSortIndicatorShown(True)
+        
+        # Jedan delegat crta dugmad "Uredi" i "Obriši" za sve redove
+        self.vozovi_delegate = DugmadDelegate(self.tabela)
+        self.vozovi_delegate.kliknuto.connect(self.on_vozovi_dugme_kliknuto)
+        self.tabela.setItemDelegateForColumn(VozoviModel.KOLONA_UREDI, self.vozovi_delegate)
+        self.tabela.setItemDelegateForColumn(VozoviModel.KOLONA_OBRISI, self.vozovi_delegate)
+        
+        # Poveži klik na zaglavlje sa funkcijom za rukovanje sortiranjem
+        self.tabela.horizontalHeader().sectionClicked.connect(self.handle_vozovi_header_click)
+        
+        bottom_layout.addWidget(self.tabela)
+        main_layout.addWidget(bottom_frame, 70)
+        
+        widget.setLayout(main_layout)
+        return widget
+
+    def create_tab_turnusi(self):
+        """Kreira tab za upravljanje turnusima."""
+        widget = QWidget()
+        main_layout = QVBoxLayout()
+        
+        # --- GORNJI DEO (30%) ---
+        top_frame = QFrame()
+        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        top_layout = QHBoxLayout(top_frame)
+        
+        # === Forma za unos turnusa (55%) ===
+        left_frame = QFrame()
+        left_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        left_layout = QVBoxLayout(left_frame)
+        naslov = QLabel("Unos turnusa")
+        naslov.setStyleSheet("font-size: 16px; font-weight: bold;")
+        left_layout.addWidget(naslov)
+        
+        # Polja forme
+        self.naziv_turnusa_input = QLineEdit()
+        self.naziv_turnusa_input.setPlaceholderText("Npr. TUR1")
+        self.serija_vv_input = UppercaseLineEdit()
+        self.serija_vv_input.setPlaceholderText("Npr. 441, 442")
+        self.vozovi_input = QLineEdit()
+        self.vozovi_input.setPlaceholderText("Npr. 4830, 4831, 4832")
+        self.sekcija_voza_input = UppercaseLineEdit()
+        self.sekcija_voza_input.setPlaceholderText("Npr. KV")
+        
+        left_layout.addWidget(QLabel("Naziv turnusa:"))
+        left_layout.addWidget(self.naziv_turnusa_input)
+        left_layout.addWidget(QLabel("Serija VV:"))
+        left_layout.addWidget(self.serija_vv_input)
+        left_layout.addWidget(QLabel("Vozovi u turnusu:"))
+        left_layout.addWidget(self.vozovi_input)
+        left_layout.addWidget(QLabel("Sekcija za vuču vozova:"))
+        left_layout.addWidget(self.sekcija_voza_input)
+        
+        # Dugmad
+        self.btn_proveri = QPushButton("Proveri turnus")
+        self.btn_proveri.clicked.connect(self.proveri_turnus)
+        left_layout.addWidget(self.btn_proveri)
+        self.btn_odustani_turnus = QPushButton("Odustani od uređivanja")
+        self.btn_odustani_turnus.clicked.connect(self.odustani_od_uredjivanja_turnusa)
+        self.btn_odustani_turnus.setVisible(False)
+        left_layout.addWidget(self.btn_odustani_turnus)
+        
+        self.status_label = QLabel("")
+        self.status_label.setWordWrap(True)
+        self.status_label.setStyleSheet("padding: 10px; background-color: #f0f0f0; border-radius: 5px;")
+        left_layout.addWidget(self.status_label)
+        top_layout.addWidget(left_frame, 55)
+        
+        # === Filteri ===
+        # Filter po nazivu, sekciji i seriji VV (po 15%)
+        self.nazivi_filter = FilterPanel("Filter po nazivu:")
+        top_layout.addWidget(self.nazivi_filter, 15)
+        self.sekcije_turnusi_filter = FilterPanel("Filter po sekciji:")
+        top_layout.addWidget(self.sekcije_turnusi_filter, 15)
+        self.serije_vv_filter = FilterPanel("Filter po seriji VV:")
+        top_layout.addWidget(self.serije_vv_filter, 15)
+        
+        main_layout.addWidget(top_frame, 30)
+
+        # --- DONJI DEO (70%) ---
+        bottom_frame = QFrame()
+        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        bottom_layout = QVBoxLayout(bottom_frame)
+        naslov_layout = QHBoxLayout()
+        naslov_layout.addWidget(QLabel("Postojeći turnusi:"))
+        naslov_layout.addStretch()
+        self.btn_proveri_sve = QPushButton("Proveri sve turnuse")
+        self.btn_proveri_sve.clicked.connect(self.proveri_sve_turnuse)
+        naslov_layout.addWidget(self.btn_proveri_sve)
+        self.btn_potreba_lokomotiva = QPushButton("Potreba lokomotiva")
+        self.btn_potreba_lokomotiva.clicked.connect(self.prikazi_potrebu_lokomotiva)
+        naslov_layout.addWidget(self.btn_potreba_lokomotiva)
+        self.btn_plan_pregleda = QPushButton("Plan pregleda")
+        self.btn_plan_pregleda.clicked.connect(self.prikazi_plan_pregleda)
+        naslov_layout.addWidget(self.btn_plan_pregleda)
+        bottom_layout.addLayout(naslov_layout)
+        # Model/view: turnusi i njihovi vozovi su obični podaci u modelu
+        self.turnusi_model = TurnusiModel(self)
+        self.turnusi_proxy = RedoviProxyModel(self)
+        self.turnusi_proxy.setSourceModel(self.turnusi_model)
+        self.tabela_turnusa = QTableView()
+        self.tabela_turnusa.setModel(self.turnusi_proxy)
+        self.tabela_turnusa.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tabela_turnusa.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        # ONEMOGUĆI Qt SORTIRANJE (sortiranje se radi preko handle_turnusi_header_click)
+        self.tabela_turnusa.setSortingEnabled(False)
+        self.tabela_turnusa.horizontalHeader().setSortIndicatorShown(True)
+        
+        # Jedan delegat crta dugmad Uredi/Obriši/Grafik u koloni "Akcije"
+        self.turnusi_delegate = DugmadDelegate(self.tabela_turnusa)
+        self.turnusi_delegate.kliknuto.connect(self.on_turnusi_dugme_kliknuto)
+        self.tabela_turnusa.setItemDelegateForColumn(TurnusiModel.KOLONA_AKCIJE, self.turnusi_delegate)
+        
+        # Poveži klik na zaglavlje sa funkcijom za rukovanje sortiranjem
+        self.tabela_turnusa.horizontalHeader().sectionClicked.connect(self.handle_turnusi_header_click)
+        
+        bottom_layout.addWidget(self.tabela_turnusa)
+        main_layout.addWidget(bottom_frame, 70)
+        
+        widget.setLayout(main_layout)
+        return widget
+
+    def create_tab_grafik(self):
+        """Kreira tab za grafički prikaz turnusa."""
+        widget = QWidget()
+        main_layout = QVBoxLayout()
+        
+        # --- GORNJI DEO (30%) ---
+        top_frame = QFrame()
+        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        top_layout = QHBoxLayout(top_frame)
+        
+        # === Filteri ===
+        # Filter po turnusima, sekcijama i seriji VV (po 25%)
+        self.grafik_turnusi_filter = FilterPanel("Izaberite turnuse za prikaz:")
+        top_layout.addWidget(self.grafik_turnusi_filter, 25)
+        self.grafik_sekcije_filter = FilterPanel("Filter po sekcijama:")
+        top_layout.addWidget(self.grafik_sekcije_filter, 25)
+        self.grafik_serije_vv_filter = FilterPanel("Filter po seriji VV:")
+        top_layout.addWidget(self.grafik_serije_vv_filter, 25)
+
+        # === Forma za unos godine (25%) ===
+        empty_frame = QFrame()
+        empty_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        empty_layout = QVBoxLayout(empty_frame) # Koristi QVBoxLayout za vertikalni raspored
+
+        # Naslov
+        naslov_label = QLabel("GRAFIČKI TURNUS VUČNIH VOZILA ZA RED VOŽNJE")
+        naslov_label.setAlignment(Qt.AlignmentFlag.AlignCenter) # Centriraj tekst
+        naslov_label.setStyleSheet("font-weight: bold;") # Opcionalno: podebljaj tekst
+        empty_layout.addWidget(naslov_label)
+
+                # Horizontalni layout za input i label "GODINU"
+        input_layout = QHBoxLayout()
+        input_layout.addStretch() # Dodaj fleksibilni prostor levo
+
+        self.godina_input = QLineEdit() # Inicijalizuj referencu
+        # --- DODANO ---
+        # Podebljaj font i centriraj tekst u QLineEdit-u
+        font = self.godina_input.font()
+        font.setBold(True)
+        self.godina_input.setFont(font)
+        self.godina_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # --- KRAJ DODAVANJA ---
+        self.godina_input.setPlaceholderText("Npr. 09.12.2025/26") # Placeholder
+        # Poveži promenu teksta sa funkcijom za čuvanje
+        self.godina_input.textChanged.connect(self.snimi_godinu_za_grafik)
+
+        input_layout.addWidget(self.godina_input)
+        # input_layout.addWidget(QLabel("GODINU")) # Dodaj labelu "GODINU" ispod inputa, ne pored
+        input_layout.addStretch() # Dodaj fleksibilni prostor desno
+
+        empty_layout.addLayout(input_layout) # Dodaj horizontalni layout u glavni (vertikalni) layout
+
+        # Dodaj labelu "GODINU" ispod inputa
+        label_godina = QLabel("GODINU")
+        label_godina.setAlignment(Qt.AlignmentFlag.AlignCenter) # Centriraj tekst labela
+        label_godina.setStyleSheet("font-weight: bold;") # Podebljaj tekst
+        empty_layout.addWidget(label_godina)
+
+        top_layout.addWidget(empty_frame, 25) # ← 25%
+        
+        main_layout.addWidget(top_frame, 30) # ← Gornji deo zauzima 30% visine
+
+        # --- DONJI DEO (70%) ---
+        bottom_frame = QFrame()
+        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        bottom_layout = QVBoxLayout(bottom_frame)
+        naslov = QLabel("Grafički prikaz turnusa")
+        naslov.setStyleSheet("font-size: 16px; font-weight: bold;")
+        bottom_layout.addWidget(naslov)
+        self.scene = GrafikScena()
+        # Uvećanje: Ctrl + točkić miša ili dugmad ispod grafika
+        self.view = GrafikPogled(self.scene)
+        self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        bottom_layout.addWidget(self.view)
+        dugmad_layout = QHBoxLayout()
+        self.btn_azuriraj_grafik = QPushButton("Ažuriraj grafik")
+        self.btn_azuriraj_grafik.clicked.connect(self.crtaj_grafik)
+        dugmad_layout.addWidget(self.btn_azuriraj_grafik, 1)
+        for tekst, akcija in (
+            ("Umanji", lambda: self.view.zumiraj(1 / KORAK_UVECANJA)),
+            ("Uvećaj", lambda: self.view.zumiraj(KORAK_UVECANJA)),
+            ("Ceo grafik", self.view.prikazi_ceo_grafik),
+            ("100%", self.view.vrati_uvecanje),
+        ):
+            dugme = QPushButton(tekst)
+            dugme.clicked.connect(akcija)
+            dugmad_layout.addWidget(dugme)
+        bottom_layout.addLayout(dugmad_layout)
+        main_layout.addWidget(bottom_frame, 70)
+        
+        widget.setLayout(main_layout)
+
+        # --- DODATO: Učitaj vrednost odmah nakon što je input inicijalizovan ---
+        # Ovo osigurava da se vrednost učita *nakon* što self.godina_input postoji
+        self.ucitaj_godinu_za_grafik()
+        # ---
+
+        return widget
+    
+    def create_tab_stampa(self):
+        """Kreira tab za prikaz i štampu turnusa."""
+        widget = QWidget()
+        main_layout = QVBoxLayout()
+
+        # --- GORNJI DEO (25%) ---
+        top_frame = QFrame()
+        top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        # KORISTIMO QHBoxLayout za tri jednaka dela
+        top_layout = QHBoxLayout(top_frame)
+
+        # === Kontrole za izbor turnusa (33.33%) ===
+        left_top_frame = QFrame()
+        left_top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        left_top_layout = QVBoxLayout(left_top_frame)
+        left_top_layout.addWidget(QLabel("Štampaju se turnusi čekirani u tabu 'Pregled Grafika'."))
+        po_strani_layout = QHBoxLayout()
+        po_strani_layout.addWidget(QLabel("Turnusa po strani:"))
+        self.turnusa_po_strani_input = QSpinBox()
+        self.turnusa_po_strani_input.setRange(1, 30)
+        self.turnusa_po_strani_input.setValue(TURNUSA_PO_STRANI)
+        self.turnusa_po_strani_input.valueChanged.connect(self.osvezi_pregled_stampe)
+        po_strani_layout.addWidget(self.turnusa_po_strani_input)
+        po_strani_layout.addStretch()
+        left_top_layout.addLayout(po_strani_layout)
+        left_top_layout.addStretch()
+        top_layout.addWidget(left_top_frame) # Qt automatski dodeljuje težinu
+
+        # === Pregled selekcije (33.33%) ===
+        middle_top_frame = QFrame()
+        middle_top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        middle_top_layout = QVBoxLayout(middle_top_frame)
+        self.stampa_info_label = QLabel("Nije izabran nijedan turnus.")
+        middle_top_layout.addWidget(self.stampa_info_label)
+        strana_layout = QHBoxLayout()
+        strana_layout.addWidget(QLabel("Strana:"))
+        self.stampa_strana_input = QSpinBox()
+        self.stampa_strana_input.setRange(1, 1)
+        self.stampa_strana_input.valueChanged.connect(self.osvezi_pregled_stampe)
+        strana_layout.addWidget(self.stampa_strana_input)
+        strana_layout.addStretch()
+        middle_top_layout.addLayout(strana_layout)
+        btn_pregled = QPushButton("Osveži pregled")
+        btn_pregled.clicked.connect(self.osvezi_pregled_stampe)
+        middle_top_layout.addWidget(btn_pregled)
+        top_layout.addWidget(middle_top_frame) # Qt automatski dodeljuje težinu
+
+        # === REZERVA (33.33%) ===
+        right_top_frame = QFrame()
+        right_top_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        right_top_layout = QVBoxLayout(right_top_frame)
+        right_top_layout.addWidget(QLabel("Izvoz (A4, položeno):"))
+        btn_pdf = QPushButton("Izvezi PDF...")
+        btn_pdf.clicked.connect(self.izvezi_grafik_pdf)
+        right_top_layout.addWidget(btn_pdf)
+        btn_svg = QPushButton("Izvezi SVG...")
+        btn_svg.clicked.connect(self.izvezi_grafik_svg)
+        right_top_layout.addWidget(btn_svg)
+        # Svi turnusi (sve sekcije i serije VV) za godinu reda vožnje, crtani u više procesa
+        btn_sve = QPushButton("Štampaj sve turnuse (PDF)...")
+        btn_sve.clicked.connect(self.stampaj_sve_turnuse)
+        right_top_layout.addWidget(btn_sve)
+        top_layout.addWidget(right_top_frame) # Qt automatski dodeljuje težinu
+
+        main_layout.addWidget(top_frame, 20) # 25% visine
+
+        # --- DONJI DEO (75%) ---
+        bottom_frame = QFrame()
+        bottom_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        bottom_layout = QVBoxLayout(bottom_frame)
+        bottom_layout.addWidget(QLabel("Prikaz za štampu (A4 format) - 100% širine donjeg dela"))
+        # Strana se crta isto kao pri izvozu (StranaStampe); A4 položeno je ~1123 x 794 px na 96 DPI
+        self.stampa_scene = QGraphicsScene()
+        self.stampa_view = QGraphicsView(self.stampa_scene)
+        self.stampa_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        bottom_layout.addWidget(self.stampa_view)
+        main_layout.addWidget(bottom_frame, 80) # 75% visine
+
+        widget.setLayout(main_layout)
+        return widget
+
+    # --- FUNKCIJE ZA FILTRIRANJE ---
+    def zakazi_osvezavanje(self, funkcija):
+        """Zakazuje osvežavanje posle kratke pauze; nova promena pre isteka pomera rok.
+
+        Niz promena filtera (npr. pet sekcija zaredom) tako daje jedno osvežavanje.
+        """
+        tajmer = self.tajmeri_osvezavanja.get(funkcija)
+        if tajmer is None:
+            tajmer = QTimer(self)
+            tajmer.setSingleShot(True)
+            tajmer.setInterval(ODLAGANJE_FILTERA_MS)
+            tajmer.timeout.connect(funkcija)
+            self.tajmeri_osvezavanja[funkcija] = tajmer
+        tajmer.start()
+
+    # --- POPUNJAVANJE FILTARA ---
+
+    def napravi_filter_panele(self):
+        """Pravi rečnik naziv -> FilterPanel i povezuje svaki panel sa njegovim osvežavanjem."""
+        osvezi_vozove = lambda: self.ucitaj_podatke(sort_column=None, sort_order=None)
+        osvezi_turnuse = lambda: self.ucitaj_turnuse(sort_column=None, sort_order=None)
+        paneli = {
+            'vozovi': (self.vozovi_filter, osvezi_vozove),
+            'sekcije': (self.sekcije_filter, osvezi_vozove),
+            'serije': (self.serije_filter, osvezi_vozove),
+            'nazivi': (self.nazivi_filter, osvezi_turnuse),
+            'sekcije_turnusi': (self.sekcije_turnusi_filter, osvezi_turnuse),
+            'serije_vv': (self.serije_vv_filter, osvezi_turnuse),
+            'grafik_turnusi': (self.grafik_turnusi_filter, self.crtaj_grafik),
+            'grafik_sekcije': (self.grafik_sekcije_filter, self.filter_turnuse_po_sekciji),
+            'grafik_serije_vv': (self.grafik_serije_vv_filter, self.filter_turnuse_po_seriji_vv),
+        }
+        self.filter_paneli = {}
+        for naziv, (panel, osvezi) in paneli.items():
+            panel.promenjeno.connect(lambda osvezi=osvezi: self.zakazi_osvezavanje(osvezi))
+            self.filter_paneli[naziv] = panel
+
+    def ucitaj_filtere(self):
+        """Učitava vrednosti filtera tabova 'Vozovi' i 'Turnusi' u pozadini."""
+        self.ucitavac.pokreni('filteri', procitaj_vrednosti_filtera, self._popuni_filtere)
+
+    def _popuni_filtere(self, vrednosti):
+        """Puni filtere i pamti broj redova po vrednosti (vidi _promeni_brojac)."""
+        for naziv in FILTERI_TABELA:
+            redovi = vrednosti[naziv]
+            self.brojaci_filtera[naziv] = Counter({vrednost: broj for vrednost, broj in redovi})
+            self.filter_paneli[naziv].postavi_vrednosti([str(vrednost) for vrednost, _ in redovi])
+        # Filteri po sekcijama i seriji VV u tabu 'Grafik' imaju iste vrednosti kao u tabu 'Turnusi'
+        self.grafik_sekcije_filter.postavi_vrednosti(
+            sorted(str(s) for s in self.brojaci_filtera['sekcije_turnusi'] if s))
+        self.grafik_serije_vv_filter.postavi_vrednosti(
+            sorted(str(s) for s in self.brojaci_filtera['serije_vv'] if s))
+
+    def populate_grafik_filter(self):
+        """Popunjava sve filtere u tabu 'Grafik'."""
+        # Posle punog učitavanja ništa iz keša grafika ne sme da se koristi ponovo
+        self.zaboravi_turnuse_u_grafiku(list(self.grafik_kes))
+        # --- Popuni filter po turnusima (učitava se u pozadini) ---
+        # Filteri po sekcijama i seriji VV se pune sa filterima taba 'Turnusi' (vidi _popuni_filtere)
+        self.ucitavac.pokreni('grafik_filter', procitaj_turnuse_za_filter, self._popuni_grafik_turnuse)
+
+    def _popuni_grafik_turnuse(self, turnusi):
+        """Puni filter turnusa u tabu 'Grafik'; uz naziv se pamte id, sekcija i serija VV."""
+        self.grafik_turnusi_filter.postavi_vrednosti(
+            [f"{t[1]}" for t in turnusi],
+            {f"{t[1]}": (t[0], t[2] or "", t[3] or "") for t in turnusi},
+        )
+
+    # --- INKREMENTALNO OSVEŽAVANJE POSLE IZMENA ---
+
+    def _prolazi_filtere(self, uslovi):
+        """Proverava (panel, vrednost) parove isto kao WHERE iz ucitaj_podatke/ucitaj_turnuse."""
+        return all(self.filter_paneli[panel].propusta(vrednost) for panel, vrednost in uslovi)
+
+    def _promeni_brojac(self, brojac, vrednost, promena, paneli):
+        """Menja broj redova za vrednost; checkbox se dodaje/uklanja samo na prelazu preko nule."""
+        if vrednost is None:
+            return
+        brojevi = self.brojaci_filtera.setdefault(brojac, Counter())
+        staro = brojevi[vrednost]
+        brojevi[vrednost] = staro + promena
+        if brojevi[vrednost] <= 0:
+            del brojevi[vrednost]
+            if staro > 0:
+                for panel in paneli:
+                    self.filter_paneli[panel].ukloni_vrednost(str(vrednost))
+        elif staro <= 0:
+            for panel in paneli:
+                self.filter_paneli[panel].dodaj_vrednost(str(vrednost))
+
+    def _grafik_prikazuje(self, turnus_ids):
+        """Da li je bar jedan od turnusa čekiran (prikazan) u tabu 'Grafik'."""
+        panel = self.grafik_turnusi_filter
+        return any(panel.model.podatak(naziv)[0] in turnus_ids for naziv in panel.cekirane_vrednosti())
+
+    def osvezi_posle_izmene_voza(self, stari, novi):
+        """Ažurira filtere, tabelu, proveru turnusa i grafik posle dodavanja, izmene ili brisanja jednog voza.
+
+        stari/novi su Voz pre i posle izmene, ili None.
+        Vraća turnuse sa ovim vozom koji posle izmene nisu ispravni (RezultatTurnusa).
+        """
+        stari_broj = str(stari.broj) if stari else None
+        novi_broj = str(novi.broj) if novi else None
+        if self.ucitavac.u_toku('filteri'):
+            # Učitavanje filtera je u toku i vratilo bi stanje pre izmene - ponovi ga
+            self.ucitaj_filtere()
+        else:
+            for red, promena in ((stari, -1), (novi, 1)):
+                if red:
+                    self._promeni_brojac('vozovi', red.broj, promena, ('vozovi',))
+                    self._promeni_brojac('sekcije', red.sekcija, promena, ('sekcije',))
+                    self._promeni_brojac('serije', red.serija or None, promena, ('serije',))
+
+        prikazan = novi is not None and self._prolazi_filtere([
+            ('vozovi', novi.broj), ('sekcije', novi.sekcija), ('serije', novi.serija),
+        ])
+        if self.ucitavac.u_toku('vozovi'):
+            # Učitavanje je u toku i vratilo bi stanje pre izmene - ponovi ga umesto izmene reda
+            self.ucitaj_podatke(sort_column=None, sort_order=None)
+        else:
+            self.vozovi_model.zameni_red(stari.broj if stari else None, novi if prikazan else None)
+
+        # Turnusi sa ovim vozom (obrnuti indeks) se ponovo proveravaju i crtaju
+        neispravni = []
+        if self.indeks_turnusa is None or self.ucitavac.u_toku('indeks'):
+            # Indeks još nije učitan ili bi učitavanje vratilo stanje pre izmene - učitaj ga ponovo
+            self.ucitaj_indeks_turnusa()
+            turnus_ids = set()
+            if novi_broj is not None:
+                cursor = self.baza.cursor()
+                cursor.execute("SELECT turnus_id FROM turnus_vozovi WHERE broj_voza = ?", (novi_broj,))
+                turnus_ids = {row[0] for row in cursor.fetchall()}
+        else:
+            if novi is not None:
+                turnus_ids = self.indeks_turnusa.postavi_voz(novi, stari_broj)
+            else:
+                turnus_ids = self.indeks_turnusa.ukloni_voz(stari_broj)
+            neispravni = self.proveri_turnuse_u_indeksu(turnus_ids)
+            if self.plan_pregleda is not None:
+                km_vozova = procitaj_km_vozova(self.baza.cursor(), [novi_broj]) if novi is not None else None
+                self.plan_pregleda.osvezi_turnuse(turnus_ids, km_vozova)
+
+        # Grafik se osvežava samo ako je neki od tih turnusa prikazan
+        if turnus_ids:
+            self.zaboravi_turnuse_u_grafiku(turnus_ids)
+            if self._grafik_prikazuje(turnus_ids):
+                self.crtaj_grafik()
+        return neispravni
+
+    def osvezi_posle_izmene_turnusa(self, stari, novi):
+        """Ažurira filtere, tabelu i grafik posle dodavanja, izmene ili brisanja jednog turnusa.
+
+        stari/novi su redovi modela turnusa (vidi procitaj_turnus) pre i posle izmene, ili None.
+        """
+        if self.ucitavac.u_toku('filteri'):
+            # Učitavanje filtera je u toku i vratilo bi stanje pre izmene - ponovi ga
+            self.ucitaj_filtere()
+        else:
+            for red, promena in ((stari, -1), (novi, 1)):
+                if red:
+                    self._promeni_brojac('nazivi', red[1], promena, ('nazivi',))
+                    # Grafik filteri ne prikazuju prazne vrednosti
+                    self._promeni_brojac('sekcije_turnusi', red[3], promena,
+                                         ('sekcije_turnusi', 'grafik_sekcije') if red[3] else ('sekcije_turnusi',))
+                    self._promeni_brojac('serije_vv', red[2] or None, promena, ('serije_vv', 'grafik_serije_vv'))
+
+        prikazan = novi is not None and self._prolazi_filtere([
+            ('nazivi', novi[1]), ('sekcije_turnusi', novi[3]), ('serije_vv', novi[2]),
+        ])
+        if self.ucitavac.u_toku('turnusi'):
+            # Učitavanje je u toku i vratilo bi stanje pre izmene - ponovi ga umesto izmene reda
+            self.ucitaj_turnuse(sort_column=None, sort_order=None)
+        else:
+            self.turnusi_model.zameni_red(stari[0] if stari else None, novi if prikazan else None)
+
+        # Indeks turnusa i oznaka neispravnog turnusa u tabeli
+        if self.indeks_turnusa is None or self.ucitavac.u_toku('indeks'):
+            self.ucitaj_indeks_turnusa()
+        else:
+            # Pogođeni su i drugi turnusi sa kojima turnus deli ili je delio voz
+            pogodjeni = set()
+            if stari is not None and (novi is None or novi[0] != stari[0]):
+                pogodjeni |= self.indeks_turnusa.ukloni_turnus(stari[0])
+                self.turnusi_model.oznaci_turnus(stari[0], None)
+            if novi is not None:
+                pogodjeni |= self.indeks_turnusa.postavi_turnus(novi[0], novi[1], novi[3], novi[2], novi[4])
+            self.proveri_turnuse_u_indeksu(pogodjeni)
+            if self.plan_pregleda is not None:
+                self.plan_pregleda.osvezi_turnuse({red[0] for red in (stari, novi) if red})
+
+        # Turnus u tabu 'Grafik' zadržava čekiranost; grafik se crta samo ako je turnus prikazan
+        self.zaboravi_turnuse_u_grafiku({red[0] for red in (stari, novi) if red})
+        panel = self.grafik_turnusi_filter
+        if self.ucitavac.u_toku('grafik_filter'):
+            self.ucitavac.pokreni('grafik_filter', procitaj_turnuse_za_filter, self._popuni_grafik_turnuse)
+            return
+        bio_prikazan = stari is not None and panel.model.je_cekirano(f"{stari[1]}")
+        if stari is not None:
+            panel.ukloni_vrednost(f"{stari[1]}")
+        prikazan = False
+        if novi is not None:
+            cekirano = bio_prikazan if stari is not None else None
+            panel.dodaj_vrednost(f"{novi[1]}", (novi[0], novi[3] or "", novi[2] or ""), cekirano)
+            prikazan = panel.model.je_cekirano(f"{novi[1]}")
+        if bio_prikazan or prikazan:
+            self.crtaj_grafik()
+
+    def handle_vozovi_header_click(self, logical_index):
+        """Rukuje klikom na zaglavlje kolone u tabeli vozova."""
+        # Dobij prethodno zapamćene informacije o sortiranju za vozove
+        last_sorted_section = self.vozi_sort_info['column']
+        last_order = self.vozi_sort_info['order']
+
+        # Ako je kliknuta ista kolona, obrni smer, inače koristi ASCENDING
+        if last_sorted_section == logical_index:
+            # Istа kolona - promeni smer
+            new_order = Qt.SortOrder.DescendingOrder if last_order == Qt.SortOrder.AscendingOrder else Qt.SortOrder.AscendingOrder
+        else:
+            # Druga kolona - default je Ascending
+            new_order = Qt.SortOrder.AscendingOrder
+            
+        # Ažuriraj zapamćene informacije
+        self.vozi_sort_info['column'] = logical_index
+        self.vozi_sort_info['order'] = new_order
+            
+        # Sortiranje je u memoriji, nije potrebno ponovo čitati bazu
+        self.sortiraj_vozove(logical_index, new_order)
+
+    def sortiraj_vozove(self, sort_column, sort_order):
+        """Sortira prikaz vozova u memoriji i postavlja indikator na zaglavlju."""
+        # Kolone sa dugmadima (Uredi/Obriši) nisu za sortiranje - tada se sortira po broju voza
+        kolona = sort_column if sort_column < VozoviModel.KOLONA_UREDI else 0
+        self.vozovi_proxy.sort(kolona, sort_order)
+        self.tabela.horizontalHeader().setSortIndicator(sort_column, sort_order)
+
+    def ucitaj_podatke(self, sort_column=None, sort_order=None):
+        """Učitava podatke o vozovima u model tabele, opciono sortirane."""
+        if not hasattr(self, 'tabela') or self.tabela is None:
+            return
+        if not hasattr(self, 'filter_paneli'):
+            self.vozovi_model.postavi_redove([])
+            return
+            
+        selektovani_vozovi = self.vozovi_filter.cekirane_vrednosti()
+        selektovane_sekcije = self.sekcije_filter.cekirane_vrednosti()
+        selektovane_serije = self.serije_filter.cekirane_vrednosti()
+            
+        if ((not self.vozovi_filter.sve_cekirano() and not selektovani_vozovi) or
+                (not self.sekcije_filter.sve_cekirano() and not selektovane_sekcije) or
+                (not self.serije_filter.sve_cekirano() and not selektovane_serije)):
+            self.ucitavac.otkazi('vozovi')
+            self.vozovi_model.postavi_redove([])
+            return
+            
+        # Filtriranje radi baza - vraća samo redove koji se prikazuju (None = "Označi sve")
+        uslovi = [
+            ("broj_voza", None if self.vozovi_filter.sve_cekirano() else selektovani_vozovi),
+            ("sekcija", None if self.sekcije_filter.sve_cekirano() else selektovane_sekcije),
+            ("serija_vozila", None if self.serije_filter.sve_cekirano() else selektovane_serije),
+        ]
+        self.ucitavac.pokreni(
+            'vozovi', lambda cursor: procitaj_vozove(cursor, uslovi),
+            lambda redovi: self._prikazi_vozove(redovi, sort_column, sort_order),
+        )
+
+    def _prikazi_vozove(self, redovi, sort_column, sort_order):
+        """Puni model vozova rezultatom učitavanja i sortira ga."""
+        self.vozovi_model.postavi_redove(redovi)
+        
+        # Ako nije zadato sortiranje, koristi zapamćeno sortiranje
+        if sort_column is None or sort_order is None:
+            sort_column = self.vozi_sort_info['column']
+            sort_order = self.vozi_sort_info['order']
+        self.sortiraj_vozove(sort_column, sort_order)
+
+    def on_vozovi_dugme_kliknuto(self, index, _dugme):
+        """Rukuje klikom na dugme 'Uredi' ili 'Obriši' u tabeli vozova."""
+        izvorni = self.vozovi_proxy.mapToSource(index)
+        red = self.vozovi_model.red(izvorni.row())
+        if izvorni.column() == VozoviModel.KOLONA_UREDI:
+            self.uredi_voz(red)
+        elif izvorni.column() == VozoviModel.KOLONA_OBRISI:
+            self.obrisi_voz(str(red[0]))
+
+    def handle_turnusi_header_click(self, logical_index):
+        """Rukuje klikom na zaglavlje kolone u tabeli turnusa."""
+        # Dobij prethodno zapamćene informacije o sortiranju za turnuse
+        last_sorted_section = self.turnusi_sort_info['column']
+        last_order = self.turnusi_sort_info['order']
+
+        # Ako je kliknuta ista kolona, obrni smer, inače koristi ASCENDING
+        if last_sorted_section == logical_index:
+            # Istа kolona - promeni smer
+            new_order = Qt.SortOrder.DescendingOrder if last_order == Qt.SortOrder.AscendingOrder else Qt.SortOrder.AscendingOrder
+        else:
+            # Druga kolona - default je Ascending
+            new_order = Qt.SortOrder.AscendingOrder
+            
+        # Ažuriraj zapamćene informacije
+        self.turnusi_sort_info['column'] = logical_index
+        self.turnusi_sort_info['order'] = new_order
+            
+        # Sortiranje je u memoriji (i po koloni "Vozovi"), bez ponovnog čitanja baze
+        self.sortiraj_turnuse(logical_index, new_order)
+
+    def sortiraj_turnuse(self, sort_column, sort_order):
+        """Sortira prikaz turnusa u memoriji i postavlja indikator na zaglavlju."""
+        # Kolona "Akcije" nije za sortiranje - tada se sortira po nazivu
+        kolona = sort_column if sort_column < TurnusiModel.KOLONA_AKCIJE else 0
+        self.turnusi_proxy.sort(kolona, sort_order)
+        self.tabela_turnusa.horizontalHeader().setSortIndicator(sort_column, sort_order)
+
+    def ucitaj_turnuse(self, sort_column=None, sort_order=None):
+        """Učitava podatke o turnusima u model tabele, opciono sortirane."""
+        if not hasattr(self, 'tabela_turnusa') or self.tabela_turnusa is None:
+            return
+        if not hasattr(self, 'filter_paneli'):
+            self.turnusi_model.postavi_redove([])
+            return
+            
+        selektovani_nazivi = self.nazivi_filter.cekirane_vrednosti()
+        selektovane_sekcije = self.sekcije_turnusi_filter.cekirane_vrednosti()
+        selektovane_serije_vv = self.serije_vv_filter.cekirane_vrednosti()
+            
+        if ((not self.nazivi_filter.sve_cekirano() and not selektovani_nazivi) or
+                (not self.sekcije_turnusi_filter.sve_cekirano() and not selektovane_sekcije) or
+                (not self.serije_vv_filter.sve_cekirano() and not selektovane_serije_vv)):
+            self.ucitavac.otkazi('turnusi')
+            self.turnusi_model.postavi_redove([])
+            return
+            
+        # Filtriranje radi baza - vraća samo turnuse koji se prikazuju (None = "Označi sve")
+        uslovi = [
+            ("t.naziv", None if self.nazivi_filter.sve_cekirano() else selektovani_nazivi),
+            ("t.sekcija", None if self.sekcije_turnusi_filter.sve_cekirano() else selektovane_sekcije),
+            ("t.serija_vv", None if self.serije_vv_filter.sve_cekirano() else selektovane_serije_vv),
+        ]
+        self.ucitavac.pokreni(
+            'turnusi', lambda cursor: procitaj_turnuse(cursor, uslovi),
+            lambda turnusi: self._prikazi_turnuse(turnusi, sort_column, sort_order),
+        )
+
+    def _prikazi_turnuse(self, turnusi, sort_column, sort_order):
+        """Puni model turnusa rezultatom učitavanja i sortira ga."""
+        self.turnusi_model.postavi_redove(turnusi)
+        
+        # Ako nije zadato sortiranje, koristi zapamćeno sortiranje
+        if sort_column is None or sort_order is None:
+            sort_column = self.turnusi_sort_info['column']
+            sort_order = self.turnusi_sort_info['order']
+        self.sortiraj_turnuse(sort_column, sort_order)
+
+    def on_turnusi_dugme_kliknuto(self, index, dugme):
+        """Rukuje klikom na dugme Uredi/Obriši/Grafik u tabeli turnusa."""
+        turnus = self.turnusi_model.red(self.turnusi_proxy.mapToSource(index).row())
+        akcija = TurnusiModel.AKCIJE[dugme]
+        if akcija == "Uredi":
+            self.uredi_turnus(turnus)
+        elif akcija == "Obriši":
+            self.obrisi_turnus(turnus)
+        elif akcija == "Grafik":
+            self.prikazi_grafik_turnusa(turnus)
+
+    # --- OPERACIJE SA VOZOVIMA ---
+
+    def uredi_voz(self, podaci):
+        """Postavlja podatke vozova u formu za uređivanje."""
+        self.broj_voza_input.setText(str(podaci[0]))
+        self.pocetna_input.setText(str(podaci[1]))
+        self.krajnja_input.setText(str(podaci[2]))
+        self.sat_p_input.setText(str(podaci[3]))
+        self.minut_p_input.setText(str(podaci[4]))
+        self.sat_d_input.setText(str(podaci[5]))
+        self.minut_d_input.setText(str(podaci[6]))
+        self.serija_input.setText(str(podaci[7] or ""))
+        self.status_input.setText(str(podaci[8]))
+        self.sekcija_input.setText(str(podaci[9] or ""))
+        self.trenutni_broj_za_izmenu = str(podaci[0])
+        
+        self.btn_dodaj.setVisible(False)
+        self.btn_azuriraj.setVisible(True)
+        self.btn_odustani.setVisible(True)
+        log.debug("Režim izmene: uređuje se voz %s", podaci[0])
+
+    def azuriraj_voz(self):
+        """Pokreće proces ažuriranja vozova."""
+        self.dodaj_voz()
+
+    def odustani_od_uredjivanja(self):
+        """Odustaje od uređivanja vozova i vraća formu u početno stanje."""
+        self.ocisti_formu()
+        self.btn_dodaj.setVisible(True)
+        self.btn_azuriraj.setVisible(False)
+        self.btn_odustani.setVisible(False)
+        self.trenutni_broj_za_izmenu = None
+
+    def dodaj_voz(self):
+        """Dodaje novi voz ili ažurira postojeći."""
+        try:
+            voz = proveri_voz(
+                self.broj_voza_input.text(), self.pocetna_input.text(), self.krajnja_input.text(),
+                self.sat_p_input.text(), self.minut_p_input.text(), self.sat_d_input.text(), self.minut_d_input.text(),
+                self.serija_input.text(), self.status_input.text(), self.sekcija_input.text()
+            )
+            broj = voz.broj
+            
+            with self.baza.transakcija() as cursor:
+                stari = None
+                if self.trenutni_broj_za_izmenu is not None:
+                    stari = procitaj_vozove_po_broju(cursor, [self.trenutni_broj_za_izmenu]).get(
+                        self.trenutni_broj_za_izmenu)
+                    try:
+                        upisi_voz(cursor, voz, self.trenutni_broj_za_izmenu)
+                    except sqlite3.IntegrityError:
+                        QMessageBox.critical(self, "Greška", self._greska_izmene_voza(cursor, broj))
+                        return
+                    poruka = f"Voz {broj} uspešno ažuriran!"
+                else:
+                    try:
+                        upisi_voz(cursor, voz)
+                        poruka = f"Voz {broj} uspešno dodat!"
+                    except sqlite3.IntegrityError:
+                        QMessageBox.critical(self, "Greška", f"Voz broj {broj} već postoji!")
+                        return
+                novi = procitaj_vozove_po_broju(cursor, [broj]).get(broj)
+                    
+            # OSVEŽI SAMO PROMENJEN RED I FILTERE
+            neispravni = self.osvezi_posle_izmene_voza(stari, novi)
+            if neispravni:
+                # Izmena je sačuvana, ali turnusi sa ovim vozom više ne prolaze proveru
+                redovi = IzvestajProvere(len(neispravni), neispravni).redovi()
+                QMessageBox.critical(self, "Neispravni turnusi",
+                                     f"{poruka}\n\nPosle ove izmene sledeći turnusi nisu ispravni "
+                                     f"(označeni su u tabeli turnusa):\n\n" + self._redovi_izvestaja(redovi))
+            else:
+                QMessageBox.information(self, "Uspeh", poruka)
+            self.ocisti_formu()
+            
+            self.btn_dodaj.setVisible(True)
+            self.btn_azuriraj.setVisible(False)
+            self.btn_odustani.setVisible(False)
+            self.trenutni_broj_za_izmenu = None
+            
+        except ValueError as e:
+            QMessageBox.critical(self, "Greška u unosu", str(e))
+        except Exception as e:
+            QMessageBox.critical(self, "Greška", f"Greška pri čuvanju: {e}")
+
+    def _greska_izmene_voza(self, cursor, broj):
+        """Poruka kad izmena voza trenutni_broj_za_izmenu u broj ne uspe zbog ograničenja baze."""
+        if broj != self.trenutni_broj_za_izmenu and postojeci_vozovi(cursor, [broj]):
+            return f"Voz broj {broj} već postoji!"
+        # Strani ključevi su uključeni: broj voza koji je deo turnusa ne može da se promeni
+        return (f"Voz {self.trenutni_broj_za_izmenu} je deo turnusa, pa mu se broj ne može promeniti. "
+                "Prvo ga uklonite iz turnusa.")
+
+    def obrisi_voz(self, broj_voza):
+        """Briše voz iz baze."""
+        potvrda = QMessageBox.question(self, "Potvrda", f"Obriši voz {broj_voza}?")
+        if potvrda == QMessageBox.StandardButton.Yes:
+            try:
+                with self.baza.transakcija() as cursor:
+                    stari = procitaj_vozove_po_broju(cursor, [broj_voza]).get(broj_voza)
+                    cursor.execute("DELETE FROM vozovi WHERE broj_voza = ?", (broj_voza,))
+            except sqlite3.IntegrityError:
+                # Strani ključevi su uključeni: voz koji je deo turnusa ne može da se obriše
+                QMessageBox.critical(self, "Greška", f"Voz {broj_voza} je deo turnusa. Prvo ga uklonite iz turnusa.")
+                return
+            
+            # OSVEŽI SAMO PROMENJEN RED I FILTERE
+            if stari is not None:
+                self.osvezi_posle_izmene_voza(stari, None)
+            self.ocisti_formu()
+            QMessageBox.information(self, "Obrađeno", f"Voz {broj_voza} obrisan.")
+
+    def ocisti_formu(self):
+        """Čisti sva input polja u formi za vozove."""
+        self.broj_voza_input.clear()
+        self.pocetna_input.clear()
+        self.krajnja_input.clear()
+        self.sat_p_input.clear()
+        self.minut_p_input.clear()
+        self.sat_d_input.clear()
+        self.minut_d_input.clear()
+        self.serija_input.clear()
+        self.status_input.clear()
+        self.sekcija_input.clear()
+
+    # --- OPERACIJE SA TURNUSIMA ---
+    def proveri_turnus(self):
+        """Proverava ispravnost unetih podataka za turnus."""
+        self.status_label.setText("")
+        self.status_label.setStyleSheet("padding: 10px; background-color: #f0f0f0; border-radius: 5px;")
+        
+        naziv = self.naziv_turnusa_input.text().strip()
+        serija_vv = self.serija_vv_input.text().strip()
+        vozovi_text = self.vozovi_input.text().strip()
+        sekcija = self.sekcija_voza_input.text().strip()
+        
+        # ✅ Provera da li su sva polja prazna
+        if not any([naziv, serija_vv, vozovi_text, sekcija]):
+            self.btn_proveri.setText("Sačuvaj ažuriran turnus")
+            try:
+                self.btn_proveri.clicked.disconnect()
+            except TypeError:
+                pass
+            self.btn_odustani_turnus.setVisible(True)
+            self.status_label.setText("Polja su prazna. Kliknite 'Odustani od uređivanja' za izlaz iz režima uređivanja.")
+            self.status_label.setStyleSheet("padding: 10px; background-color: #ffeb99; border-radius: 5px;")
+            return
+            
+        try:
+            proveri_obavezna_polja([
+                ("Naziv turnusa", naziv),
+                ("Vozovi u turnusu", vozovi_text),
+                ("Sekcija za vuču vozova", sekcija),
+                ("Serija VV", serija_vv)
+            ])
+            proveri_turnus(self.baza.cursor(), razdvoji_vozove(vozovi_text), serija_vv)
+        except ValueError as e:
+            self.status_label.setText(str(e))
+            self.status_label.setStyleSheet("padding: 10px; background-color: #ffcccc; border-radius: 5px;")
+            self.btn_odustani_turnus.setVisible(True)
+            return
+
+        # Ako nema grešaka → aktiviraj "Sačuvaj ažuriran turnus"
+        self.status_label.setText(f"Turnus '{naziv}' je ispravan! Možete ga sačuvati.")
+        self.status_label.setStyleSheet("padding: 10px; background-color: #ddffdd; border-radius: 5px;")
+        self.btn_proveri.setText("Sačuvaj ažuriran turnus")
+        try:
+            self.btn_proveri.clicked.disconnect()
+        except TypeError:
+            pass
+        self.btn_proveri.clicked.connect(self.sacuvaj_izmene_turnusa)
+        self.btn_odustani_turnus.setVisible(True)
+
+    def proveri_sve_turnuse(self):
+        """Ponovo čita sve vozove i turnuse, proverava ih i prikazuje izveštaj."""
+        self.btn_proveri_sve.setEnabled(False)
+        self.ucitaj_indeks_turnusa(prikazi_izvestaj=True)
+
+    def ucitaj_indeks_turnusa(self, prikazi_izvestaj=False):
+        """Učitava indeks turnusa u pozadini, proverava sve turnuse i označava neispravne u tabeli."""
+        self.prikazi_proveru_svih = self.prikazi_proveru_svih or prikazi_izvestaj
+        def ucitaj(cursor):
+            indeks = IndeksTurnusa.ucitaj(cursor)
+            # Vozovi dodeljeni u više turnusa ulaze u nalaze provere
+            indeks.pratioci.append(IndeksVoznji(indeks))
+            return indeks, indeks.proveri_sve()
+        self.ucitavac.pokreni('indeks', ucitaj, self._primi_indeks_turnusa)
+
+    def _primi_indeks_turnusa(self, rezultat):
+        self.indeks_turnusa, izvestaj = rezultat
+        # Plan pregleda je vezan za stari indeks; pravi se ponovo pri sledećem prikazu
+        self.plan_pregleda = None
+        self.turnusi_model.postavi_neispravne(
+            {r.turnus_id: "\n".join(n.poruka for n in r.nalazi) for r in izvestaj.neispravni})
+        if not self.prikazi_proveru_svih:
+            return
+        self.prikazi_proveru_svih = False
+        self.btn_proveri_sve.setEnabled(True)
+        if izvestaj.ispravan:
+            QMessageBox.information(self, "Provera turnusa", izvestaj.sazetak())
+            return
+        QMessageBox.critical(self, "Provera turnusa",
+                             izvestaj.sazetak() + "\nNeispravni turnusi su označeni u tabeli.\n\n" +
+                             self._redovi_izvestaja(izvestaj.redovi()))
+
+    @staticmethod
+    def _redovi_izvestaja(redovi):
+        """Redovi izveštaja provere za poruku, najviše MAX_REDOVA_PROVERE."""
+        redovi = list(redovi)
+        if len(redovi) > MAX_REDOVA_PROVERE:
+            redovi = redovi[:MAX_REDOVA_PROVERE] + [f"... (još {len(redovi) - MAX_REDOVA_PROVERE} redova)"]
+        return "\n".join(redovi)
+
+    def prikazi_potrebu_lokomotiva(self):
+        """Računa u pozadini potrebu lokomotiva po sekciji i seriji VV i prikazuje je."""
+        self.btn_potreba_lokomotiva.setEnabled(False)
+        self.ucitavac.pokreni('potreba', procitaj_potrebu_lokomotiva, self._primi_potrebu_lokomotiva)
+
+    def _primi_potrebu_lokomotiva(self, redovi):
+        self.btn_potreba_lokomotiva.setEnabled(True)
+        if not redovi:
+            QMessageBox.information(self, "Potreba lokomotiva", "Nema turnusa sa vozovima.")
+            return
+        tekst = [f"Sekcija {sekcija or '-'}, serija {serija_vv or '-'}: {lokomotiva} lok. "
+                 f"({turnusa} turnusa, {vozova} vozova)"
+                 for sekcija, serija_vv, turnusa, vozova, lokomotiva in redovi]
+        ukupno = sum(red[4] for red in redovi)
+        QMessageBox.information(self, "Potreba lokomotiva",
+                                f"Ukupno potrebno lokomotiva: {ukupno}\n"
+                                "(turnus sa ciklusom od N dana traži N lokomotiva)\n\n" +
+                                self._redovi_izvestaja(tekst))
+
+    def prikazi_plan_pregleda(self):
+        """Prikazuje plan kontrolnih pregleda za tekući mesec.
+
+        Plan se pravi jednom (uz evidenciju pregleda iz baze), a posle izmena voza ili
+        turnusa se ponovo računaju samo pogođeni turnusi.
+        """
+        if self.indeks_turnusa is None or self.ucitavac.u_toku('indeks'):
+            QMessageBox.information(self, "Plan pregleda", "Turnusi se još učitavaju, pokušajte ponovo.")
+            return
+        danas = date.today()
+        if self.plan_pregleda is not None and self.plan_pregleda.od == danas.replace(day=1):
+            self._prikazi_plan_pregleda()
+            return
+        self.btn_plan_pregleda.setEnabled(False)
+        def ucitaj(cursor):
+            return procitaj_poslednje_preglede(cursor), procitaj_km_vozova(cursor), procitaj_vozila(cursor)
+        self.ucitavac.pokreni('pregledi', ucitaj, self._primi_poslednje_preglede)
+
+    def _primi_poslednje_preglede(self, rezultat):
+        poslednji, km_vozova, vozila = rezultat
+        self.btn_plan_pregleda.setEnabled(True)
+        if self.indeks_turnusa is None:
+            return
+        danas = date.today()
+        self.plan_pregleda = PlanPregleda(self.indeks_turnusa, danas.year, danas.month, poslednji,
+                                          km_vozova=km_vozova, vozila=vozila)
+        self._prikazi_plan_pregleda()
+
+    def _prikazi_plan_pregleda(self):
+        plan = self.plan_pregleda
+        tekst = plan.sazetak()
+        bez_intervala = plan.bez_intervala()
+        if bez_intervala:
+            tekst += f"\nSerije VV bez intervala pregleda: {', '.join(bez_intervala)}"
+        if plan.bez_evidencije_po_turnusu:
+            tekst += ("\nMestima bez vozila dodelite vozilo, a za vozila bez evidencije upišite poslednji "
+                      "izvršen pregled (python -m jezgro.odrzavanje --vozilo/--izvrsen).")
+        if plan.bez_km_po_turnusu:
+            tekst += ("\nZa vozove bez km upišite rastojanja (python -m jezgro.kilometraza); kružni vozovi "
+                      "(ista početna i krajnja stanica) nemaju km iz rastojanja.")
+        QMessageBox.information(self, "Plan pregleda", tekst + "\n\n" + self._redovi_izvestaja(plan.redovi()))
+
+    def proveri_turnuse_u_indeksu(self, turnus_ids):
+        """Ponovo proverava date turnuse nad indeksom i osvežava oznake; vraća neispravne (RezultatTurnusa)."""
+        rezultati = self.indeks_turnusa.proveri_turnuse(turnus_ids)
+        for rezultat in rezultati:
+            self.turnusi_model.oznaci_turnus(
+                rezultat.turnus_id, "\n".join(n.poruka for n in rezultat.nalazi) if rezultat.nalazi else None)
+        return [rezultat for rezultat in rezultati if rezultat.nalazi]
+
+    def sacuvaj_izmene_turnusa(self):
+        """Čuva novi turnus ili ažurira postojeći."""
+        naziv = self.naziv_turnusa_input.text().strip()
+        serija_vv = self.serija_vv_input.text().strip()
+        vozovi_text = self.vozovi_input.text().strip()
+        sekcija = self.sekcija_voza_input.text().strip()
+        
+        if not naziv:
+            QMessageBox.critical(self, "Greška", "Naziv turnusa je obavezan!")
+            return
+            
+        vozovi = razdvoji_vozove(vozovi_text)
+        if not vozovi:
+            QMessageBox.critical(self, "Greška", "Morate uneti bar jedan voz!")
+            return
+            
+        try:
+            with self.baza.transakcija() as cursor:
+                stari = None
+                if self.trenutni_turnus_za_izmenu is not None:
+                    stari = procitaj_turnus(cursor, self.trenutni_turnus_za_izmenu)
+                    turnus_id = self.trenutni_turnus_za_izmenu
+                    cursor.execute("UPDATE turnusi SET naziv = ?, serija_vv = ?, sekcija = ? WHERE id = ?",
+                                   (naziv, serija_vv, sekcija, self.trenutni_turnus_za_izmenu))
+                    upisi_vozove_turnusa(cursor, turnus_id, vozovi)
+                    poruka = f"Turnus '{naziv}' uspešno ažuriran!"
+                else:
+                    cursor.execute("SELECT id FROM turnusi WHERE naziv = ?", (naziv,))
+                    if cursor.fetchone():
+                        QMessageBox.critical(self, "Greška", f"Turnus '{naziv}' već postoji!")
+                        return
+                    cursor.execute("INSERT INTO turnusi (naziv, serija_vv, sekcija) VALUES (?, ?, ?)",
+                                   (naziv, serija_vv, sekcija))
+                    cursor.execute("SELECT id FROM turnusi WHERE naziv = ?", (naziv,))
+                    turnus_id = cursor.fetchone()[0]
+                    upisi_vozove_turnusa(cursor, turnus_id, vozovi)
+                    poruka = f"Turnus '{naziv}' uspešno dodat!"
+                novi = procitaj_turnus(cursor, turnus_id)
+            
+            # OSVEŽI SAMO PROMENJEN RED I FILTERE
+            self.osvezi_posle_izmene_turnusa(stari, novi)
+            QMessageBox.information(self, "Uspeh", poruka)
+            
+            self.naziv_turnusa_input.clear()
+            self.serija_vv_input.clear()
+            self.vozovi_input.clear()
+            self.sekcija_voza_input.clear()
+            self.status_label.setText("")
+            self.btn_proveri.setText("Proveri turnus")
+            try:
+                self.btn_proveri.clicked.disconnect()
+            except TypeError:
+                pass
+            self.btn_proveri.clicked.connect(self.proveri_turnus)
+            self.btn_odustani_turnus.setVisible(False)
+            self.trenutni_turnus_za_izmenu = None
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Greška", f"Greška pri čuvanju: {e}")
+
+    def odustani_od_uredjivanja_turnusa(self):
+        """Odustaje od uređivanja turnusa i vraća formu u početno stanje."""
+        self.naziv_turnusa_input.clear()
+        self.serija_vv_input.clear()
+        self.vozovi_input.clear()
+        self.sekcija_voza_input.clear()
+        self.status_label.setText("")
+        
+        try:
+            self.btn_proveri.clicked.disconnect()
+        except TypeError:
+            pass
+            
+        self.btn_proveri.setText("Proveri turnus")
+        self.btn_proveri.clicked.connect(self.proveri_turnus)
+        self.btn_odustani_turnus.setVisible(False)
+        self.trenutni_turnus_za_izmenu = None
+
+    def uredi_turnus(self, turnus):
+        """Postavlja podatke turnusa u formu za uređivanje."""
+        cursor = self.baza.cursor()
+        cursor.execute("""
+            SELECT v.broj_voza
+            FROM turnus_vozovi tv
+            JOIN vozovi v ON tv.broj_voza = v.broj_voza
+            WHERE tv.turnus_id = ?
+            ORDER BY tv.redosled
+        """, (turnus[0],))
+        vozovi = [v[0] for v in cursor.fetchall()]
+        vozovi_str = ", ".join(vozovi)
+        
+        cursor.execute("SELECT sekcija, serija_vv FROM turnusi WHERE id = ?", (turnus[0],))
+        row = cursor.fetchone()
+        sekcija_val = row[0] or "" if row else ""
+        serija_vv_val = row[1] or "" if row else ""
+        
+        self.naziv_turnusa_input.setText(turnus[1])
+        self.serija_vv_input.setText(serija_vv_val)
+        self.vozovi_input.setText(vozovi_str)
+        self.sekcija_voza_input.setText(sekcija_val)
+        self.trenutni_turnus_za_izmenu = turnus[0]
+        
+        self.btn_proveri.setText("Proveri turnus")
+        try:
+            self.btn_proveri.clicked.disconnect()
+        except TypeError:
+            pass
+        self.btn_proveri.clicked.connect(self.proveri_turnus)
+        self.btn_odustani_turnus.setVisible(True)
+
+    def obrisi_turnus(self, turnus):
+        """Briše turnus iz baze."""
+        potvrda = QMessageBox.question(self, "Potvrda", f"Obriši turnus '{turnus[1]}'?")
+        if potvrda == QMessageBox.StandardButton.Yes:
+            try:
+                with self.baza.transakcija() as cursor:
+                    stari = procitaj_turnus(cursor, turnus[0])
+                    cursor.execute("DELETE FROM turnus_vozovi WHERE turnus_id = ?", (turnus[0],))
+                    cursor.execute("DELETE FROM turnusi WHERE id = ?", (turnus[0],))
+            except sqlite3.Error as e:
+                QMessageBox.critical(self, "Greška", f"Turnus '{turnus[1]}' nije obrisan: {e}")
+                return
+            QMessageBox.information(self, "Obrađeno", f"Turnus '{turnus[1]}' obrisan.")
+            # OSVEŽI SAMO PROMENJEN RED I FILTERE
+            if stari is not None:
+                self.osvezi_posle_izmene_turnusa(stari, None)
+
+    # --- GRAFIČKI PRIKAZ (GRAFIK) ---
+
+    def prikazi_grafik_turnusa(self, turnus):
+        """Prikazuje grafik za određeni turnus."""
+        self.tabs.setCurrentIndex(2)
+        
+        turnus_id_trazeni = turnus[0]
+        panel = self.grafik_turnusi_filter
+        panel.postavi_cekirane(
+            naziv for naziv in panel.model.vrednosti() if panel.model.podatak(naziv)[0] == turnus_id_trazeni
+        )
+             
+        self.crtaj_grafik()
+
+    def _cekiraj_turnuse_u_grafiku(self, polje, filter_panel):
+        """Čekira turnuse u grafiku čija je sekcija (polje 1) ili serija VV (polje 2) izabrana u panelu."""
+        izabrane = set(filter_panel.cekirane_vrednosti())
+        panel = self.grafik_turnusi_filter
+        panel.postavi_cekirane(
+            naziv for naziv in panel.model.vrednosti() if panel.model.podatak(naziv)[polje] in izabrane
+        )
+
+    def filter_turnuse_po_sekciji(self):
+        """Filtrira turnuse u grafiku po sekciji."""
+        self._cekiraj_turnuse_u_grafiku(1, self.grafik_sekcije_filter)
+
+    def filter_turnuse_po_seriji_vv(self):
+        """Filtrira turnuse u grafiku po seriji VV."""
+        self._cekiraj_turnuse_u_grafiku(2, self.grafik_serije_vv_filter)
+
+    def crtaj_grafik(self):
+        """Crtanje grafičkog prikaza turnusa.
+
+        Već nacrtani turnusi se uzimaju iz keša (grafik_kes), a u pozadini se učitavaju
+        samo vozovi turnusa kojih u kešu nema.
+        """
+        panel = self.grafik_turnusi_filter
+        # Turnusi idu redom po id-ju, kao i ranije iz upita
+        turnus_ids = sorted(panel.model.podatak(naziv)[0] for naziv in panel.cekirane_vrednosti())
+        nedostaju = [turnus_id for turnus_id in turnus_ids if turnus_id not in self.grafik_kes]
+        if not nedostaju:
+            self.ucitavac.otkazi('grafik')
+            self._rasporedi_grafik(turnus_ids)
+            return
+        self.ucitavac.pokreni(
+            'grafik', lambda cursor: procitaj_vozove_za_grafik(cursor, nedostaju),
+            lambda podaci: self._nacrtaj_grafik(turnus_ids, nedostaju, podaci)
+        )
+
+    def _nacrtaj_grafik(self, turnus_ids, nedostaju, podaci):
+        """Pravi stavke za nove turnuse iz redova (turnus_id, redosled, broj_voza, ...) i raspoređuje grafik."""
+        for turnus_id, vozovi in vozovi_po_turnusu(podaci).items():
+            self.grafik_kes[turnus_id] = TurnusGraphicItem(turnus_id, vozovi)
+        # Turnus bez vozova se ne crta (ali se pamti da se ne bi ponovo učitavao)
+        for turnus_id in nedostaju:
+            self.grafik_kes.setdefault(turnus_id, None)
+        self._rasporedi_grafik(turnus_ids)
+
+    def _rasporedi_grafik(self, turnus_ids):
+        """Postavlja na scenu turnuse iz keša redom, jedan ispod drugog.
+
+        Skidaju se i dodaju samo turnusi koji su se promenili, a pomeraju se samo oni
+        čiji se red promenio; stavke turnusa se ne prave ponovo.
+        """
+        prikazani = [turnus_id for turnus_id in turnus_ids if self.grafik_kes.get(turnus_id) is not None]
+        indeksi = {turnus_id: indeks for indeks, turnus_id in enumerate(prikazani)}
+        for turnus_id, stavka in list(self.grafik_na_sceni.items()):
+            if turnus_id not in indeksi or self.grafik_kes.get(turnus_id) is not stavka:
+                self.scene.removeItem(stavka)
+                del self.grafik_na_sceni[turnus_id]
+        for turnus_id, indeks in indeksi.items():
+            stavka = self.grafik_kes[turnus_id]
+            if turnus_id not in self.grafik_na_sceni:
+                self.scene.addItem(stavka)
+                self.grafik_na_sceni[turnus_id] = stavka
+            y = y_turnusa(indeks)
+            if stavka.y() != y:
+                stavka.setY(y)
+
+        # Pozadina (mreža sati i linije puta) i granice scene prate broj turnusa
+        self.scene.postavi_broj_turnusa(len(prikazani))
+        max_visina = y_turnusa(len(prikazani)) + 50
+        self.scene.setSceneRect(0, 0, 25 * SIRINA_SATA, max_visina)
+
+    def zaboravi_turnuse_u_grafiku(self, turnus_ids):
+        """Izbacuje turnuse iz keša grafika da bi se pri sledećem crtanju učitali ponovo."""
+        for turnus_id in turnus_ids:
+            self.grafik_kes.pop(turnus_id, None)
+
+    # --- ŠTAMPA TURNUSA ---
+
+    def on_tab_promenjen(self, indeks):
+        """Osvežava pregled za štampu kad se otvori tab 'Stampa turnusa'."""
+        if self.tabs.widget(indeks) is self.tab_stampa:
+            self.osvezi_pregled_stampe()
+
+    def turnusi_za_stampu(self):
+        """Id-jevi turnusa čekiranih u tabu 'Pregled Grafika', po nazivu."""
+        panel = self.grafik_turnusi_filter
+        return [panel.model.podatak(naziv)[0] for naziv in panel.cekirane_vrednosti()]
+
+    def naslov_za_stampu(self):
+        """Naslov strane sa godinom reda vožnje iz taba 'Pregled Grafika'."""
+        return naslov_stampe(self.godina_za_grafik)
+
+    def osvezi_pregled_stampe(self):
+        """Prikazuje izabranu stranu za štampu (čita iz baze samo turnuse te strane)."""
+        turnus_ids = self.turnusi_za_stampu()
+        po_strani = self.turnusa_po_strani_input.value()
+        ukupno = broj_strana(len(turnus_ids), po_strani)
+        self.stampa_strana_input.blockSignals(True)
+        self.stampa_strana_input.setRange(1, max(ukupno, 1))
+        self.stampa_strana_input.blockSignals(False)
+        self.stampa_scene.clear()
+        if not ukupno:
+            self.stampa_info_label.setText("Nije izabran nijedan turnus.")
+            return
+        self.stampa_info_label.setText(f"Izabrano turnusa: {len(turnus_ids)}, strana: {ukupno}")
+        strana = self.stampa_strana_input.value()
+        pocetak = (strana - 1) * po_strani
+        turnusi = procitaj_stranu(self.baza.cursor(), turnus_ids[pocetak:pocetak + po_strani])
+        stavka = StranaStampe(turnusi, po_strani, self.naslov_za_stampu(), strana, ukupno)
+        self.stampa_scene.addItem(stavka)
+        self.stampa_scene.setSceneRect(stavka.boundingRect())
+
+    def _izvezi_grafik(self, izvoz, filter_fajla, ekstenzija):
+        """Zajednički deo izvoza u PDF/SVG: izbor fajla, izvoz i poruka o rezultatu."""
+        turnus_ids = self.turnusi_za_stampu()
+        if not turnus_ids:
+            QMessageBox.critical(self, "Greška", "Čekirajte turnuse u tabu 'Pregled Grafika'.")
+            return
+        putanja, _ = QFileDialog.getSaveFileName(self, "Izvoz grafika", f"grafik{ekstenzija}", filter_fajla)
+        if not putanja:
+            return
+        if not os.path.splitext(putanja)[1]:
+            putanja += ekstenzija
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            rezultat = izvoz(self.baza.cursor(), turnus_ids, putanja, self.turnusa_po_strani_input.value(),
+                             self.naslov_za_stampu(), lambda strana, ukupno: QApplication.processEvents())
+        except Exception as e:
+            QMessageBox.critical(self, "Greška", f"Greška pri izvozu grafika: {e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        return rezultat
+
+    def izvezi_grafik_pdf(self):
+        """Izvozi čekirane turnuse u PDF (A4 strane)."""
+        strana = self._izvezi_grafik(izvezi_pdf, "PDF (*.pdf)", ".pdf")
+        if strana:
+            QMessageBox.information(self, "Izvoz", f"Grafik je izvezen u PDF ({strana} str.).")
+
+    def izvezi_grafik_svg(self):
+        """Izvozi čekirane turnuse u SVG, jedan fajl po A4 strani."""
+        fajlovi = self._izvezi_grafik(izvezi_svg, "SVG (*.svg)", ".svg")
+        if fajlovi:
+            QMessageBox.information(self, "Izvoz", f"Grafik je izvezen u SVG ({len(fajlovi)} fajl/ova).")
+
+    def stampaj_sve_turnuse(self):
+        """Izvozi sve turnuse (po sekciji, seriji VV i nazivu) u jedan PDF, crtajući strane u više procesa."""
+        putanja, _ = QFileDialog.getSaveFileName(
+            self, "Štampa svih turnusa", f"grafik {self.godina_za_grafik}.pdf".replace("/", "-"), "PDF (*.pdf)"
+        )
+        if not putanja:
+            return
+        if not os.path.splitext(putanja)[1]:
+            putanja += ".pdf"
+        turnus_ids = procitaj_turnuse_za_stampu(self.baza.cursor())
+        po_strani = self.turnusa_po_strani_input.value()
+        napredak_dialog = QProgressDialog("Crtanje strana...", None, 0, broj_strana(len(turnus_ids), po_strani), self)
+        napredak_dialog.setWindowTitle("Štampa svih turnusa")
+        napredak_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        napredak_dialog.setMinimumDuration(0)
+
+        def napredak(gotovo, ukupno):
+            napredak_dialog.setValue(gotovo)
+            napredak_dialog.setLabelText(f"Strana {gotovo}/{ukupno}")
+            QApplication.processEvents()
+
+        try:
+            strana = izvezi_pdf_paralelno(self.baza.putanja, turnus_ids, putanja, po_strani,
+                                          self.naslov_za_stampu(), napredak=napredak)
+        except Exception as e:
+            QMessageBox.critical(self, "Greška", f"Greška pri štampi turnusa: {e}")
+            return
+        finally:
+            napredak_dialog.close()
+        QMessageBox.information(self, "Štampa", f"Izvezeno {len(turnus_ids)} turnusa na {strana} strana.")
+
+    def snimi_godinu_za_grafik(self):
+        """Čuva trenutno unetu godinu u atribut i fajl."""
+        godina = self.godina_input.text().strip()
+        self.godina_za_grafik = godina
+        # Čuvanje u tekstualni fajl
+        try:
+            with open("data/godina_grafik.txt", "w", encoding="utf-8") as f:
+                f.write(godina)
+        except Exception as e:
+            log.warning("Greška pri čuvanju godine za grafik: %s", e)
+
+    def ucitaj_godinu_za_grafik(self):
+        """Učitava prethodno sačuvanu godinu iz fajla."""
+        try:
+            with open("data/godina_grafik.txt", "r", encoding="utf-8") as f:
+                godina = f.read().strip()
+                self.godina_za_grafik = godina
+                # Ako je input već inicijalizovan (nakon što se kreira UI), ažuriraj ga
+                # Proveri da li atribut postoji pre nego što ga koristiš
+                if hasattr(self, 'godina_input') and self.godina_input:
+                    self.godina_input.setText(godina)
+        except FileNotFoundError:
+            # Ako fajl ne postoji, koristi prazan string ili podrazumevanu vrednost
+            self.godina_za_grafik = ""
+            # Isto, ažuriraj input samo ako postoji
+            if hasattr(self, 'godina_input') and self.godina_input:
+                self.godina_input.setText("")
+        except Exception as e:
+            log.warning("Greška pri učitavanju godine za grafik: %s", e)
+
+# --- POKRETANJE APLIKACIJE ---
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+    app = QApplication([])
+    window = SimpleApp()
+    window.show()
+    app.exec()
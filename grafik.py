@@ -0,0 +1,281 @@
+import math
+
+from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView, QStyleOptionGraphicsItem, QWidget
+from PyQt6.QtGui import QFont, QFontMetricsF, QPainter, QPainterPath, QPalette, QPen, QStaticText
+from PyQt6.QtCore import Qt, QLineF, QPointF, QRectF
+
+from jezgro.geometrija import (
+    GORNJA_LINIJA, MARGINA_TEKSTA, RAZMAK_LINIJA, SIRINA_SATA, VISINA_TURNUSA, Y_POCETAK, raspored_turnusa, y_turnusa
+)
+
+# Nivoi detalja (levelOfDetailFromTransform, 1.0 = bez uvećanja)
+PRAG_NATPISA = 0.6  # ispod: bez minuta, stanica, brojeva vozova i podelica na linijama puta
+PRAG_DETALJA = 0.3  # ispod: vožnje kao jedna uprošćena putanja, bez stilova linija
+MIN_VISINA_REDA_PX = 4  # linije puta se ne crtaju ako je red turnusa niži od ovoga na ekranu
+
+def nivo_detalja(painter):
+    """Nivo detalja za trenutnu transformaciju paintera (kao option.levelOfDetailFromTransform)."""
+    return QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+
+def crtaj_vremensku_osu(painter, x_sata, y, korak=1):
+    """Crta vremensku osu 00-24: liniju na y, podelice od 9px naniže i brojeve sati iznad.
+
+    x_sata(h) vraća x koordinatu sata h u koordinatama paintera; broj se piše za
+    svaki korak-ti sat (veći korak kad su sati na ekranu gusti).
+    """
+    painter.setPen(QPen(Qt.GlobalColor.black, 1.2))
+    painter.drawLine(QLineF(x_sata(0), y, x_sata(24), y))
+    painter.setPen(QPen(Qt.GlobalColor.black, 0.8))
+    for h in range(25):
+        x = x_sata(h)
+        painter.drawLine(QLineF(x, y, x, y + 9))
+    painter.setPen(Qt.GlobalColor.black)
+    painter.setFont(QFont("Arial", 8))
+    for h in range(0, 25, korak):
+        painter.drawStaticText(QPointF(x_sata(h) - 10 + MARGINA_TEKSTA, y - 30 + MARGINA_TEKSTA), staticki_tekst(f"{h:02d}"))
+
+# --- LINIJE PUTA ---
+
+OLOVKA_LINIJA = QPen(Qt.GlobalColor.black, 1.2)
+OLOVKA_PODELICA = QPen(Qt.GlobalColor.black, 0.8)
+# Na malom uvećanju linije puta se crtaju tankom linijom fiksne širine na ekranu
+OLOVKA_PUT_PREGLED = QPen(Qt.GlobalColor.gray, 0)
+
+_putanje_puta = []
+
+def _linije_puta():
+    """Putanje (linije, podelice) jednog turnusa relativno od y reda; prave se jednom."""
+    if not _putanje_puta:
+        kraj_dana = 24 * SIRINA_SATA
+        linije = QPainterPath()
+        podelice = QPainterPath()
+        # Gornja i donja linija sa podelicama od 6px za svaki sat 0-24
+        for y in (GORNJA_LINIJA, GORNJA_LINIJA + RAZMAK_LINIJA):
+            linije.moveTo(0, y)
+            linije.lineTo(kraj_dana, y)
+            for h in range(25):
+                x = h * SIRINA_SATA
+                podelice.moveTo(x, y - 3)
+                podelice.lineTo(x, y + 3)
+        _putanje_puta.extend((linije, podelice))
+    return _putanje_puta
+
+def crtaj_linije_puta(painter, lod=1.0):
+    """Crta linije puta jednog turnusa (na y=0 paintera) sa podelicama.
+
+    Ispod PRAG_NATPISA crtaju se samo linije, bez podelica. Broj vučnog vozila
+    zavisi od vozova turnusa, pa ga crta TurnusGraphicItem (raspored_turnusa).
+    """
+    linije, podelice = _linije_puta()
+    if lod < PRAG_NATPISA:
+        painter.setPen(OLOVKA_PUT_PREGLED if lod < PRAG_DETALJA else OLOVKA_LINIJA)
+        painter.drawPath(linije)
+        return
+    painter.setPen(OLOVKA_LINIJA)
+    painter.drawPath(linije)
+    painter.setPen(OLOVKA_PODELICA)
+    painter.drawPath(podelice)
+
+# --- SCENA SA STATIČKOM POZADINOM ---
+
+class GrafikScena(QGraphicsScene):
+    """Scena grafika čije se linije puta crtaju u drawBackground.
+
+    Dve linije puta sa podelicama su iste za svaki turnus, pa se ne prave kao stavke
+    scene: pozadina iscrtava (crtaj_linije_puta) samo redove turnusa koji upadaju u
+    deo koji se osvežava. Uz QGraphicsView.CacheBackground pozadina se pri
+    skrolovanju ne crta ponovo. Vremensku osu crta GrafikPogled, zakačenu na vrhu.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.broj_turnusa = 0
+        # Keširana pozadina se ne briše sama, pa mora da ima svoju boju
+        self.setBackgroundBrush(Qt.GlobalColor.white)
+
+    def postavi_broj_turnusa(self, broj):
+        """Menja broj redova turnusa u pozadini i poništava keširanu pozadinu."""
+        if broj != self.broj_turnusa:
+            self.broj_turnusa = broj
+            self.invalidate(self.sceneRect(), QGraphicsScene.SceneLayer.BackgroundLayer)
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        lod = nivo_detalja(painter)
+        if not self.broj_turnusa or lod * VISINA_TURNUSA < MIN_VISINA_REDA_PX:
+            return
+        painter.save()
+        # Samo turnusi čiji red seče deo koji se crta
+        prvi = max(0, math.floor((rect.top() - Y_POCETAK) / VISINA_TURNUSA))
+        poslednji = min(self.broj_turnusa - 1, math.floor((rect.bottom() - Y_POCETAK) / VISINA_TURNUSA))
+        painter.setFont(self.font())
+        for indeks in range(prvi, poslednji + 1):
+            y = y_turnusa(indeks)
+            painter.translate(0, y)
+            crtaj_linije_puta(painter, lod)
+            painter.translate(0, -y)
+        painter.restore()
+
+# --- STAVKE GRAFIKA ---
+
+# Stil linije vožnje po statusu voza (nepoznat status crta se punom linijom)
+STILOVI_LINIJA = {
+    'R': Qt.PenStyle.SolidLine,
+    'L': Qt.PenStyle.DashLine,
+    'RE': Qt.PenStyle.DotLine,
+    'S': Qt.PenStyle.DashDotLine,
+    'V': Qt.PenStyle.DashDotDotLine
+}
+
+# Vožnje na malom nivou detalja: puna linija od 1px na ekranu, bez obzira na uvećanje
+OLOVKA_PREGLED = QPen(Qt.GlobalColor.black, 0)
+
+# Isti natpisi (minuti, stanice, brojevi vozova) se ponavljaju, pa se QStaticText deli
+_staticki_tekstovi = {}
+
+def staticki_tekst(tekst):
+    """Vraća deljeni QStaticText za dati tekst (pravi ga pri prvom traženju)."""
+    staticki = _staticki_tekstovi.get(tekst)
+    if staticki is None:
+        staticki = _staticki_tekstovi[tekst] = QStaticText(tekst)
+    return staticki
+
+class TurnusGraphicItem(QGraphicsItem):
+    """Jedan turnus u grafiku: sve vožnje i natpisi, iscrtani u jednom paint() pozivu.
+
+    Raspored se računa jednom pri pravljenju (raspored_turnusa); linije su grupisane
+    po stilu olovke, a natpisi su deljeni QStaticText-ovi. boundingRect obuhvata sve
+    linije i natpise, pa scena preskače turnuse van vidljivog dela.
+    """
+    def __init__(self, turnus_id, vozovi):
+        super().__init__()
+        self.turnus_id = turnus_id
+        self._font = QFont()
+        linije, natpisi = raspored_turnusa(vozovi)
+
+        # Linije po stilu, da bi se svaki stil crtao jednim drawLines
+        self._linije = {}
+        for x1, x2, y, status in linije:
+            stil = STILOVI_LINIJA.get(status, Qt.PenStyle.SolidLine)
+            self._linije.setdefault(stil, []).append(QLineF(x1, y, x2, y))
+        self._olovke = {stil: QPen(Qt.GlobalColor.black, 2, stil) for stil in self._linije}
+        # Uprošćen prikaz za mali nivo detalja: sve vožnje jedna putanja, puna linija
+        self._putanja = QPainterPath()
+        for x1, x2, y, _ in linije:
+            self._putanja.moveTo(x1, y)
+            self._putanja.lineTo(x2, y)
+
+        metrika = QFontMetricsF(self._font)
+        self._natpisi = []
+        granice = QRectF()
+        for x, y, tekst in natpisi:
+            self._natpisi.append((QPointF(x, y), staticki_tekst(tekst)))
+            granice = granice.united(QRectF(x, y, metrika.horizontalAdvance(tekst), metrika.height()))
+        for x1, x2, y, _ in linije:
+            # Pola debljine olovke (2px) sa svake strane
+            granice = granice.united(QRectF(min(x1, x2) - 1, y - 1, abs(x2 - x1) + 2, 2))
+        self._granice = granice
+
+    def boundingRect(self):
+        return self._granice
+
+    def paint(self, painter, option, widget=None):
+        self.crtaj(painter, option.levelOfDetailFromTransform(painter.worldTransform()))
+
+    def crtaj(self, painter, lod=1.0):
+        """Crta turnus datim painterom (i van scene, npr. pri izvozu za štampu)."""
+        if lod < PRAG_DETALJA:
+            painter.setPen(OLOVKA_PREGLED)
+            painter.drawPath(self._putanja)
+            return
+        for stil, linije in self._linije.items():
+            painter.setPen(self._olovke[stil])
+            painter.drawLines(linije)
+        if lod < PRAG_NATPISA:
+            return
+        painter.setPen(Qt.GlobalColor.black)
+        painter.setFont(self._font)
+        for pozicija, tekst in self._natpisi:
+            painter.drawStaticText(pozicija, tekst)
+
+# --- POGLED SA UVEĆANJEM ---
+
+VISINA_OSE = 40  # px zaglavlja sa vremenskom osom iznad grafika
+MIN_UVECANJE = 0.02
+MAX_UVECANJE = 8.0
+KORAK_UVECANJA = 1.25  # po jednom "koraku" točkića miša
+
+class _OsaSati(QWidget):
+    """Zaglavlje sa vremenskom osom koje prati horizontalni pomeraj i uvećanje pogleda."""
+    def __init__(self, pogled):
+        super().__init__(pogled)
+        self.pogled = pogled
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.palette().color(QPalette.ColorRole.Base))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        transformacija = self.pogled.viewportTransform()
+        sirina_sata_px = SIRINA_SATA * transformacija.m11()
+        # Broj sata širok ~15px; na malom uvećanju piše se svaki drugi, četvrti...
+        korak = next((k for k in (1, 2, 4, 6, 12) if sirina_sata_px * k >= 24), 24)
+        crtaj_vremensku_osu(
+            painter, lambda h: transformacija.map(QPointF(h * SIRINA_SATA, 0)).x(), VISINA_OSE - 10, korak
+        )
+
+class GrafikPogled(QGraphicsView):
+    """Pogled na grafik sa uvećanjem (Ctrl + točkić) i vremenskom osom zakačenom na vrhu.
+
+    Osa je poseban widget u margini iznad viewport-a, pa ostaje na mestu pri vertikalnom
+    skrolovanju. Šta se crta na kom uvećanju određuju stavke i scena iz nivoa detalja.
+    """
+    def __init__(self, scena, parent=None):
+        super().__init__(scena, parent)
+        # Linije puta se crtaju u pozadini scene; keširaj je
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.osa = _OsaSati(self)
+        self.setViewportMargins(0, VISINA_OSE, 0, 0)
+
+    def uvecanje(self):
+        """Trenutno uvećanje (1.0 = prirodna veličina)."""
+        return self.transform().m11()
+
+    def zumiraj(self, faktor):
+        """Menja uvećanje za dati faktor, u granicama MIN_UVECANJE-MAX_UVECANJE."""
+        staro = self.uvecanje()
+        novo = min(max(staro * faktor, MIN_UVECANJE), MAX_UVECANJE)
+        if novo != staro:
+            self.scale(novo / staro, novo / staro)
+            self.osa.update()
+
+    def prikazi_ceo_grafik(self):
+        """Uvećanje pri kojem ceo grafik staje u pogled."""
+        rect = self.sceneRect()
+        if rect.isEmpty():
+            return
+        sirina = self.viewport().width() / rect.width()
+        visina = self.viewport().height() / rect.height()
+        self.zumiraj(min(sirina, visina) / self.uvecanje())
+
+    def vrati_uvecanje(self):
+        """Vraća prirodnu veličinu (100%)."""
+        self.resetTransform()
+        self.osa.update()
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            self.zumiraj(KORAK_UVECANJA ** (event.angleDelta().y() / 120))
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        if dx:
+            self.osa.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        viewport = self.viewport().geometry()
+        self.osa.setGeometry(viewport.left(), viewport.top() - VISINA_OSE, viewport.width(), VISINA_OSE)
@@ -0,0 +1,20 @@
+"""Jezgro aplikacije bez grafičkog interfejsa: pristup bazi, domenski model, provere i raspored grafika.
+
+Ne uvozi PyQt6, pa ga koriste i alati iz komandne linije, merenja i pozadinski procesi.
+"""
+from .baza import (
+    Baza, DB_PATH, KOLONE_VOZA, dodeli_vozilo, migriraj, postojeci_vozovi, procitaj_dane_ciklusa,
+    procitaj_id_turnusa, procitaj_km_turnusa, procitaj_km_vozova, procitaj_nazive_turnusa,
+    procitaj_poslednje_preglede, procitaj_potrebu_lokomotiva, procitaj_projekciju_kilometraze, procitaj_rastojanja,
+    procitaj_sastav_turnusa, procitaj_sve_vozove, procitaj_turnus, procitaj_turnuse, procitaj_turnuse_za_filter,
+    procitaj_turnuse_za_stampu, procitaj_vozila, procitaj_vozove, procitaj_vozove_po_broju, procitaj_vozove_serije,
+    procitaj_vozove_za_grafik, procitaj_vrednosti_filtera, sastavi_filter, upisi_pregled, upisi_rastojanja,
+    upisi_voz, upisi_vozove, upisi_vozove_turnusa, vozovi_po_turnusima
+)
+from .domen import MINUTA_U_DANU, Voz, dani_ciklusa, dani_puta, je_prelazni, u_minute
+from .geometrija import SIRINA_SATA, VISINA_TURNUSA, oznaka_vozila, raspored_turnusa, vozovi_po_turnusu, y_turnusa
+from .validacija import (
+    KRUG, NEMA_VOZA, SERIJA, STANICA, VREME, Nalaz, nalaz_kruga, nalazi_serije, nalazi_susednih, nalazi_turnusa,
+    proveri_obavezna_polja, proveri_rastojanje, proveri_turnus, proveri_voz, proveri_vozove_turnusa,
+    razdvoji_vozove
+)
@@ -0,0 +1,666 @@
+import json
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from .domen import Voz
+
+log = logging.getLogger(__name__)
+
+# Podrazumevana putanja do baze
+DB_PATH = "data/baza.db"
+
+# PRAGMA podešavanja koja se postavljaju jednom, pri otvaranju konekcije
+PRAGME = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -20000),  # Negativna vrednost je u KiB (~20 MB keša stranica)
+    ("temp_store", "MEMORY"),
+    ("foreign_keys", "ON"),
+)
+
+# --- KONEKCIJA KA BAZI ---
+
+class Baza:
+    """Dugotrajna konekcija ka SQLite bazi koju deli cela aplikacija."""
+    def __init__(self, putanja=DB_PATH):
+        self.putanja = putanja
+        self._conn = None
+
+    @property
+    def conn(self):
+        """Vraća otvorenu konekciju, otvara je pri prvom pristupu."""
+        if self._conn is None:
+            self._conn = self.nova_konekcija()
+        return self._conn
+
+    def nova_konekcija(self):
+        """Otvara novu konekciju sa podešenim PRAGMA vrednostima."""
+        direktorijum = os.path.dirname(self.putanja)
+        if direktorijum:
+            os.makedirs(direktorijum, exist_ok=True)
+        conn = sqlite3.connect(self.putanja)
+        for naziv, vrednost in PRAGME:
+            conn.execute(f"PRAGMA {naziv} = {vrednost}")
+        return conn
+
+    @classmethod
+    def postojeca(cls, putanja=DB_PATH):
+        """Otvara postojeću bazu i dovodi je na poslednju šemu, za alate komandne linije.
+
+        FileNotFoundError ako fajla nema, da pogrešna putanja ne napravi praznu bazu.
+        """
+        if not os.path.isfile(putanja):
+            raise FileNotFoundError(f"Baza '{putanja}' ne postoji!")
+        baza = cls(putanja)
+        baza.migriraj()
+        return baza
+
+    def migriraj(self):
+        """Dovodi šemu baze na poslednju verziju (vidi MIGRACIJE)."""
+        return migriraj(self.conn)
+
+    def cursor(self):
+        """Vraća novi kursor nad deljenom konekcijom."""
+        return self.conn.cursor()
+
+    @contextmanager
+    def transakcija(self):
+        """Izvršava blok u transakciji: commit na kraju, rollback u slučaju greške."""
+        conn = self.conn
+        try:
+            yield conn.cursor()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def zatvori(self):
+        """Zatvara konekciju (npr. pri gašenju aplikacije)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+# --- MIGRACIJE ŠEME ---
+
+def _dodaj_kolonu_ako_ne_postoji(cursor, tabela, kolona, tip):
+    """Dodaje kolonu u postojeću tabelu ako je nema (baze napravljene starijim verzijama)."""
+    cursor.execute(f"PRAGMA table_info({tabela})")
+    kolone = [red[1] for red in cursor.fetchall()]
+    if kolona not in kolone:
+        cursor.execute(f"ALTER TABLE {tabela} ADD COLUMN {kolona} {tip}")
+        log.info("Dodata kolona '%s' u tabelu '%s'", kolona, tabela)
+
+def _migracija_1_tabele(cursor):
+    """Osnovne tabele vozovi, turnusi i turnus_vozovi."""
+    # Tabela za vozove
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS vozovi (
+            broj_voza TEXT PRIMARY KEY,
+            pocetna_stanica TEXT,
+            krajnja_stanica TEXT,
+            sat_polaska INTEGER,
+            minut_polaska INTEGER,
+            sat_dolaska INTEGER,
+            minut_dolaska INTEGER,
+            status TEXT,
+            sekcija TEXT,
+            serija_vozila TEXT
+        )
+    ''')
+
+    # Tabela za turnuse
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS turnusi (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            naziv TEXT UNIQUE,
+            sekcija TEXT,
+            serija_vv TEXT
+        )
+    ''')
+    # Starije baze nemaju sve kolone (ppa.py je koristio i kolonu 'opis')
+    _dodaj_kolonu_ako_ne_postoji(cursor, "turnusi", "sekcija", "TEXT")
+    _dodaj_kolonu_ako_ne_postoji(cursor, "turnusi", "serija_vv", "TEXT")
+    _dodaj_kolonu_ako_ne_postoji(cursor, "turnusi", "opis", "TEXT")
+
+    # Tabela za veze između turnusa i voza
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS turnus_vozovi (
+            turnus_id INTEGER,
+            broj_voza TEXT,
+            redosled INTEGER,
+            PRIMARY KEY (turnus_id, broj_voza),
+            FOREIGN KEY (turnus_id) REFERENCES turnusi(id),
+            FOREIGN KEY (broj_voza) REFERENCES vozovi(broj_voza)
+        )
+    ''')
+
+def _migracija_2_indeksi(cursor):
+    """Sekundarni indeksi za filtere, DISTINCT upite, grafik i obrnutu pretragu po vozu."""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vozovi_sekcija ON vozovi(sekcija)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vozovi_serija ON vozovi(serija_vozila)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_turnusi_sekcija ON turnusi(sekcija)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_turnusi_serija_vv ON turnusi(serija_vv)")
+    # Pokriva "WHERE turnus_id IN (...) ORDER BY turnus_id, redosled" bez čitanja tabele
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_turnus_vozovi_redosled
+        ON turnus_vozovi(turnus_id, redosled, broj_voza)
+    """)
+    # Obrnuta pretraga "u kojim turnusima je voz X" (i provera stranog ključa pri brisanju voza)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_turnus_vozovi_broj
+        ON turnus_vozovi(broj_voza, turnus_id, redosled)
+    """)
+    cursor.execute("ANALYZE")
+
+def _migracija_3_pregledi(cursor):
+    """Evidencija izvršenih kontrolnih pregleda po vozilu turnusa (redni broj vozila u ciklusu)."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS pregledi (
+            turnus_id INTEGER,
+            vozilo INTEGER,
+            vrsta TEXT,
+            datum TEXT,
+            PRIMARY KEY (turnus_id, vozilo, vrsta, datum),
+            FOREIGN KEY (turnus_id) REFERENCES turnusi(id) ON DELETE CASCADE
+        )
+    """)
+
+# Kilometri voza iz rastojanja između njegove početne i krajnje stanice (u bilo kom smeru);
+# kružni voz (ista početna i krajnja stanica) nema deonicu, pa ima km NULL
+_KM_VOZA = """(
+    SELECT r.km FROM rastojanja r
+    WHERE r.od_stanice = min(NEW.pocetna_stanica, NEW.krajnja_stanica)
+        AND r.do_stanice = max(NEW.pocetna_stanica, NEW.krajnja_stanica)
+)"""
+
+def _migracija_4_kilometraza(cursor):
+    """Rastojanja između stanica i kolona km u vozovima koju održavaju okidači.
+
+    Deonica se čuva jednom, sa šiframa stanica po abecedi (od_stanice < do_stanice).
+    Okidači na vozovi upisuju km pri dodavanju voza i promeni stanica, a okidači na
+    rastojanja menjaju km svih vozova te deonice; voz bez rastojanja ima km NULL.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS rastojanja (
+            od_stanice TEXT,
+            do_stanice TEXT,
+            km REAL NOT NULL,
+            PRIMARY KEY (od_stanice, do_stanice),
+            CHECK (od_stanice < do_stanice)
+        )
+    """)
+    _dodaj_kolonu_ako_ne_postoji(cursor, "vozovi", "km", "REAL")
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS vozovi_km_dodat AFTER INSERT ON vozovi
+        BEGIN
+            UPDATE vozovi SET km = {_KM_VOZA} WHERE broj_voza = NEW.broj_voza;
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS vozovi_km_izmenjen AFTER UPDATE OF pocetna_stanica, krajnja_stanica ON vozovi
+        BEGIN
+            UPDATE vozovi SET km = {_KM_VOZA} WHERE broj_voza = NEW.broj_voza;
+        END
+    """)
+    deonica = """(pocetna_stanica = {0}.od_stanice AND krajnja_stanica = {0}.do_stanice)
+                OR (pocetna_stanica = {0}.do_stanice AND krajnja_stanica = {0}.od_stanice)"""
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS rastojanja_km_dodato AFTER INSERT ON rastojanja
+        BEGIN
+            UPDATE vozovi SET km = NEW.km WHERE {deonica.format("NEW")};
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS rastojanja_km_izmenjeno AFTER UPDATE ON rastojanja
+        BEGIN
+            UPDATE vozovi SET km = NULL WHERE {deonica.format("OLD")};
+            UPDATE vozovi SET km = NEW.km WHERE {deonica.format("NEW")};
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS rastojanja_km_obrisano AFTER DELETE ON rastojanja
+        BEGIN
+            UPDATE vozovi SET km = NULL WHERE {deonica.format("OLD")};
+        END
+    """)
+    # Vozovi jedne deonice (okidači na rastojanja)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vozovi_stanice ON vozovi(pocetna_stanica, krajnja_stanica)")
+    # Pokriva spajanje turnus_vozovi sa km vozova u zbirovima, bez čitanja tabele vozovi
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_vozovi_km ON vozovi(broj_voza, km)")
+    cursor.execute("ANALYZE")
+
+def _migracija_5_vozila(cursor):
+    """Vozila (oznaka lokomotive) na mestima ciklusa turnusa i evidencija pregleda po vozilu.
+
+    Pregled pripada vozilu, a ne turnusu: brisanje turnusa samo oslobađa mesta njegovih
+    vozila (SET NULL), a vozilo sa evidencijom pregleda ne može da se obriše (RESTRICT).
+    Pregledi iz migracije 3 (turnus i redni broj vozila) prelaze na vozila 'naziv/mesto'
+    dodeljena istom mestu, pa ih je potrebno preimenovati u stvarne oznake.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS vozila (
+            oznaka TEXT PRIMARY KEY,
+            turnus_id INTEGER REFERENCES turnusi(id) ON DELETE SET NULL,
+            mesto INTEGER CHECK (mesto >= 1),
+            UNIQUE (turnus_id, mesto)
+        )
+    """)
+    cursor.execute("""
+        INSERT OR IGNORE INTO vozila (oznaka, turnus_id, mesto)
+        SELECT DISTINCT COALESCE(t.naziv, t.id) || '/' || p.vozilo, p.turnus_id, p.vozilo
+        FROM pregledi p JOIN turnusi t ON t.id = p.turnus_id
+    """)
+    cursor.execute("""
+        CREATE TABLE pregledi_vozila (
+            vozilo TEXT REFERENCES vozila(oznaka) ON UPDATE CASCADE ON DELETE RESTRICT,
+            vrsta TEXT,
+            datum TEXT,
+            PRIMARY KEY (vozilo, vrsta, datum)
+        )
+    """)
+    cursor.execute("""
+        INSERT OR IGNORE INTO pregledi_vozila (vozilo, vrsta, datum)
+        SELECT v.oznaka, p.vrsta, p.datum
+        FROM pregledi p JOIN vozila v ON v.turnus_id = p.turnus_id AND v.mesto = p.vozilo
+    """)
+    cursor.execute("DROP TABLE pregledi")
+    cursor.execute("ALTER TABLE pregledi_vozila RENAME TO pregledi")
+
+# Redosled je bitan: verzija šeme je broj poslednje primenjene migracije (PRAGMA user_version)
+MIGRACIJE = [
+    (1, _migracija_1_tabele),
+    (2, _migracija_2_indeksi),
+    (3, _migracija_3_pregledi),
+    (4, _migracija_4_kilometraza),
+    (5, _migracija_5_vozila),
+]
+
+def migriraj(conn):
+    """Primenjuje migracije novije od verzije zapisane u bazi; vraća trenutnu verziju."""
+    verzija = conn.execute("PRAGMA user_version").fetchone()[0]
+    for broj, migracija in MIGRACIJE:
+        if broj <= verzija:
+            continue
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            migracija(cursor)
+            cursor.execute(f"PRAGMA user_version = {broj}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        verzija = broj
+    return verzija
+
+# --- FILTRIRANJE U SQL-U ---
+
+# Iznad ovog broja vrednosti filter ide kao jedan JSON niz (json_each) umesto IN (?, ?, ...)
+MAX_IN_PARAMETARA = 500
+
+def sastavi_filter(cursor, uslovi):
+    """Pravi WHERE deo upita iz liste (kolona, vrednosti).
+
+    Vrednosti None znače 'Označi sve' i taj uslov se preskače. Manji izbori
+    postaju parametrizovan IN (...), a veliki jedan parametar sa JSON nizom;
+    ništa se ne upisuje, pa filter može da se sastavi i u Baza.transakcija().
+    Vraća (where, parametri); where je prazan string ako nema uslova.
+    """
+    delovi = []
+    parametri = []
+    for kolona, vrednosti in uslovi:
+        if vrednosti is None:
+            continue
+        vrednosti = list(vrednosti)
+        if len(vrednosti) <= MAX_IN_PARAMETARA:
+            delovi.append(f"{kolona} IN ({','.join('?' * len(vrednosti))})")
+            parametri.extend(vrednosti)
+        else:
+            delovi.append(f"{kolona} IN (SELECT value FROM json_each(?))")
+            parametri.append(json.dumps(vrednosti))
+    where = " WHERE " + " AND ".join(delovi) if delovi else ""
+    return where, parametri
+
+# --- UPITI ZA PRIKAZ ---
+# Primaju kursor i vraćaju obične podatke (liste torki), pa mogu da rade i na
+# posebnoj konekciji u pozadinskoj niti (vidi ucitavac.py).
+
+# Kolone tabele vozovi redom polja domen.Voz
+KOLONE_VOZA = """broj_voza, pocetna_stanica, krajnja_stanica,
+    sat_polaska, minut_polaska, sat_dolaska, minut_dolaska,
+    serija_vozila, status, sekcija"""
+
+def procitaj_vozove(cursor, uslovi):
+    """Vozovi koji prolaze filter, kao lista Voz; uslovi su kao za sastavi_filter."""
+    where, parametri = sastavi_filter(cursor, uslovi)
+    cursor.execute(f"SELECT {KOLONE_VOZA} FROM vozovi{where}", parametri)
+    return [Voz(*red) for red in cursor.fetchall()]
+
+def vozovi_po_turnusima(cursor, where="", parametri=()):
+    """Vraća rečnik {turnus_id: [broj_voza, ...]} sa vozovima poređanim po redosledu.
+
+    Opcioni where (nad aliasom 't' za turnusi) ograničava upit na filtrirane turnuse.
+    """
+    join_turnusi = "JOIN turnusi t ON t.id = tv.turnus_id" if where else ""
+    cursor.execute(f"""
+        SELECT tv.turnus_id, tv.broj_voza
+        FROM turnus_vozovi tv
+        JOIN vozovi v ON tv.broj_voza = v.broj_voza
+        {join_turnusi}
+        {where}
+        ORDER BY tv.turnus_id, tv.redosled
+    """, parametri)
+    vozovi_po_turnusu = {}
+    for turnus_id, broj_voza in cursor.fetchall():
+        vozovi_po_turnusu.setdefault(turnus_id, []).append(broj_voza)
+    return vozovi_po_turnusu
+
+def procitaj_turnuse(cursor, uslovi):
+    """Turnusi koji prolaze filter kao (id, naziv, serija_vv, sekcija, (broj_voza, ...))."""
+    where, parametri = sastavi_filter(cursor, uslovi)
+    cursor.execute(f"SELECT t.id, t.naziv, t.serija_vv, t.sekcija FROM turnusi t{where}", parametri)
+    turnusi = cursor.fetchall()
+    # Vozovi prikazanih turnusa jednim upitom (umesto posebnog upita za svaki red)
+    vozovi_po_turnusu = vozovi_po_turnusima(cursor, where, parametri)
+    return [(t[0], t[1], t[2], t[3], tuple(vozovi_po_turnusu.get(t[0], ()))) for t in turnusi]
+
+# Vrednosti filtera kao (vrednost, broj redova); brojevi služe za inkrementalno osvežavanje
+_UPITI_FILTERA = {
+    'vozovi': "SELECT broj_voza, 1 FROM vozovi ORDER BY broj_voza",
+    'sekcije': """
+        SELECT sekcija, COUNT(*) FROM vozovi WHERE sekcija IS NOT NULL
+        GROUP BY sekcija ORDER BY sekcija
+    """,
+    'serije': """
+        SELECT serija_vozila, COUNT(*) FROM vozovi WHERE serija_vozila IS NOT NULL AND serija_vozila != ''
+        GROUP BY serija_vozila ORDER BY serija_vozila
+    """,
+    'nazivi': "SELECT naziv, COUNT(*) FROM turnusi WHERE naziv IS NOT NULL GROUP BY naziv ORDER BY naziv",
+    'sekcije_turnusi': """
+        SELECT sekcija, COUNT(*) FROM turnusi WHERE sekcija IS NOT NULL
+        GROUP BY sekcija ORDER BY sekcija
+    """,
+    'serije_vv': """
+        SELECT serija_vv, COUNT(*) FROM turnusi WHERE serija_vv IS NOT NULL AND serija_vv != ''
+        GROUP BY serija_vv ORDER BY serija_vv
+    """,
+}
+
+def procitaj_vrednosti_filtera(cursor):
+    """Vrednosti svih filtera tabova 'Vozovi' i 'Turnusi': {filter: [(vrednost, broj redova), ...]}."""
+    vrednosti = {}
+    for naziv, upit in _UPITI_FILTERA.items():
+        cursor.execute(upit)
+        vrednosti[naziv] = cursor.fetchall()
+    return vrednosti
+
+def procitaj_turnuse_za_filter(cursor):
+    """Svi turnusi kao (id, naziv, sekcija, serija_vv), po nazivu."""
+    cursor.execute("SELECT id, naziv, sekcija, serija_vv FROM turnusi ORDER BY naziv")
+    return cursor.fetchall()
+
+def procitaj_vozove_za_grafik(cursor, turnus_ids):
+    """Vozovi izabranih turnusa, po turnusu i redosledu, sa vremenima i stanicama za crtanje."""
+    where, parametri = sastavi_filter(cursor, [("tv.turnus_id", turnus_ids)])
+    cursor.execute(f"""
+        SELECT tv.turnus_id, tv.redosled, tv.broj_voza, 
+            v.pocetna_stanica, v.krajnja_stanica,
+            v.sat_polaska, v.minut_polaska, v.sat_dolaska, v.minut_dolaska, v.status
+        FROM turnus_vozovi tv
+        JOIN vozovi v ON tv.broj_voza = v.broj_voza
+        {where}
+        ORDER BY tv.turnus_id, tv.redosled
+    """, parametri)
+    return cursor.fetchall()
+
+def procitaj_nazive_turnusa(cursor, turnus_ids):
+    """Rečnik {turnus_id: naziv} za date turnuse."""
+    where, parametri = sastavi_filter(cursor, [("id", turnus_ids)])
+    cursor.execute(f"SELECT id, naziv FROM turnusi{where}", parametri)
+    return dict(cursor.fetchall())
+
+def procitaj_turnuse_za_stampu(cursor):
+    """Id-jevi svih turnusa redom za štampu: po sekciji, seriji VV i nazivu."""
+    cursor.execute("SELECT id FROM turnusi ORDER BY sekcija, serija_vv, naziv")
+    return [red[0] for red in cursor.fetchall()]
+
+def procitaj_turnus(cursor, turnus_id):
+    """Vraća red modela turnusa (id, naziv, serija_vv, sekcija, (vozovi...)) ili None."""
+    cursor.execute("SELECT id, naziv, serija_vv, sekcija FROM turnusi WHERE id = ?", (turnus_id,))
+    t = cursor.fetchone()
+    if t is None:
+        return None
+    cursor.execute("""
+        SELECT tv.broj_voza
+        FROM turnus_vozovi tv
+        JOIN vozovi v ON tv.broj_voza = v.broj_voza
+        WHERE tv.turnus_id = ?
+        ORDER BY tv.redosled
+    """, (turnus_id,))
+    return (t[0], t[1], t[2], t[3], tuple(row[0] for row in cursor.fetchall()))
+
+def procitaj_vozove_po_broju(cursor, brojevi):
+    """Rečnik {broj_voza: Voz} za date brojeve; vozova kojih nema u bazi nema ni u rečniku."""
+    where, parametri = sastavi_filter(cursor, [("broj_voza", set(brojevi))])
+    cursor.execute(f"SELECT {KOLONE_VOZA} FROM vozovi{where}", parametri)
+    return {red[0]: Voz(*red) for red in cursor.fetchall()}
+
+def procitaj_sve_vozove(cursor):
+    """Svi vozovi kao rečnik {broj_voza: Voz}, jednim upitom."""
+    cursor.execute(f"SELECT {KOLONE_VOZA} FROM vozovi")
+    return {red[0]: Voz(*red) for red in cursor.fetchall()}
+
+def procitaj_vozove_serije(cursor, sekcija, serija_vozila, samo_slobodni=False):
+    """Vozovi date sekcije i serije vozila kao lista Voz; samo_slobodni izostavlja vozove koji su već u turnusu."""
+    slobodni = " AND broj_voza NOT IN (SELECT broj_voza FROM turnus_vozovi)" if samo_slobodni else ""
+    cursor.execute(f"""
+        SELECT {KOLONE_VOZA} FROM vozovi
+        WHERE sekcija = ? AND serija_vozila = ?{slobodni}
+        ORDER BY broj_voza
+    """, (sekcija, serija_vozila))
+    return [Voz(*red) for red in cursor.fetchall()]
+
+def procitaj_sastav_turnusa(cursor):
+    """Rečnik {turnus_id: [broj_voza, ...]} svih turnusa po redosledu, bez spajanja sa vozovima.
+
+    Za razliku od vozovi_po_turnusima zadržava i brojeve vozova kojih nema u tabeli
+    vozovi (starije baze bez provere stranog ključa), da bi provera mogla da ih prijavi.
+    """
+    cursor.execute("SELECT turnus_id, broj_voza FROM turnus_vozovi ORDER BY turnus_id, redosled")
+    sastav = {}
+    for turnus_id, broj_voza in cursor.fetchall():
+        sastav.setdefault(turnus_id, []).append(broj_voza)
+    return sastav
+
+# --- POTREBA LOKOMOTIVA ---
+# Dani ciklusa po turnusu kao u domen.dani_ciklusa (bez okreta), jednim prolazom kroz
+# turnus_vozovi: dan više za svaku prelaznu vožnju i za svaki voz koji polazi najkasnije
+# u minutu dolaska prethodnog (LAG). Bez okreta prvi voz narednog dana uvek stiže.
+
+_DANI_CIKLUSA = """
+    WITH voznje AS (
+        SELECT tv.turnus_id,
+            v.sat_polaska * 60 + v.minut_polaska AS polazak,
+            v.sat_dolaska * 60 + v.minut_dolaska AS dolazak,
+            LAG(v.sat_dolaska * 60 + v.minut_dolaska) OVER (
+                PARTITION BY tv.turnus_id ORDER BY tv.redosled) AS pret_dolazak,
+            v.km, v.pocetna_stanica = v.krajnja_stanica AS kruzni
+        FROM turnus_vozovi tv
+        JOIN vozovi v ON tv.broj_voza = v.broj_voza
+    ), ciklusi AS (
+        SELECT turnus_id, COUNT(*) AS vozova, SUM(km) AS km, COUNT(*) - COUNT(km) - SUM(kruzni) AS bez_km,
+            SUM(kruzni) AS kruznih,
+            1 + SUM((dolazak < polazak) + COALESCE(polazak <= pret_dolazak, 0)) AS dana
+        FROM voznje
+        GROUP BY turnus_id
+    )
+"""
+
+def procitaj_dane_ciklusa(cursor):
+    """Rečnik {turnus_id: dani ciklusa} turnusa sa bar jednim vozom (dani = potrebne lokomotive)."""
+    cursor.execute(_DANI_CIKLUSA + "SELECT turnus_id, dana FROM ciklusi")
+    return dict(cursor.fetchall())
+
+def procitaj_potrebu_lokomotiva(cursor):
+    """Potreba lokomotiva po sekciji i seriji VV, jednim upitom.
+
+    Vraća redove (sekcija, serija_vv, turnusa, vozova, lokomotiva); turnusi bez
+    vozova se ne računaju.
+    """
+    cursor.execute(_DANI_CIKLUSA + """
+        SELECT t.sekcija, t.serija_vv, COUNT(*), SUM(c.vozova), SUM(c.dana)
+        FROM ciklusi c
+        JOIN turnusi t ON t.id = c.turnus_id
+        GROUP BY t.sekcija, t.serija_vv
+        ORDER BY t.sekcija, t.serija_vv
+    """)
+    return cursor.fetchall()
+
+# --- KILOMETRAŽA ---
+# Kilometri voza su u koloni vozovi.km (vidi _migracija_4_kilometraza), pa su
+# zbirovi po turnusu i floti jedan upit preko indeksa, bez računanja po vozu.
+
+def procitaj_rastojanja(cursor):
+    """Rastojanja kao {(stanica, stanica): km}, u oba smera."""
+    cursor.execute("SELECT od_stanice, do_stanice, km FROM rastojanja")
+    rastojanja = {}
+    for od_stanice, do_stanice, km in cursor.fetchall():
+        rastojanja[(od_stanice, do_stanice)] = rastojanja[(do_stanice, od_stanice)] = km
+    return rastojanja
+
+def procitaj_km_turnusa(cursor):
+    """Dnevni km turnusa (zbir km njegovih vozova): {turnus_id: (km, vozova bez rastojanja, kružnih vozova)}.
+
+    Kružni vozovi nemaju km (vidi _KM_VOZA), pa se broje posebno: rastojanje za njih ne može da se upiše.
+    """
+    cursor.execute("""
+        SELECT turnus_id, COALESCE(SUM(km), 0), COUNT(*) - COUNT(km) - SUM(kruzni), SUM(kruzni)
+        FROM (
+            SELECT tv.turnus_id, v.km, v.pocetna_stanica = v.krajnja_stanica AS kruzni
+            FROM turnus_vozovi tv
+            JOIN vozovi v ON tv.broj_voza = v.broj_voza
+        )
+        GROUP BY turnus_id
+    """)
+    return {turnus_id: (km, bez_km, kruznih) for turnus_id, km, bez_km, kruznih in cursor.fetchall()}
+
+def procitaj_projekciju_kilometraze(cursor, dana=365):
+    """Projekcija pređenih km flote za dati broj dana po sekciji i seriji VV, jednim upitom.
+
+    Vraća redove (sekcija, serija_vv, lokomotiva, km dnevno, km za period, vozova
+    bez rastojanja, kružnih vozova bez km); lokomotive su kao u procitaj_potrebu_lokomotiva.
+    """
+    cursor.execute(_DANI_CIKLUSA + """
+        SELECT t.sekcija, t.serija_vv, SUM(c.dana), COALESCE(SUM(c.km), 0), COALESCE(SUM(c.km), 0) * ?,
+            SUM(c.bez_km), SUM(c.kruznih)
+        FROM ciklusi c
+        JOIN turnusi t ON t.id = c.turnus_id
+        GROUP BY t.sekcija, t.serija_vv
+        ORDER BY t.sekcija, t.serija_vv
+    """, (dana,))
+    return cursor.fetchall()
+
+# --- PREGLEDI VOZILA ---
+
+def procitaj_poslednje_preglede(cursor):
+    """Datum poslednjeg pregleda svake vrste po vozilu: {oznaka vozila: {vrsta: 'YYYY-MM-DD'}}."""
+    cursor.execute("SELECT vozilo, vrsta, MAX(datum) FROM pregledi GROUP BY vozilo, vrsta")
+    pregledi = {}
+    for vozilo, vrsta, datum in cursor.fetchall():
+        pregledi.setdefault(vozilo, {})[vrsta] = datum
+    return pregledi
+
+def procitaj_vozila(cursor):
+    """Vozila dodeljena turnusima: {(turnus_id, mesto u ciklusu): oznaka vozila}."""
+    cursor.execute("SELECT turnus_id, mesto, oznaka FROM vozila WHERE turnus_id IS NOT NULL")
+    return {(turnus_id, mesto): oznaka for turnus_id, mesto, oznaka in cursor.fetchall()}
+
+def procitaj_km_vozova(cursor, brojevi=None):
+    """Kilometri vozova (vozovi.km) kao {broj_voza: km}, None za voz bez rastojanja; brojevi None su svi vozovi."""
+    where, parametri = sastavi_filter(cursor, [("broj_voza", brojevi)])
+    cursor.execute(f"SELECT broj_voza, km FROM vozovi{where}", parametri)
+    return dict(cursor.fetchall())
+
+# --- UPIS ---
+# Ne potvrđuju transakciju; pozivaju se u okviru Baza.transakcija().
+
+def upisi_voz(cursor, voz, stari_broj=None):
+    """Dodaje voz, ili menja voz stari_broj ako je zadat.
+
+    Dodavanje voza čiji broj već postoji podiže sqlite3.IntegrityError.
+    """
+    if stari_broj is not None:
+        cursor.execute("""
+            UPDATE vozovi SET
+                broj_voza = ?, pocetna_stanica = ?, krajnja_stanica = ?,
+                sat_polaska = ?, minut_polaska = ?, sat_dolaska = ?, minut_dolaska = ?,
+                serija_vozila = ?, status = ?, sekcija = ?
+            WHERE broj_voza = ?
+        """, (*voz, stari_broj))
+    else:
+        cursor.execute(f"INSERT INTO vozovi ({KOLONE_VOZA}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", tuple(voz))
+
+def upisi_vozove(cursor, vozovi, azuriraj=False):
+    """Dodaje vozove jednim executemany; sa azuriraj=True postojeći vozovi (isti broj) se menjaju.
+
+    Bez azuriraj broj koji već postoji podiže sqlite3.IntegrityError za ceo paket,
+    pa pozivalac treba unapred da izdvoji postojeće (vidi postojeci_vozovi).
+    """
+    upit = f"INSERT INTO vozovi ({KOLONE_VOZA}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    if azuriraj:
+        # UPSERT umesto INSERT OR REPLACE: REPLACE briše red i ruši strani ključ iz turnus_vozovi
+        upit += """
+            ON CONFLICT(broj_voza) DO UPDATE SET
+                pocetna_stanica = excluded.pocetna_stanica, krajnja_stanica = excluded.krajnja_stanica,
+                sat_polaska = excluded.sat_polaska, minut_polaska = excluded.minut_polaska,
+                sat_dolaska = excluded.sat_dolaska, minut_dolaska = excluded.minut_dolaska,
+                serija_vozila = excluded.serija_vozila, status = excluded.status, sekcija = excluded.sekcija
+        """
+    cursor.executemany(upit, (tuple(voz) for voz in vozovi))
+
+def postojeci_vozovi(cursor, brojevi):
+    """Skup onih brojeva vozova iz datih koji već postoje u bazi."""
+    where, parametri = sastavi_filter(cursor, [("broj_voza", set(brojevi))])
+    cursor.execute(f"SELECT broj_voza FROM vozovi{where}", parametri)
+    return {red[0] for red in cursor.fetchall()}
+
+def procitaj_id_turnusa(cursor, nazivi):
+    """Rečnik {naziv: id} za turnuse sa datim nazivima koji postoje u bazi."""
+    where, parametri = sastavi_filter(cursor, [("naziv", set(nazivi))])
+    cursor.execute(f"SELECT naziv, id FROM turnusi{where}", parametri)
+    return dict(cursor.fetchall())
+
+def upisi_pregled(cursor, vozilo, vrsta, datum):
+    """Beleži izvršen pregled vozila (oznaka iz tabele vozila); datum je 'YYYY-MM-DD'.
+
+    Vozilo koje ne postoji podiže sqlite3.IntegrityError (strani ključ).
+    """
+    cursor.execute("INSERT OR IGNORE INTO pregledi (vozilo, vrsta, datum) VALUES (?, ?, ?)", (vozilo, vrsta, datum))
+
+def dodeli_vozilo(cursor, vozilo, turnus_id, mesto):
+    """Dodeljuje vozilo mestu u ciklusu turnusa (dodaje ga ako ne postoji).
+
+    Vozilo koje je do sada bilo na tom mestu ostaje bez turnusa, sa svojom evidencijom.
+    """
+    cursor.execute("UPDATE vozila SET turnus_id = NULL, mesto = NULL WHERE turnus_id = ? AND mesto = ?",
+                   (turnus_id, mesto))
+    cursor.execute("""
+        INSERT INTO vozila (oznaka, turnus_id, mesto) VALUES (?, ?, ?)
+        ON CONFLICT(oznaka) DO UPDATE SET turnus_id = excluded.turnus_id, mesto = excluded.mesto
+    """, (vozilo, turnus_id, mesto))
+
+def upisi_rastojanja(cursor, rastojanja):
+    """Dodaje ili menja rastojanja (stanica, stanica, km); km vozova tih deonica menjaju okidači."""
+    cursor.executemany("""
+        INSERT INTO rastojanja (od_stanice, do_stanice, km) VALUES (min(?1, ?2), max(?1, ?2), ?3)
+        ON CONFLICT(od_stanice, do_stanice) DO UPDATE SET km = excluded.km
+    """, rastojanja)
+
+def upisi_vozove_turnusa(cursor, turnus_id, vozovi):
+    """Zamenjuje vozove turnusa datim brojevima vozova, redosled počinje od 1."""
+    cursor.execute("DELETE FROM turnus_vozovi WHERE turnus_id = ?", (turnus_id,))
+    cursor.executemany(
+        "INSERT INTO turnus_vozovi (turnus_id, broj_voza, redosled) VALUES (?, ?, ?)",
+        ((turnus_id, broj_voza, redosled) for redosled, broj_voza in enumerate(vozovi, 1)))
@@ -0,0 +1,86 @@
+from typing import NamedTuple
+
+# --- DOMENSKI MODEL ---
+
+MINUTA_U_DANU = 24 * 60
+
+def u_minute(sat, minut):
+    """Vreme u toku dana pretvoreno u minute od ponoći."""
+    return sat * 60 + minut
+
+def je_prelazni(sat_p, min_p, sat_d, min_d):
+    """Da li vožnja prelazi ponoć (dolazak je u toku dana pre polaska)."""
+    return (sat_d < sat_p) or (sat_d == sat_p and min_d < min_p)
+
+def dani_puta(voznje, okret=0):
+    """Dana od polaska prve do polaska poslednje vožnje u nizu (vidi dani_ciklusa)."""
+    najmanje = max(okret, 1)
+    dana = 0
+    for (pret_polazak, pret_dolazak), (polazak, _) in zip(voznje, voznje[1:]):
+        # Dana do prvog polaska koji je bar najmanje minuta posle dolaska
+        dana += (pret_dolazak < pret_polazak) + max(0, -((polazak - pret_dolazak - najmanje) // MINUTA_U_DANU))
+    return dana
+
+def dani_ciklusa(voznje, okret=0):
+    """Dužina ciklusa turnusa u danima, što je i broj lokomotiva koje su mu potrebne.
+
+    voznje su (polazak, dolazak) u minutima od ponoći, redom vožnje. Dan se dodaje
+    za svaku prelaznu vožnju (dolazak narednog dana) i za svaki voz koji polazi
+    najkasnije u minutu dolaska prethodnog, ili pre isteka okreta od okret minuta
+    (voz narednog dana). Lokomotiva ponovo počinje turnus tek dan posle dolaska
+    poslednjeg voza, pa turnus koji se završava prelaznom vožnjom traje bar dva dana:
+    dan kada lokomotiva stiže posle ponoći turnus počinje druga lokomotiva.
+    """
+    if not voznje:
+        return 0
+    najmanje = max(okret, 1)
+    prvi_polazak = voznje[0][0]
+    polazak, dolazak = voznje[-1]
+    # Dani do dolaska poslednjeg voza, pa do polaska prvog voza narednog dana (ili kasnije, zbog okreta)
+    dana = dani_puta(voznje, okret) + (dolazak < polazak)
+    return dana + 1 + max(0, -((prvi_polazak + MINUTA_U_DANU - dolazak - najmanje) // MINUTA_U_DANU))
+
+class Voz(NamedTuple):
+    """Jedan voz iz tabele vozovi, kolone istim redom kao u upisi_voz."""
+    broj: str
+    pocetna: str
+    krajnja: str
+    sat_p: int
+    min_p: int
+    sat_d: int
+    min_d: int
+    serija: str = None
+    status: str = 'R'
+    sekcija: str = None
+
+    @property
+    def polazak(self):
+        """Polazak kao (sat, minut)."""
+        return (self.sat_p, self.min_p)
+
+    @property
+    def dolazak(self):
+        """Dolazak kao (sat, minut)."""
+        return (self.sat_d, self.min_d)
+
+    @property
+    def polazak_min(self):
+        return u_minute(self.sat_p, self.min_p)
+
+    @property
+    def dolazak_min(self):
+        return u_minute(self.sat_d, self.min_d)
+
+    @property
+    def prelazni(self):
+        return je_prelazni(self.sat_p, self.min_p, self.sat_d, self.min_d)
+
+    @property
+    def kruzni(self):
+        """Ista početna i krajnja stanica: voz nema deonicu, pa ni km iz rastojanja."""
+        return self.pocetna == self.krajnja
+
+    @property
+    def trajanje_min(self):
+        """Trajanje vožnje u minutima, uz prelaz preko ponoći."""
+        return (self.dolazak_min - self.polazak_min) % MINUTA_U_DANU
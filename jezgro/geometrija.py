@@ -0,0 +1,87 @@
+from .domen import dani_ciklusa, je_prelazni, u_minute
+
+# --- RASPORED GRAFIKA ---
+
+SIRINA_SATA = 60  # px po satu, osa ide od 00 do 24
+VISINA_TURNUSA = 120  # px po turnusu
+Y_POCETAK = 50  # y prvog turnusa (iznad je vremenska osa)
+GORNJA_LINIJA = 30  # gornja linija puta, relativno od y turnusa
+RAZMAK_LINIJA = 20  # razmak gornje i donje linije (~5mm)
+
+# QGraphicsTextItem crta tekst uvučen za marginu dokumenta, pa isto radi i pozadina
+MARGINA_TEKSTA = 4
+
+def y_turnusa(indeks):
+    """Vraća y koordinatu turnusa sa datim rednim brojem u grafiku."""
+    return Y_POCETAK + indeks * VISINA_TURNUSA
+
+def oznaka_vozila(vozovi):
+    """Brojevi vučnih vozila turnusa: "1", ili "1-N" kad ciklus traje N dana (vidi dani_ciklusa)."""
+    dana = dani_ciklusa([(u_minute(v['sat_p'], v['min_p']), u_minute(v['sat_d'], v['min_d'])) for v in vozovi])
+    return "1" if dana <= 1 else f"1-{dana}"
+
+def raspored_turnusa(vozovi):
+    """Računa linije i natpise jednog turnusa, relativno od vrha njegovog reda.
+
+    vozovi su rečnici sa ključevima broj, pocetna, krajnja, sat_p, min_p, sat_d, min_d
+    i status, redom vožnje. Vraća (linije, natpisi): linije su (x1, x2, y, status), a
+    natpisi (x, y, tekst) sa gornjim levim uglom teksta.
+    """
+    gornja_linija_y = GORNJA_LINIJA
+    donja_linija_y = gornja_linija_y + RAZMAK_LINIJA
+    linija_y = gornja_linija_y + 10
+    # Natpisi su pozicionirani kao nekadašnji QGraphicsTextItem-i (uvučeni za marginu)
+    tekst_gore_y = gornja_linija_y - 25 + MARGINA_TEKSTA
+    tekst_dole_y = donja_linija_y + 10 + MARGINA_TEKSTA
+    stanica_y = tekst_gore_y - 15
+    kraj_dana = 24 * SIRINA_SATA
+    pomeraj = MARGINA_TEKSTA
+
+    linije = []
+    # Brojevi vučnih vozila levo iznad gornje linije
+    natpisi = [(10 + pomeraj, gornja_linija_y - 5 + pomeraj, oznaka_vozila(vozovi))]
+    for i, voz in enumerate(vozovi):
+        x_p = u_minute(voz['sat_p'], voz['min_p']) / 60 * SIRINA_SATA
+        x_d = u_minute(voz['sat_d'], voz['min_d']) / 60 * SIRINA_SATA
+        # Prelazna vožnja (preko ponoći): dolazak je pre polaska u toku dana
+        prelazna = je_prelazni(voz['sat_p'], voz['min_p'], voz['sat_d'], voz['min_d'])
+        if prelazna:
+            # Dva segmenta: od polaska do oznake 24 i od 00 do dolaska, sa brojem voza na oba
+            linije.append((x_p, kraj_dana, linija_y, voz['status']))
+            linije.append((0, x_d, linija_y, voz['status']))
+            natpisi.append(((x_p + 25 * SIRINA_SATA) / 2 - 20 + pomeraj, tekst_gore_y, voz['broj']))
+            natpisi.append((x_d / 2 - 20 + pomeraj, tekst_gore_y, voz['broj']))
+        else:
+            linije.append((x_p, x_d, linija_y, voz['status']))
+            natpisi.append(((x_p + x_d) / 2 - 20 + pomeraj, tekst_gore_y, voz['broj']))
+        # Minuti polaska i dolaska ispod linija puta
+        natpisi.append((x_p - 10 + pomeraj, tekst_dole_y, f"{voz['min_p']:02}"))
+        natpisi.append((x_d - 10 + pomeraj, tekst_dole_y, f"{voz['min_d']:02}"))
+
+        # Stanice: polazna prvog voza, pa između dolaska voza i polaska sledećeg, i krajnja poslednjeg
+        if i == 0:
+            natpisi.append((x_p - 20 + pomeraj, stanica_y, voz['pocetna'] or ""))
+        if i == len(vozovi) - 1:
+            natpisi.append((x_d - 20 + pomeraj, stanica_y, voz['krajnja'] or ""))
+        else:
+            sledeci = vozovi[i + 1]
+            x_p_sledeci = u_minute(sledeci['sat_p'], sledeci['min_p']) / 60 * SIRINA_SATA
+            natpisi.append(((x_d + x_p_sledeci) / 2 - 20 + pomeraj, stanica_y, voz['krajnja'] or ""))
+    return linije, natpisi
+
+def vozovi_po_turnusu(podaci):
+    """Grupiše redove iz procitaj_vozove_za_grafik u {turnus_id: [voz, ...]} za raspored_turnusa."""
+    turnusi = {}
+    for red in podaci:
+        turnus_id, redosled, broj_voza, pocetna, krajnja, sat_p, min_p, sat_d, min_d, status = red
+        turnusi.setdefault(turnus_id, []).append({
+            'broj': broj_voza,
+            'pocetna': pocetna,
+            'krajnja': krajnja,
+            'sat_p': sat_p,
+            'min_p': min_p,
+            'sat_d': sat_d,
+            'min_d': min_d,
+            'status': status
+        })
+    return turnusi
@@ -0,0 +1,75 @@
+import argparse
+import csv
+import sys
+
+from .baza import Baza, DB_PATH, procitaj_projekciju_kilometraze, upisi_rastojanja
+from .validacija import proveri_rastojanje
+
+# --- RASTOJANJA IZ CSV-A ---
+
+def ucitaj_rastojanja_csv(putanja):
+    """Rastojanja iz CSV fajla sa redovima stanica;stanica;km (ili zarezima), uz opciono zaglavlje.
+
+    Podiže ValueError sa brojem reda za neispravan red.
+    """
+    with open(putanja, encoding="utf-8-sig", newline="") as f:
+        redovi = f.read().splitlines()
+    delimiter = ";" if redovi and ";" in redovi[0] else ","
+    rastojanja = []
+    for broj_reda, red in enumerate(csv.reader(redovi, delimiter=delimiter), 1):
+        if not any(polje.strip() for polje in red):
+            continue
+        if len(red) != 3:
+            raise ValueError(f"Red {broj_reda}: očekivane su tri kolone (stanica, stanica, km).")
+        try:
+            rastojanja.append(proveri_rastojanje(*red))
+        except ValueError as e:
+            if broj_reda == 1 and not rastojanja:
+                continue  # Zaglavlje
+            raise ValueError(f"Red {broj_reda}: {e}") from None
+    return rastojanja
+
+# --- PROJEKCIJA ---
+
+def main(argumenti=None):
+    """Projekcija kilometraže flote iz komandne linije (python -m jezgro.kilometraza)."""
+    parser = argparse.ArgumentParser(description="Rastojanja između stanica i projekcija pređenih km po seriji VV.")
+    parser.add_argument("--uvezi", help="CSV sa rastojanjima (stanica;stanica;km) koja se upisuju pre projekcije")
+    parser.add_argument("--dana", type=int, default=365, help="broj dana projekcije (podrazumevano 365)")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    args = parser.parse_args(argumenti)
+
+    try:
+        baza = Baza.postojeca(args.baza)
+        try:
+            if args.uvezi:
+                rastojanja = ucitaj_rastojanja_csv(args.uvezi)
+                with baza.transakcija() as cursor:
+                    upisi_rastojanja(cursor, rastojanja)
+                print(f"✅ Upisano rastojanja: {len(rastojanja)}")
+            redovi = procitaj_projekciju_kilometraze(baza.conn.cursor(), args.dana)
+        finally:
+            baza.zatvori()
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    for sekcija, serija_vv, lokomotiva, km_dnevno, km_ukupno, bez_km, kruznih in redovi:
+        tekst = (f"Sekcija {sekcija or '-'}, serija {serija_vv or '-'}: {km_ukupno:,.0f} km za {args.dana} dana "
+                 f"({km_dnevno:,.0f} km dnevno, {km_ukupno / max(lokomotiva, 1):,.0f} km po lokomotivi)")
+        if bez_km:
+            tekst += f", vozova bez rastojanja: {bez_km}"
+        if kruznih:
+            tekst += f", kružnih vozova: {kruznih}"
+        print(tekst)
+    ukupno = sum(red[4] for red in redovi)
+    bez_km = sum(red[5] for red in redovi)
+    kruznih = sum(red[6] for red in redovi)
+    print(f"✅ Ukupno za {args.dana} dana: {ukupno:,.0f} km" +
+          (f" (vozova bez rastojanja: {bez_km}, nisu uračunati)" if bez_km else ""))
+    if kruznih:
+        print(f"Kružni vozovi (ista početna i krajnja stanica) nemaju km iz rastojanja, nisu uračunati: {kruznih}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+import argparse
+import calendar
+import json
+import sqlite3
+import sys
+from collections import Counter
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from .baza import (
+    Baza, DB_PATH, dodeli_vozilo, procitaj_id_turnusa, procitaj_km_vozova, procitaj_poslednje_preglede,
+    procitaj_vozila, upisi_pregled
+)
+from .domen import dani_ciklusa
+from .provera import IndeksTurnusa
+
+# --- KONTROLNI PREGLEDI ---
+# Vozilo je jedno od N vozila turnusa sa ciklusom od N dana (vidi dani_ciklusa): svako
+# vozi ceo ciklus, pa dnevno pređe 1/N kilometara i sati svih vožnji turnusa. Evidencija
+# pregleda je po vozilu (oznaka lokomotive) dodeljenom mestu u ciklusu (vidi dodeli_vozilo).
+
+class Interval(NamedTuple):
+    """Kriterijum pregleda jedne vrste u danima, km i satima rada (None = ne važi); merodavan je prvi ispunjen.
+
+    Ugrađeni intervali zadaju samo dane i km; sati rada se zadaju kroz ucitaj_intervale.
+    """
+    vrsta: str
+    dana: int
+    km: float = None
+    sati: float = None
+
+def _intervali(*kriterijumi):
+    return tuple(Interval(*kriterijum) for kriterijum in kriterijumi)
+
+# Prema Uputstvu za održavanje vučnih vozila (dani i km); redom od najnižeg, viši pregled obuhvata niže
+_ELEKTRICNE = _intervali(("P1", 30, 23000), ("P3", 90, 69000), ("P6", 180, 138000), ("P12", 360, 216000))
+_DIZEL_661 = _intervali(("P1", 30, 15000), ("P3", 90, 45000), ("P6", 180, 90000))
+INTERVALI_PREGLEDA = {
+    '441': _ELEKTRICNE,
+    '444': _ELEKTRICNE,
+    '461': _ELEKTRICNE,
+    '661': _DIZEL_661,
+    '666': _DIZEL_661,
+}
+
+TOLERANCIJA = 0.15  # Kriterijum pregleda sme da se prekorači najviše za 15%
+
+def rad_vozila(vozovi, km_vozova=None):
+    """Za vozove turnusa (Voz, redom) vraća (broj vozila, km dnevno po vozilu, sati dnevno po vozilu).
+
+    km_vozova su {broj_voza: km} iz vozovi.km (procitaj_km_vozova); voz bez km se ne
+    procenjuje, već ne ulazi u zbir (PlanPregleda ga prijavljuje).
+    """
+    km_vozova = km_vozova or {}
+    vozila = max(1, dani_ciklusa([(voz.polazak_min, voz.dolazak_min) for voz in vozovi]))
+    km = sum(km_vozova.get(voz.broj) or 0 for voz in vozovi)
+    sati = sum(voz.trajanje_min for voz in vozovi) / 60
+    return vozila, km / vozila, sati / vozila
+
+def _perioda(interval, km_dnevno, sati_dnevno):
+    """Broj dana do pregleda i kriterijum koji ga određuje ('dana', 'km' ili 'sati')."""
+    periode = [(interval.dana, "dana")]
+    if interval.km and km_dnevno > 0:
+        periode.append((interval.km / km_dnevno, "km"))
+    if interval.sati and sati_dnevno > 0:
+        periode.append((interval.sati / sati_dnevno, "sati"))
+    dana, kriterijum = min(periode)
+    return max(1, int(dana)), kriterijum
+
+def vrste_bez_evidencije(intervali, poslednji):
+    """Vrste pregleda bez evidencije o njima i o višem pregledu (planiraj_vozilo ih ne planira)."""
+    vrste = []
+    for interval in reversed(intervali):
+        if interval.vrsta in poslednji:
+            break
+        vrste.append(interval.vrsta)
+    return vrste[::-1]
+
+def planiraj_vozilo(intervali, poslednji, km_dnevno, sati_dnevno, od, do):
+    """Pregledi jednog vozila od datuma od do datuma do (uključivo), hronološki.
+
+    poslednji su {vrsta: date} poslednjih izvršenih pregleda; viši pregled obuhvata
+    i niže, pa ih ponovo započinje. Pregled kojem je rok već prošao je na redu odmah
+    (od), a vrsta bez evidencije (vidi vrste_bez_evidencije) se ne planira, jer joj
+    rok nije poznat. Vraća (datum, vrsta, kriterijum, najkasnije, kasni).
+    """
+    periode = [_perioda(interval, km_dnevno, sati_dnevno) for interval in intervali]
+    # Poslednji pregled svake vrste, računajući i više preglede
+    pocetak = [None] * len(intervali)
+    najnoviji = None
+    for i in range(len(intervali) - 1, -1, -1):
+        datum = poslednji.get(intervali[i].vrsta)
+        if datum is not None and (najnoviji is None or datum > najnoviji):
+            najnoviji = datum
+        pocetak[i] = najnoviji
+
+    pregledi = []
+    while True:
+        rokovi = {i: pocetak[i] + timedelta(days=periode[i][0])
+                  for i in range(len(intervali)) if pocetak[i] is not None}
+        if not rokovi:
+            return pregledi
+        datum = max(min(rokovi.values()), od)
+        if datum > do:
+            return pregledi
+        # Najviši pregled koji je na redu do tog dana
+        i = max(i for i, rok in rokovi.items() if rok <= datum)
+        najkasnije = pocetak[i] + timedelta(days=int(periode[i][0] * (1 + TOLERANCIJA)))
+        pregledi.append((datum, intervali[i].vrsta, periode[i][1], najkasnije, rokovi[i] < od))
+        for j in range(i + 1):
+            pocetak[j] = datum
+
+class StavkaPlana(NamedTuple):
+    """Jedan pregled u planu: datum, mesto u ciklusu turnusa i vozilo na njemu, vrsta i kriterijum."""
+    datum: date
+    turnus_id: int
+    naziv: str
+    mesto: int
+    vozilo: str
+    vrsta: str
+    kriterijum: str
+    najkasnije: date
+    kasni: bool
+
+class PlanPregleda:
+    """Mesečni plan kontrolnih pregleda za vozila svih turnusa, nad IndeksTurnusa.
+
+    Plan se pamti po turnusu, pa se posle izmene turnusa ili voza (kad je indeks
+    već ažuriran) ponovo računaju samo pogođeni turnusi (osvezi_turnuse). Turnusi
+    čija serija VV nema intervale se ne planiraju (vidi bez_intervala), kao ni
+    mesta bez dodeljenog vozila i vrste pregleda vozila bez evidencije (vidi
+    bez_evidencije). Vozovi bez km ne ulaze u km kriterijum (vidi bez_km).
+    """
+    def __init__(self, indeks, godina, mesec, poslednji=None, intervali=None, km_vozova=None, vozila=None):
+        self.indeks = indeks
+        self.km_vozova = dict(km_vozova or {})  # {broj_voza: km} iz procitaj_km_vozova
+        self.vozila = dict(vozila or {})  # {(turnus_id, mesto): oznaka} iz procitaj_vozila
+        self.od = date(godina, mesec, 1)
+        self.do = date(godina, mesec, calendar.monthrange(godina, mesec)[1])
+        self.intervali = INTERVALI_PREGLEDA if intervali is None else intervali
+        # {oznaka vozila: {vrsta: date}} iz procitaj_poslednje_preglede
+        self.poslednji = {
+            vozilo: {vrsta: date.fromisoformat(datum) for vrsta, datum in pregledi.items()}
+            for vozilo, pregledi in (poslednji or {}).items()
+        }
+        self.po_turnusu = {}
+        self.bez_evidencije_po_turnusu = {}  # turnus_id -> [(mesto, vozilo ili None, [vrsta, ...]), ...]
+        self.bez_km_po_turnusu = {}  # turnus_id -> [broj_voza, ...]
+        self.osvezi_turnuse(indeks.turnusi)
+
+    @classmethod
+    def ucitaj(cls, cursor, godina, mesec, intervali=None):
+        return cls(IndeksTurnusa.ucitaj(cursor), godina, mesec, procitaj_poslednje_preglede(cursor), intervali,
+                   procitaj_km_vozova(cursor), procitaj_vozila(cursor))
+
+    def osvezi_turnuse(self, turnus_ids, km_vozova=None):
+        """Ponovo planira date turnuse (obrisani turnusi ispadaju iz plana).
+
+        km_vozova su km izmenjenih vozova (procitaj_km_vozova), jer ih u bazi računaju okidači.
+        """
+        self.km_vozova.update(km_vozova or {})
+        for turnus_id in list(turnus_ids):
+            stavke, bez_evidencije, bez_km = self._planiraj_turnus(turnus_id)
+            for po_turnusu, vrednost in ((self.po_turnusu, stavke),
+                                         (self.bez_evidencije_po_turnusu, bez_evidencije),
+                                         (self.bez_km_po_turnusu, bez_km)):
+                if vrednost:
+                    po_turnusu[turnus_id] = vrednost
+                else:
+                    po_turnusu.pop(turnus_id, None)
+
+    def zabelezi_pregled(self, vozilo, vrsta, datum):
+        """Beleži izvršen pregled vozila (posle upisi_pregled) i ponovo planira turnus kojem je dodeljeno."""
+        pregledi = self.poslednji.setdefault(vozilo, {})
+        if vrsta not in pregledi or pregledi[vrsta] < datum:
+            pregledi[vrsta] = datum
+        self.osvezi_turnuse({turnus_id for (turnus_id, _), oznaka in self.vozila.items() if oznaka == vozilo})
+
+    def _planiraj_turnus(self, turnus_id):
+        """Stavke plana turnusa, mesta sa vrstama pregleda bez evidencije i vozovi bez km."""
+        if turnus_id not in self.indeks.turnusi:
+            return [], [], []
+        naziv, _, serija_vv = self.indeks.turnusi[turnus_id]
+        intervali = self.intervali.get(serija_vv)
+        vozovi = [self.indeks.vozovi[broj] for broj in self.indeks.sastav.get(turnus_id, ())
+                  if broj in self.indeks.vozovi]
+        if not intervali or not vozovi:
+            return [], [], []
+        vozila, km_dnevno, sati_dnevno = rad_vozila(vozovi, self.km_vozova)
+        bez_km = [voz.broj for voz in vozovi if self.km_vozova.get(voz.broj) is None]
+        stavke = []
+        bez_evidencije = []
+        for mesto in range(1, vozila + 1):
+            vozilo = self.vozila.get((turnus_id, mesto))
+            poslednji = self.poslednji.get(vozilo, {}) if vozilo is not None else {}
+            vrste = vrste_bez_evidencije(intervali, poslednji)
+            if vrste:
+                bez_evidencije.append((mesto, vozilo, vrste))
+            for datum, vrsta, kriterijum, najkasnije, kasni in planiraj_vozilo(
+                    intervali, poslednji, km_dnevno, sati_dnevno, self.od, self.do):
+                stavke.append(StavkaPlana(datum, turnus_id, naziv, mesto, vozilo, vrsta, kriterijum, najkasnije,
+                                          kasni))
+        return stavke, bez_evidencije, bez_km
+
+    def stavke(self):
+        """Svi pregledi u mesecu po datumu, nazivu turnusa i mestu u ciklusu."""
+        return sorted((stavka for stavke in self.po_turnusu.values() for stavka in stavke),
+                      key=lambda s: (s.datum, s.naziv or "", s.mesto))
+
+    def bez_evidencije(self):
+        """Mesta sa vrstama pregleda bez evidencije, kao (naziv, mesto, vozilo ili None, [vrsta, ...]) po nazivu."""
+        return sorted(((self.indeks.turnusi[turnus_id][0] or "", mesto, vozilo, vrste)
+                       for turnus_id, mesta in self.bez_evidencije_po_turnusu.items()
+                       for mesto, vozilo, vrste in mesta), key=lambda red: red[:2])
+
+    def bez_km(self):
+        """Vozovi planiranih turnusa bez km (bez rastojanja ili kružni), kao (naziv, [broj_voza, ...]) po nazivu."""
+        return sorted((self.indeks.turnusi[turnus_id][0] or "", brojevi)
+                      for turnus_id, brojevi in self.bez_km_po_turnusu.items())
+
+    def bez_intervala(self):
+        """Serije VV turnusa za koje nisu zadati intervali pregleda."""
+        return sorted({serija_vv or "-" for _, _, serija_vv in self.indeks.turnusi.values()
+                       if serija_vv not in self.intervali})
+
+    def sazetak(self):
+        """Jedan red: mesec, broj pregleda po vrsti i koliko ih kasni."""
+        stavke = [stavka for stavke in self.po_turnusu.values() for stavka in stavke]
+        vrste = ", ".join(f"{vrsta}: {broj}" for vrsta, broj in sorted(Counter(s.vrsta for s in stavke).items()))
+        kasni = sum(stavka.kasni for stavka in stavke)
+        tekst = f"Plan pregleda za {self.od:%m.%Y}: {len(stavke)} pregleda" + (f" ({vrste})" if vrste else "")
+        if kasni:
+            tekst += f", od toga kasni {kasni}"
+        vozila = [vozilo for mesta in self.bez_evidencije_po_turnusu.values() for _, vozilo, _ in mesta]
+        if None in vozila:
+            tekst += f"; mesta bez dodeljenog vozila: {vozila.count(None)} (nisu planirana)"
+        if len(vozila) > vozila.count(None):
+            tekst += f"; vozila bez evidencije pregleda: {len(vozila) - vozila.count(None)} (nisu planirana)"
+        bez_km = [broj for brojevi in self.bez_km_po_turnusu.values() for broj in brojevi]
+        if bez_km:
+            kruznih = sum(self.indeks.vozovi[broj].kruzni for broj in bez_km)
+            tekst += f"; vozova bez km: {len(bez_km)}"
+            if kruznih:
+                tekst += f", od toga kružnih: {kruznih}"
+            tekst += " (rok po km ih ne računa)"
+        return tekst + "."
+
+    def redovi(self):
+        """Redovi teksta plana, jedan po pregledu."""
+        for s in self.stavke():
+            napomena = "kasni" if s.kasni else s.kriterijum
+            yield (f"{s.datum:%d.%m.%Y}  {s.naziv}/{s.mesto} {s.vozilo}  {s.vrsta}  ({napomena}, "
+                   f"najkasnije {s.najkasnije:%d.%m.%Y})")
+        for naziv, mesto, vozilo, vrste in self.bez_evidencije():
+            yield f"bez evidencije  {naziv}/{mesto} {vozilo or '(nije dodeljeno vozilo)'}  {', '.join(vrste)}"
+        for naziv, brojevi in self.bez_km():
+            yield f"bez km  {naziv}  " + ", ".join(
+                f"{broj} (kružni)" if self.indeks.vozovi[broj].kruzni else broj for broj in brojevi)
+
+def ucitaj_intervale(putanja):
+    """Intervali iz JSON fajla: {"serija": [["P1", dana, km, sati], ...]}, km i sati mogu da izostanu ili budu null."""
+    with open(putanja, encoding="utf-8") as f:
+        return {str(serija): _intervali(*kriterijumi) for serija, kriterijumi in json.load(f).items()}
+
+def main(argumenti=None):
+    """Mesečni plan kontrolnih pregleda iz komandne linije (python -m jezgro.odrzavanje)."""
+    parser = argparse.ArgumentParser(description="Mesečni plan kontrolnih pregleda vozila iz turnusa.")
+    parser.add_argument("mesec", help="mesec plana kao GGGG-MM")
+    parser.add_argument("--intervali", help="JSON sa intervalima po seriji VV (podrazumevano iz Uputstva)")
+    parser.add_argument("--vozilo", nargs=3, action="append", default=[], metavar=("VOZILO", "TURNUS", "MESTO"),
+                        help="pre plana dodeli vozilo mestu u ciklusu turnusa (npr. 441-045 T0001 1), više puta")
+    parser.add_argument("--izvrsen", nargs=3, action="append", default=[], metavar=("VOZILO", "VRSTA", "DATUM"),
+                        help="pre plana upiši izvršen pregled vozila (npr. 441-045 P3 2025-08-14), više puta")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    args = parser.parse_args(argumenti)
+
+    try:
+        godina, mesec = (int(deo) for deo in args.mesec.split("-"))
+        intervali = ucitaj_intervale(args.intervali) if args.intervali else None
+        baza = Baza.postojeca(args.baza)
+        try:
+            if args.vozilo or args.izvrsen:
+                with baza.transakcija() as cursor:
+                    id_turnusa = procitaj_id_turnusa(cursor, [naziv for _, naziv, _ in args.vozilo])
+                    for vozilo, naziv, mesto in args.vozilo:
+                        if naziv not in id_turnusa:
+                            raise ValueError(f"Turnus '{naziv}' ne postoji!")
+                        dodeli_vozilo(cursor, vozilo, id_turnusa[naziv], int(mesto))
+                    for vozilo, vrsta, datum in args.izvrsen:
+                        datum = date.fromisoformat(datum).isoformat()
+                        try:
+                            upisi_pregled(cursor, vozilo, vrsta, datum)
+                        except sqlite3.IntegrityError:
+                            poruka = f"Vozilo '{vozilo}' ne postoji (dodelite ga turnusu sa --vozilo)!"
+                            raise ValueError(poruka) from None
+            plan = PlanPregleda.ucitaj(baza.conn.cursor(), godina, mesec, intervali)
+        finally:
+            baza.zatvori()
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    for red in plan.redovi():
+        print(red)
+    print(f"✅ {plan.sazetak()}")
+    bez_intervala = plan.bez_intervala()
+    if bez_intervala:
+        print(f"Serije VV bez intervala pregleda: {', '.join(bez_intervala)}")
+    if plan.bez_evidencije_po_turnusu:
+        print("Mestima bez vozila dodelite vozilo (--vozilo), a za vozila bez evidencije upišite poslednji "
+              "izvršen pregled (--izvrsen).")
+    if plan.bez_km_po_turnusu:
+        print("Za vozove bez km upišite rastojanja (python -m jezgro.kilometraza); kružni vozovi (ista početna "
+              "i krajnja stanica) nemaju km iz rastojanja.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,323 @@
+import argparse
+import sys
+from bisect import bisect_left
+from collections import deque
+from typing import NamedTuple
+
+from .baza import Baza, DB_PATH, procitaj_id_turnusa, procitaj_vozove_serije, upisi_vozove_turnusa
+from .domen import MINUTA_U_DANU, dani_ciklusa, dani_puta
+from .validacija import proveri_turnus
+
+# --- PREDLOG TURNUSA ---
+# Vozovi jedne sekcije i serije se povezuju u turnuse sa najmanje lokomotiva, u dva koraka:
+# 1. vozovi istog dana se nižu u lance (najmanje pokrivanje putevima, Hopcroft–Karp):
+#    voz j može posle voza i ako polazi iz stanice u koju i stiže, bar okret minuta posle dolaska;
+#    svaki lanac je jedan turnus za jedan dan, pa lanac čiji prelazni poslednji voz stiže tek posle
+#    prvog polaska lanca (provera turnusa, KRUG) deli na dva;
+# 2. lanci se preko noći spajaju po stanici, uz isti okret: lokomotiva sa kraja jednog turnusa
+#    dan posle dolaska (kao u dani_ciklusa) vozi turnus koji kreće iz te stanice bar okret minuta
+#    posle njenog dolaska (sledeci), a turnus koji se tako vraća u polaznu stanicu radije sam sebe.
+
+MIN_OKRET = 30  # minuta od dolaska do sledećeg polaska iz iste stanice
+
+class PredlogTurnusa(NamedTuple):
+    """Predložen turnus: red za tabelu turnusi, vozovi po redosledu i potrebne lokomotive.
+
+    sledeci je naziv turnusa koji ista lokomotiva vozi dan posle dolaska (sam turnus
+    ako se vraća u polaznu stanicu), ili None kad iz krajnje stanice nema slobodnog
+    turnusa (u stanici je više dolazaka nego polazaka), pa lokomotiva mora prazno dalje.
+    lokomotiva su dani od prvog polaska turnusa do prvog polaska sledećeg, pa je zbir
+    za turnuse jednog niza broj lokomotiva koje ga voze; turnus bez sledećeg broji
+    dane svog ciklusa (dani_ciklusa), kao da se posle praznog povratka ponovo vozi.
+    Svaki turnus je bar jedna lokomotiva.
+    """
+    naziv: str
+    serija_vv: str
+    sekcija: str
+    vozovi: list
+    lokomotiva: int
+    sledeci: str
+
+    def red_turnusa(self):
+        """Red za tabelu turnusi: (naziv, serija_vv, sekcija)."""
+        return (self.naziv, self.serija_vv, self.sekcija)
+
+    def redovi_vozova(self, turnus_id):
+        """Redovi za tabelu turnus_vozovi: (turnus_id, broj_voza, redosled)."""
+        return [(turnus_id, broj, redosled) for redosled, broj in enumerate(self.vozovi, 1)]
+
+def najvece_uparivanje(susedi, broj_desnih, par_levog=None):
+    """Najveće uparivanje u bipartitnom grafu (Hopcroft–Karp), O(E * sqrt(V)).
+
+    susedi[u] su desni čvorovi levog čvora u; par_levog je početno uparivanje
+    (npr. pohlepno), -1 za neuparen. Vraća par_levog: desni par svakog levog ili -1.
+    """
+    broj_levih = len(susedi)
+    par_levog = list(par_levog) if par_levog is not None else [-1] * broj_levih
+    par_desnog = [-1] * broj_desnih
+    for u, v in enumerate(par_levog):
+        if v != -1:
+            par_desnog[v] = u
+
+    while True:
+        # Slojevi po najkraćim alternirajućim putevima od slobodnih levih čvorova
+        sloj = [-1] * broj_levih
+        red = deque()
+        for u in range(broj_levih):
+            if par_levog[u] == -1:
+                sloj[u] = 0
+                red.append(u)
+        ima_puta = False
+        while red:
+            u = red.popleft()
+            for v in susedi[u]:
+                w = par_desnog[v]
+                if w == -1:
+                    ima_puta = True
+                elif sloj[w] == -1:
+                    sloj[w] = sloj[u] + 1
+                    red.append(w)
+        if not ima_puta:
+            return par_levog
+
+        # Disjunktni uvećavajući putevi kroz slojeve, pretragom u dubinu bez rekurzije
+        sledeci = [0] * broj_levih  # koliko je suseda levog čvora već probano
+        for koren in range(broj_levih):
+            if par_levog[koren] != -1:
+                continue
+            stek = [koren]
+            while stek:
+                u = stek[-1]
+                if sledeci[u] == len(susedi[u]):
+                    sloj[u] = -1  # Slepa ulica u ovoj fazi
+                    stek.pop()
+                    continue
+                v = susedi[u][sledeci[u]]
+                sledeci[u] += 1
+                w = par_desnog[v]
+                if w == -1:
+                    # Put je nađen: svaki čvor na steku se uparuje sa poslednjim probanim susedom
+                    for x in stek:
+                        y = susedi[x][sledeci[x] - 1]
+                        par_levog[x] = y
+                        par_desnog[y] = x
+                    break
+                if sloj[w] == sloj[u] + 1:
+                    stek.append(w)
+
+def _lanci_dana(vozovi, okret):
+    """Vozovi istog dana povezani u najmanje lanaca; vraća liste indeksa vozova po redu vožnje."""
+    najmanje = max(okret, 1)
+    polasci = {}  # stanica -> [(polazak, indeks)] po vremenu
+    for j, voz in enumerate(vozovi):
+        polasci.setdefault(voz.pocetna, []).append((voz.polazak_min, j))
+    for lista in polasci.values():
+        lista.sort()
+    vremena = {stanica: [vreme for vreme, _ in lista] for stanica, lista in polasci.items()}
+
+    # Prelazni voz stiže tek sutradan, pa ga niko ne nastavlja istog dana
+    susedi = []
+    for voz in vozovi:
+        lista = polasci.get(voz.krajnja)
+        if voz.prelazni or lista is None:
+            susedi.append([])
+            continue
+        od = bisect_left(vremena[voz.krajnja], voz.dolazak_min + najmanje)
+        susedi.append([j for _, j in lista[od:]])
+
+    # Pohlepno početno uparivanje (najraniji slobodan nastavak) skraćuje Hopcroft–Karp
+    par = [-1] * len(vozovi)
+    zauzet = [False] * len(vozovi)
+    for i in sorted(range(len(vozovi)), key=lambda i: vozovi[i].dolazak_min):
+        for j in susedi[i]:
+            if not zauzet[j]:
+                par[i] = j
+                zauzet[j] = True
+                break
+    par = najvece_uparivanje(susedi, len(vozovi), par)
+
+    ima_prethodnika = [False] * len(vozovi)
+    for j in par:
+        if j != -1:
+            ima_prethodnika[j] = True
+    lanci = []
+    for pocetak in range(len(vozovi)):
+        if ima_prethodnika[pocetak]:
+            continue
+        lanac = [pocetak]
+        while par[lanac[-1]] != -1:
+            lanac.append(par[lanac[-1]])
+        lanci.extend(_podeli_krug(vozovi, lanac))
+    return lanci
+
+def _podeli_krug(vozovi, lanac):
+    """Lanac kao jedan ili dva lanca koji prolaze proveru kruga (nalaz_kruga).
+
+    Prelazni voz je uvek poslednji u lancu; ako stiže tek u minutu prvog polaska ili
+    posle njega, drugi lanac počinje prvim vozom koji polazi posle tog dolaska.
+    """
+    poslednji = vozovi[lanac[-1]]
+    if not poslednji.prelazni or poslednji.dolazak_min < vozovi[lanac[0]].polazak_min:
+        return [lanac]
+    # Polasci u lancu rastu, a prelazni polazi posle svog dolaska, pa deoba uvek postoji
+    deoba = next(m for m, i in enumerate(lanac) if vozovi[i].polazak_min > poslednji.dolazak_min)
+    return [lanac[:deoba], lanac[deoba:]]
+
+def _spoji_lance(vozovi, lanci, okret):
+    """Spaja lance preko noći po stanici; vraća nizove lanaca koje vozi ista lokomotiva, sa zatvoren.
+
+    Lanac se nastavlja lancem koji dan posle dolaska kreće iz njegove krajnje stanice
+    bar okret minuta posle dolaska, kao pri nizanju vozova u lance; i lanac koji se
+    vraća u polaznu stanicu nastavlja sam sebe samo pod tim uslovom.
+    """
+    najmanje = max(okret, 1)
+    krajevi = {}  # stanica -> [(najraniji polazak narednog dana, lanac)] lanaca koji se tu završavaju
+    pocetci = {}  # stanica -> [(polazak, lanac)] lanaca koji odatle kreću
+    for k, lanac in enumerate(lanci):
+        poslednji, prvi = vozovi[lanac[-1]], vozovi[lanac[0]]
+        # Sledeći lanac je dan posle dolaska (i posle prelaznog poslednjeg voza, koji stiže narednog dana)
+        spreman = poslednji.dolazak_min + najmanje - MINUTA_U_DANU
+        krajevi.setdefault(poslednji.krajnja, []).append((spreman, k))
+        pocetci.setdefault(prvi.pocetna, []).append((prvi.polazak_min, k))
+
+    naslednik = {}
+    for stanica, krecu in pocetci.items():
+        zavrsavaju = sorted(krajevi.get(stanica, []))
+        preostali = {k for _, k in krecu}  # lanci čiji polazak iz stanice tek dolazi
+        # Lanci spremni za tekući polazak, redom po spremnosti: ostali i oni koji odavde tek kreću
+        spremni, cekaju = {}, {}
+        i = 0
+        for polazak, sledeci in sorted(krecu):
+            preostali.discard(sledeci)
+            while i < len(zavrsavaju) and zavrsavaju[i][0] <= polazak:
+                k = zavrsavaju[i][1]
+                (cekaju if k in preostali or k == sledeci else spremni)[k] = None
+                i += 1
+            # Spreman lanac je spreman i za sve kasnije polaske, pa izbor ne menja broj spojeva:
+            # lanac koji odavde i sam kreće čeka svoj polazak (jednodnevni turnus), a ostali
+            # nastavljaju najranije spremnim
+            if sledeci in cekaju:
+                k = sledeci
+            elif spremni or cekaju:
+                k = next(iter(spremni or cekaju))
+            else:
+                continue
+            (cekaju if k in cekaju else spremni).pop(k)
+            naslednik[k] = sledeci
+
+    prethodnik = {sledeci: k for k, sledeci in naslednik.items()}
+    turnusi = []
+    obidjeni = set()
+    # Prvo otvoreni nizovi (od lanca bez prethodnika), pa ciklusi
+    pocetni = [k for k in range(len(lanci)) if k not in prethodnik] + list(range(len(lanci)))
+    for k in pocetni:
+        if k in obidjeni:
+            continue
+        niz = []
+        while k is not None and k not in obidjeni:
+            obidjeni.add(k)
+            niz.append(k)
+            k = naslednik.get(k)
+        turnusi.append((niz, niz[-1] in naslednik))
+    return turnusi
+
+def predlozi_turnuse(vozovi, sekcija, serija_vv, okret=MIN_OKRET, prefiks=None):
+    """Predlog turnusa sa najmanje lokomotiva za vozove (Voz) jedne sekcije i serije.
+
+    Turnusi koje vozi ista lokomotiva (vidi PredlogTurnusa.sledeci) su jedan za
+    drugim, a nazvani su prefiks + redni broj (podrazumevano "sekcija-serija-").
+    Svaki turnus prolazi proveru turnusa, a lokomotive se računaju po nizu turnusa
+    (vidi PredlogTurnusa.lokomotiva). Vraća listu PredlogTurnusa.
+    """
+    vozovi = list(vozovi)
+    if prefiks is None:
+        prefiks = f"{sekcija}-{serija_vv}-"
+    lanci = _lanci_dana(vozovi, okret)
+    nizovi = _spoji_lance(vozovi, lanci, okret)
+    nizovi.sort(key=lambda niz: (vozovi[lanci[niz[0][0]][0]].polazak_min, vozovi[lanci[niz[0][0]][0]].broj))
+    sirina = max(3, len(str(len(lanci))))
+    nazivi = {}
+    for niz, _ in nizovi:
+        for k in niz:
+            nazivi[k] = f"{prefiks}{len(nazivi) + 1:0{sirina}d}"
+
+    predlozi = []
+    for niz, zatvoren in nizovi:
+        for mesto, k in enumerate(niz):
+            naredni = niz[(mesto + 1) % len(niz)]
+            sledeci = nazivi[naredni] if mesto + 1 < len(niz) or zatvoren else None
+            redosled = [vozovi[i] for i in lanci[k]]
+            voznje = [(voz.polazak_min, voz.dolazak_min) for voz in redosled]
+            if sledeci is None:
+                lokomotiva = dani_ciklusa(voznje, okret)
+            else:
+                # Sledeći turnus kreće dan posle dolaska poslednjeg voza, uz okret (vidi _spoji_lance)
+                lokomotiva = dani_puta(voznje, okret) + redosled[-1].prelazni + 1
+            predlozi.append(PredlogTurnusa(nazivi[k], serija_vv, sekcija, [voz.broj for voz in redosled],
+                                           lokomotiva, sledeci))
+    return predlozi
+
+def upisi_predlog(cursor, predlozi):
+    """Upisuje predložene turnuse posle provere svakog (proveri_turnus).
+
+    ValueError ako turnus sa nekim od naziva već postoji ili neki predlog ne prolazi
+    proveru; tada se ne upisuje nijedan.
+    """
+    postojeci = procitaj_id_turnusa(cursor, [predlog.naziv for predlog in predlozi])
+    if postojeci:
+        raise ValueError("Turnusi već postoje: " + ", ".join(sorted(postojeci)))
+    greske = []
+    for predlog in predlozi:
+        try:
+            proveri_turnus(cursor, predlog.vozovi, predlog.serija_vv)
+        except ValueError as e:
+            greske.append(f"Turnus {predlog.naziv}: {e}")
+    if greske:
+        raise ValueError("Predlozi koji ne prolaze proveru (ništa nije upisano):\n" + "\n".join(greske))
+    for predlog in predlozi:
+        cursor.execute("INSERT INTO turnusi (naziv, serija_vv, sekcija) VALUES (?, ?, ?)", predlog.red_turnusa())
+        upisi_vozove_turnusa(cursor, cursor.lastrowid, predlog.vozovi)
+
+def main(argumenti=None):
+    """Predlog turnusa iz komandne linije (python -m jezgro.optimizacija)."""
+    parser = argparse.ArgumentParser(
+        description="Predlog turnusa sa najmanje lokomotiva za vozove jedne sekcije i serije vozila.")
+    parser.add_argument("sekcija", help="sekcija vozova")
+    parser.add_argument("serija", help="serija vozila (postaje serija VV turnusa)")
+    parser.add_argument("--okret", type=int, default=MIN_OKRET,
+                        help=f"najmanje minuta od dolaska do sledećeg polaska (podrazumevano {MIN_OKRET})")
+    parser.add_argument("--prefiks", help="početak naziva turnusa (podrazumevano 'sekcija-serija-')")
+    parser.add_argument("--svi", action="store_true", help="uzmi i vozove koji su već u nekom turnusu")
+    parser.add_argument("--upisi", action="store_true", help="upiši predložene turnuse u bazu")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    args = parser.parse_args(argumenti)
+
+    try:
+        baza = Baza.postojeca(args.baza)
+        try:
+            vozovi = procitaj_vozove_serije(baza.conn.cursor(), args.sekcija, args.serija,
+                                            samo_slobodni=not args.svi)
+            predlozi = predlozi_turnuse(vozovi, args.sekcija, args.serija, args.okret, args.prefiks)
+            if predlozi:
+                print("naziv;serija_vv;sekcija;vozovi;lokomotiva;sledeci")
+            for predlog in predlozi:
+                print(f"{predlog.naziv};{predlog.serija_vv};{predlog.sekcija};{','.join(predlog.vozovi)};"
+                      f"{predlog.lokomotiva};{predlog.sledeci or '-'}")
+            if args.upisi and predlozi:
+                with baza.transakcija() as cursor:
+                    upisi_predlog(cursor, predlozi)
+        finally:
+            baza.zatvori()
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    lokomotiva = sum(predlog.lokomotiva for predlog in predlozi)
+    bez_nastavka = sum(predlog.sledeci is None for predlog in predlozi)
+    print(f"✅ {len(vozovi)} vozova u {len(predlozi)} turnusa, potrebno lokomotiva: {lokomotiva}"
+          + (f", bez nastavka narednog dana: {bez_nastavka}" if bez_nastavka else "")
+          + (" (upisano)" if args.upisi and predlozi else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
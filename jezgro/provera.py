@@ -0,0 +1,183 @@
+import argparse
+import sys
+from collections import Counter
+from typing import NamedTuple
+
+from .baza import Baza, DB_PATH, procitaj_sastav_turnusa, procitaj_sve_vozove, procitaj_turnuse_za_filter
+from .validacija import NEMA_VOZA, Nalaz, nalazi_turnusa
+
+# --- PROVERA SVIH TURNUSA ---
+# Vozovi i turnusi se čitaju iz baze jednom (tri upita), a svaki turnus se
+# proverava nad rečnikom vozova u memoriji istim pravilima kao "Proveri turnus".
+
+class RezultatTurnusa(NamedTuple):
+    """Rezultat provere jednog turnusa; prazna lista nalaza znači ispravan turnus."""
+    turnus_id: int
+    naziv: str
+    sekcija: str
+    serija_vv: str
+    nalazi: list
+
+class IzvestajProvere:
+    """Izveštaj provere: broj proverenih turnusa i neispravni turnusi (RezultatTurnusa), po nazivu."""
+    def __init__(self, proverenih, neispravni):
+        self.proverenih = proverenih
+        self.neispravni = neispravni
+
+    @property
+    def ispravan(self):
+        return not self.neispravni
+
+    def po_vrsti(self):
+        """Broj nalaza po vrsti (NEMA_VOZA, SERIJA, STANICA, VREME, KRUG)."""
+        return Counter(nalaz.vrsta for rezultat in self.neispravni for nalaz in rezultat.nalazi)
+
+    def sazetak(self):
+        """Jedan red: koliko je turnusa provereno i koliko nije ispravno."""
+        if self.ispravan:
+            return f"Svih {self.proverenih} turnusa je ispravno."
+        vrste = ", ".join(f"{vrsta}: {broj}" for vrsta, broj in sorted(self.po_vrsti().items()))
+        return f"Neispravno {len(self.neispravni)} od {self.proverenih} turnusa ({vrste})."
+
+    def redovi(self):
+        """Redovi teksta izveštaja: turnus, pa njegovi nalazi uvučeni."""
+        for rezultat in self.neispravni:
+            opis = ", ".join(v for v in (rezultat.sekcija, rezultat.serija_vv) if v)
+            yield f"Turnus '{rezultat.naziv}'" + (f" ({opis})" if opis else "") + ":"
+            for nalaz in rezultat.nalazi:
+                yield f"    {nalaz.poruka}"
+
+class IndeksTurnusa:
+    """Svi vozovi i turnusi iz baze u memoriji, za proveru turnusa bez upita po vozu.
+
+    Obrnuti indeks (broj_voza -> turnusi sa tim vozom) se održava kroz postavi_voz,
+    ukloni_voz, postavi_turnus i ukloni_turnus, koje se pozivaju posle uspešne
+    izmene u bazi; tako se posle izmene voza ponovo proveravaju samo turnusi sa njim.
+
+    Pratioci (npr. sukobi.IndeksVoznji) dobijaju pogođene turnuse posle svake izmene
+    kroz osvezi_turnuse(turnus_ids), koja vraća druge turnuse čiji se nalazi menjaju,
+    a njihovi nalazi_turnusa(turnus_id) se dodaju rezultatu provere turnusa.
+    """
+    def __init__(self, vozovi, turnusi, sastav):
+        self.vozovi = vozovi  # {broj_voza: Voz}
+        self.turnusi = turnusi  # {turnus_id: (naziv, sekcija, serija_vv)}
+        self.sastav = sastav  # {turnus_id: [broj_voza, ...]} po redosledu
+        self.obrnuti = {}  # {broj_voza: {turnus_id: redosled}}
+        self.pratioci = []
+        for turnus_id, vozovi_turnusa in sastav.items():
+            self._dodaj_obrnute(turnus_id, vozovi_turnusa)
+
+    @classmethod
+    def ucitaj(cls, cursor):
+        """Čita sve vozove, turnuse i njihov sastav (tri upita)."""
+        turnusi = {t[0]: (t[1], t[2], t[3]) for t in procitaj_turnuse_za_filter(cursor)}
+        return cls(procitaj_sve_vozove(cursor), turnusi, procitaj_sastav_turnusa(cursor))
+
+    def _dodaj_obrnute(self, turnus_id, vozovi):
+        for redosled, broj_voza in enumerate(vozovi, 1):
+            self.obrnuti.setdefault(broj_voza, {})[turnus_id] = redosled
+
+    def _ukloni_obrnute(self, turnus_id):
+        for broj_voza in self.sastav.get(turnus_id, ()):
+            turnusi = self.obrnuti.get(broj_voza)
+            if turnusi is not None:
+                turnusi.pop(turnus_id, None)
+                if not turnusi:
+                    del self.obrnuti[broj_voza]
+
+    def _obavesti(self, pogodjeni):
+        """Prosleđuje pogođene turnuse pratiocima; vraća ih zajedno sa turnusima koje pratioci dodaju."""
+        pogodjeni = set(pogodjeni)
+        for pratilac in self.pratioci:
+            pogodjeni |= pratilac.osvezi_turnuse(set(pogodjeni))
+        return pogodjeni
+
+    # --- IZMENE ---
+
+    def turnusi_voza(self, broj_voza):
+        """Lista (turnus_id, redosled) turnusa u kojima je dati voz."""
+        return sorted(self.obrnuti.get(broj_voza, {}).items())
+
+    def postavi_voz(self, voz, stari_broj=None):
+        """Beleži dodat ili izmenjen voz (stari_broj je broj pre izmene); vraća id-jeve pogođenih turnusa."""
+        pogodjeni = set(self.obrnuti.get(voz.broj, ()))
+        if stari_broj is not None and stari_broj != voz.broj:
+            self.vozovi.pop(stari_broj, None)
+            pogodjeni.update(self.obrnuti.get(stari_broj, ()))
+        self.vozovi[voz.broj] = voz
+        return self._obavesti(pogodjeni)
+
+    def ukloni_voz(self, broj_voza):
+        """Beleži obrisan voz; vraća id-jeve pogođenih turnusa."""
+        self.vozovi.pop(broj_voza, None)
+        return self._obavesti(self.obrnuti.get(broj_voza, ()))
+
+    def postavi_turnus(self, turnus_id, naziv, sekcija, serija_vv, vozovi):
+        """Beleži dodat ili izmenjen turnus sa vozovima po redosledu; vraća id-jeve pogođenih turnusa."""
+        self._ukloni_obrnute(turnus_id)
+        self.turnusi[turnus_id] = (naziv, sekcija, serija_vv)
+        self.sastav[turnus_id] = list(vozovi)
+        self._dodaj_obrnute(turnus_id, self.sastav[turnus_id])
+        return self._obavesti({turnus_id})
+
+    def ukloni_turnus(self, turnus_id):
+        """Beleži obrisan turnus; vraća id-jeve pogođenih turnusa (i njega)."""
+        self._ukloni_obrnute(turnus_id)
+        self.turnusi.pop(turnus_id, None)
+        self.sastav.pop(turnus_id, None)
+        return self._obavesti({turnus_id})
+
+    # --- PROVERA ---
+
+    def proveri(self, turnus_id):
+        """Proverava jedan turnus i vraća RezultatTurnusa.
+
+        Serija VV se proverava samo ako je turnus ima (turnusi iz ppa.py je nemaju).
+        """
+        naziv, sekcija, serija_vv = self.turnusi[turnus_id]
+        vozovi = self.sastav.get(turnus_id, [])
+        if vozovi:
+            nalazi = nalazi_turnusa(vozovi, self.vozovi, serija_vv or None)
+            for pratilac in self.pratioci:
+                nalazi.extend(pratilac.nalazi_turnusa(turnus_id))
+        else:
+            nalazi = [Nalaz(NEMA_VOZA, None, "Turnus nema nijedan voz!")]
+        return RezultatTurnusa(turnus_id, naziv, sekcija, serija_vv, nalazi)
+
+    def proveri_turnuse(self, turnus_ids):
+        """Proverava date turnuse (nepostojeći se preskaču); vraća RezultatTurnusa po nazivu."""
+        rezultati = [self.proveri(turnus_id) for turnus_id in turnus_ids if turnus_id in self.turnusi]
+        return sorted(rezultati, key=lambda rezultat: rezultat.naziv or "")
+
+    def proveri_sve(self):
+        """Proverava sve turnuse u jednom prolazu i vraća IzvestajProvere."""
+        neispravni = [rezultat for rezultat in self.proveri_turnuse(self.turnusi) if rezultat.nalazi]
+        return IzvestajProvere(len(self.turnusi), neispravni)
+
+def proveri_sve_turnuse(cursor):
+    """Učitava indeks i proverava sve turnuse; vraća IzvestajProvere."""
+    return IndeksTurnusa.ucitaj(cursor).proveri_sve()
+
+def main(argumenti=None):
+    """Provera svih turnusa iz komandne linije (python -m jezgro.provera)."""
+    parser = argparse.ArgumentParser(description="Provera svih turnusa u bazi.")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    args = parser.parse_args(argumenti)
+
+    try:
+        baza = Baza.postojeca(args.baza)
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    try:
+        izvestaj = proveri_sve_turnuse(baza.conn.cursor())
+    finally:
+        baza.zatvori()
+
+    for red in izvestaj.redovi():
+        print(red)
+    print(("✅ " if izvestaj.ispravan else "❌ ") + izvestaj.sazetak())
+    return 0 if izvestaj.ispravan else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
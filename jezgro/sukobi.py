@@ -0,0 +1,261 @@
+import argparse
+import sys
+from typing import NamedTuple
+
+from .baza import Baza, DB_PATH
+from .domen import MINUTA_U_DANU
+from .provera import IndeksTurnusa
+from .validacija import Nalaz
+
+# --- INTERVALNO STABLO ---
+
+class IntervalnoStablo:
+    """Statičko intervalno stablo nad poluotvorenim intervalima [od, do).
+
+    Intervali su sortirani po početku i posmatraju se kao balansirano binarno
+    stablo (koren je sredina niza); svaki čvor pamti najveći kraj u svom podstablu,
+    pa upit preskače podstabla koja se završavaju pre traženog intervala i radi
+    u O(log n + k) za k nađenih intervala.
+    """
+    def __init__(self, intervali):
+        self._intervali = sorted(intervali, key=lambda interval: (interval[0], interval[1]))
+        self._max_do = [0] * len(self._intervali)
+        self._popuni_max(0, len(self._intervali))
+
+    def _popuni_max(self, lo, hi):
+        if lo >= hi:
+            return float("-inf")
+        sredina = (lo + hi) // 2
+        najveci = max(self._intervali[sredina][1], self._popuni_max(lo, sredina), self._popuni_max(sredina + 1, hi))
+        self._max_do[sredina] = najveci
+        return najveci
+
+    def __len__(self):
+        return len(self._intervali)
+
+    def preklapanja(self, od, do):
+        """Intervali (od, do, podatak) koji se preklapaju sa [od, do)."""
+        nadjeni = []
+        stek = [(0, len(self._intervali))]
+        while stek:
+            lo, hi = stek.pop()
+            if lo >= hi:
+                continue
+            sredina = (lo + hi) // 2
+            if self._max_do[sredina] <= od:
+                continue  # Celo podstablo se završava pre traženog intervala
+            stek.append((lo, sredina))
+            interval = self._intervali[sredina]
+            if interval[0] < do:
+                if interval[1] > od:
+                    nadjeni.append(interval)
+                stek.append((sredina + 1, hi))
+        return nadjeni
+
+# --- VOŽNJE NA OSI ---
+
+def segmenti_voznje(voz):
+    """Vožnja kao intervali minuta u toku dana; prelazna se deli na ponoći kao na grafiku."""
+    if voz.prelazni:
+        return [(voz.polazak_min, MINUTA_U_DANU), (0, voz.dolazak_min)]
+    return [(voz.polazak_min, voz.dolazak_min)]
+
+def termini_voznje(voz):
+    """Minuti u kojima je lokomotiva na vožnji, od polaska do dolaska uključivo (kao u proveri turnusa,
+    gde je polazak u minutu dolaska preklapanje), kao poluotvoreni intervali."""
+    segmenti = segmenti_voznje(voz)
+    od, do = segmenti[-1]
+    return segmenti[:-1] + [(od, do + 1)]
+
+# Vrste sukoba
+DVOSTRUKI_VOZ = "voz u više turnusa"
+PREKLAPANJE = "preklapanje vožnji"
+
+class Sukob(NamedTuple):
+    """Jedan sukob: vrsta, voz(ovi) i turnusi na koje se odnosi, i poruka."""
+    vrsta: str
+    vozovi: tuple
+    turnus_ids: tuple
+    poruka: str
+
+class _GrupaVoznji:
+    """Vožnje svih turnusa jedne serije VV; stablo se pravi ponovo tek pri upitu posle izmene."""
+    def __init__(self):
+        self.voznje = {}  # turnus_id -> [(od, do, (turnus_id, redosled, broj)), ...]
+        self._stablo = None
+
+    def postavi(self, turnus_id, intervali):
+        self.voznje[turnus_id] = intervali
+        self._stablo = None
+
+    def ukloni(self, turnus_id):
+        if self.voznje.pop(turnus_id, None) is not None:
+            self._stablo = None
+
+    @property
+    def stablo(self):
+        if self._stablo is None:
+            self._stablo = IntervalnoStablo([i for intervali in self.voznje.values() for i in intervali])
+        return self._stablo
+
+class IndeksVoznji:
+    """Intervalni indeks vožnji iz svih turnusa po seriji VV, za sukobe vozova i lokomotiva.
+
+    Turnus je jedna lokomotiva koja svaki dan vozi iste vožnje, pa svaki turnus ima
+    svoj dan na osi stabla (od turnus_id * MINUTA_U_DANU), a vožnje na njemu su od
+    polaska do dolaska (termini_voznje, prelazne podeljene na ponoći). Preklapaju se
+    zato samo vožnje iste lokomotive, a upit po vožnji je O(log n + k). Sukobi su voz u
+    dva ili više turnusa iste serije VV i dve vožnje turnusa koje se preklapaju.
+
+    Da bi ga izmene voza i turnusa (postavi_*/ukloni_*) ažurirale, indeks se dodaje u
+    pratioce IndeksTurnusa (ucitaj to radi sam): menjaju se samo vožnje pogođenih
+    turnusa, a stabla njihovih serija se prave ponovo pri sledećem upitu.
+    """
+    def __init__(self, indeks_turnusa):
+        self.indeks = indeks_turnusa
+        self._grupe = {}  # serija_vv -> _GrupaVoznji
+        self._turnusi = {}  # turnus_id -> (naziv, serija_vv, brojevi vozova)
+        self._turnusi_voza = {}  # (serija_vv, broj) -> {turnus_id, ...}
+        for turnus_id in indeks_turnusa.turnusi:
+            self._dodaj(turnus_id)
+
+    @classmethod
+    def ucitaj(cls, cursor):
+        """Čita turnuse (IndeksTurnusa.ucitaj) i pravi indeks vožnji prijavljen kao njihov pratilac."""
+        indeks_turnusa = IndeksTurnusa.ucitaj(cursor)
+        indeks = cls(indeks_turnusa)
+        indeks_turnusa.pratioci.append(indeks)
+        return indeks
+
+    def __len__(self):
+        return sum(len(grupa.stablo) for grupa in self._grupe.values())
+
+    def _dodaj(self, turnus_id):
+        naziv, _, serija_vv = self.indeks.turnusi[turnus_id]
+        serija_vv = serija_vv or None
+        vozovi = self.indeks.sastav.get(turnus_id, ())
+        osa = turnus_id * MINUTA_U_DANU
+        intervali = []
+        for redosled, broj in enumerate(vozovi, 1):
+            voz = self.indeks.vozovi.get(broj)
+            if voz is None:
+                continue  # Voz kojeg nema prijavljuje provera turnusa
+            for od, do in termini_voznje(voz):
+                intervali.append((osa + od, osa + do, (turnus_id, redosled, broj)))
+        self._grupe.setdefault(serija_vv, _GrupaVoznji()).postavi(turnus_id, intervali)
+        brojevi = tuple(dict.fromkeys(vozovi))
+        for broj in brojevi:
+            self._turnusi_voza.setdefault((serija_vv, broj), set()).add(turnus_id)
+        self._turnusi[turnus_id] = (naziv, serija_vv, brojevi)
+
+    def _ukloni(self, turnus_id):
+        if turnus_id not in self._turnusi:
+            return
+        _, serija_vv, brojevi = self._turnusi.pop(turnus_id)
+        self._grupe[serija_vv].ukloni(turnus_id)
+        for broj in brojevi:
+            turnusi = self._turnusi_voza[(serija_vv, broj)]
+            turnusi.discard(turnus_id)
+            if not turnusi:
+                del self._turnusi_voza[(serija_vv, broj)]
+
+    def osvezi_turnuse(self, turnus_ids):
+        """Ponovo upisuje vožnje datih turnusa; vraća druge turnuse sa kojima su bili ili su sada u sukobu."""
+        pre = self.partneri(turnus_ids)
+        for turnus_id in turnus_ids:
+            self._ukloni(turnus_id)
+            if turnus_id in self.indeks.turnusi:
+                self._dodaj(turnus_id)
+        return pre | self.partneri(turnus_ids)
+
+    def partneri(self, turnus_ids):
+        """Turnusi van datih koji su u sukobu sa nekim od njih."""
+        partneri = {t for turnus_id in turnus_ids for sukob in self.dvostruki_vozovi(turnus_id)
+                    for t in sukob.turnus_ids}
+        return partneri - set(turnus_ids)
+
+    def _naziv(self, turnus_id):
+        return self._turnusi[turnus_id][0] or ""
+
+    def dvostruki_vozovi(self, turnus_id):
+        """Vozovi turnusa koji su i u drugom turnusu iste serije VV (prema stanju indeksa)."""
+        if turnus_id not in self._turnusi:
+            return []
+        _, serija_vv, brojevi = self._turnusi[turnus_id]
+        sukobi = []
+        for broj in brojevi:
+            turnusi = self._turnusi_voza[(serija_vv, broj)]
+            if len(turnusi) > 1:
+                turnus_ids = tuple(sorted(turnusi, key=lambda t: (self._naziv(t), t)))
+                nazivi = ", ".join(f"'{self._naziv(t)}'" for t in turnus_ids)
+                serija = f"serije {serija_vv}" if serija_vv else "bez serije VV"
+                sukobi.append(Sukob(DVOSTRUKI_VOZ, (broj,), turnus_ids,
+                                    f"Voz {broj} je u više turnusa {serija}: {nazivi}!"))
+        return sukobi
+
+    def preklapanja(self, turnus_id):
+        """Parovi vožnji turnusa koje se preklapaju, svaki jednom, upitom u stablu za svaku vožnju."""
+        if turnus_id not in self._turnusi:
+            return []
+        naziv, serija_vv, _ = self._turnusi[turnus_id]
+        grupa = self._grupe[serija_vv]
+        parovi = {}
+        for od, do, (_, redosled, broj) in grupa.voznje[turnus_id]:
+            for _, _, (_, drugi_redosled, drugi_broj) in grupa.stablo.preklapanja(od, do):
+                if drugi_redosled > redosled:
+                    parovi.setdefault((redosled, drugi_redosled), (broj, drugi_broj))
+        return [Sukob(PREKLAPANJE, (a, b), (turnus_id,),
+                      f"Vožnje {a} i {b} u turnusu '{naziv or ''}' se preklapaju "
+                      f"(lokomotiva je u isto vreme na obe)!")
+                for _, (a, b) in sorted(parovi.items())]
+
+    def sukobi_turnusa(self, turnus_id):
+        """Sukobi u kojima učestvuje turnus (prema stanju indeksa): dvostruki vozovi, pa preklapanja."""
+        return self.dvostruki_vozovi(turnus_id) + self.preklapanja(turnus_id)
+
+    def nalazi_turnusa(self, turnus_id):
+        """Dvostruko dodeljeni vozovi turnusa kao nalazi provere (vidi IndeksTurnusa.pratioci).
+
+        Preklapanja se ne dodaju: turnus sa njima već ima nalaz provere (VREME, KRUG ili
+        NEMA_VOZA), jer se ispravan turnus vozi redom u toku jednog dana.
+        """
+        return [Nalaz(sukob.vrsta, sukob.vozovi[0], sukob.poruka) for sukob in self.dvostruki_vozovi(turnus_id)]
+
+    def svi_sukobi(self):
+        """Svi sukobi u bazi, svaki jednom: dvostruko dodeljeni vozovi, pa preklapanja vožnji po turnusu."""
+        dvostruki = {}
+        preklapanja = []
+        for turnus_id in sorted(self._turnusi, key=lambda t: (self._naziv(t), t)):
+            for sukob in self.dvostruki_vozovi(turnus_id):
+                dvostruki.setdefault((sukob.vozovi, sukob.turnus_ids), sukob)
+            preklapanja.extend(self.preklapanja(turnus_id))
+        return sorted(dvostruki.values(), key=lambda s: s.vozovi) + preklapanja
+
+def main(argumenti=None):
+    """Traženje sukoba u svim turnusima iz komandne linije (python -m jezgro.sukobi)."""
+    parser = argparse.ArgumentParser(
+        description="Vozovi u više turnusa iste serije VV i vožnje turnusa koje se preklapaju.")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    args = parser.parse_args(argumenti)
+
+    try:
+        baza = Baza.postojeca(args.baza)
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    try:
+        indeks = IndeksVoznji.ucitaj(baza.conn.cursor())
+    finally:
+        baza.zatvori()
+
+    sukobi = indeks.svi_sukobi()
+    for sukob in sukobi:
+        print(sukob.poruka)
+    if sukobi:
+        print(f"❌ Sukoba: {len(sukobi)} ({len(indeks)} vožnji u {len(indeks.indeks.turnusi)} turnusa).")
+    else:
+        print(f"✅ Nema sukoba ({len(indeks)} vožnji u {len(indeks.indeks.turnusi)} turnusa).")
+    return 1 if sukobi else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
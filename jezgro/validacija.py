@@ -0,0 +1,176 @@
+from typing import NamedTuple
+
+from .baza import procitaj_vozove_po_broju
+from .domen import MINUTA_U_DANU, Voz
+
+# --- PROVERA UNOSA ---
+# Greške se prijavljuju kao ValueError sa porukom spremnom za prikaz korisniku.
+
+def _tekst(vrednost):
+    return "" if vrednost is None else str(vrednost).strip()
+
+def proveri_obavezna_polja(obavezna_polja):
+    """Podiže ValueError sa spiskom nepopunjenih polja iz liste (naziv, vrednost)."""
+    nedostajuci = [naziv for naziv, vrednost in obavezna_polja if not vrednost]
+    if nedostajuci:
+        raise ValueError("Neophodno je popuniti sledeća polja:\n- " + "\n- ".join(nedostajuci))
+
+def _proveri_broj(vrednost, najvise, poruka):
+    if not vrednost.isdigit() or not (0 <= int(vrednost) <= najvise):
+        raise ValueError(poruka)
+    return int(vrednost)
+
+def _proveri_stanicu(sifra, naziv):
+    if not (2 <= len(sifra) <= 3) or not sifra.isalpha():
+        raise ValueError(f"{naziv}: 2–3 slova.")
+
+def proveri_voz(broj, pocetna, krajnja, sat_p, min_p, sat_d, min_d, serija=None, status=None, sekcija=None):
+    """Proverava polja voza (tekst iz forme ili vrednosti iz uvoza) i vraća Voz.
+
+    Prazna serija postaje None, a prazan status 'R'. Kružni voz (ista početna i krajnja
+    stanica) je dozvoljen, ali mu km ne mogu da se odrede iz rastojanja (vidi Voz.kruzni).
+    """
+    broj, pocetna, krajnja = _tekst(broj), _tekst(pocetna), _tekst(krajnja)
+    sat_p, min_p, sat_d, min_d = _tekst(sat_p), _tekst(min_p), _tekst(sat_d), _tekst(min_d)
+    serija = _tekst(serija) or None
+    status = (_tekst(status) or 'R').upper()
+    sekcija = _tekst(sekcija)
+
+    proveri_obavezna_polja([
+        ("Broj voza", broj), ("Početna stanica", pocetna), ("Krajnja stanica", krajnja),
+        ("Sat polaska", sat_p), ("Minut polaska", min_p),
+        ("Sat dolaska", sat_d), ("Minut dolaska", min_d),
+        ("Sekcija", sekcija),
+    ])
+    if not broj.isalnum() or len(broj) < 3 or len(broj) > 6:
+        raise ValueError("Broj voza mora biti alfanumerički (3-6 karaktera).")
+    _proveri_stanicu(pocetna, "Početna stanica")
+    _proveri_stanicu(krajnja, "Krajnja stanica")
+    sat_p = _proveri_broj(sat_p, 23, "Sat polaska mora biti broj između 0 i 23.")
+    min_p = _proveri_broj(min_p, 59, "Minut polaska mora biti broj između 0 i 59.")
+    sat_d = _proveri_broj(sat_d, 23, "Sat dolaska mora biti broj između 0 i 23.")
+    min_d = _proveri_broj(min_d, 59, "Minut dolaska mora biti broj između 0 i 59.")
+    return Voz(broj, pocetna, krajnja, sat_p, min_p, sat_d, min_d, serija, status, sekcija)
+
+def proveri_rastojanje(od_stanice, do_stanice, km):
+    """Proverava rastojanje između dve stanice (šifre kao kod voza) i vraća (od_stanice, do_stanice, km)."""
+    od_stanice, do_stanice, km = _tekst(od_stanice), _tekst(do_stanice), _tekst(km).replace(",", ".")
+    proveri_obavezna_polja([("Od stanice", od_stanice), ("Do stanice", do_stanice), ("Km", km)])
+    _proveri_stanicu(od_stanice, "Od stanice")
+    _proveri_stanicu(do_stanice, "Do stanice")
+    if od_stanice == do_stanice:
+        raise ValueError(f"Rastojanje {od_stanice}-{do_stanice}: stanice moraju biti različite.")
+    try:
+        km = float(km)
+    except ValueError:
+        km = -1
+    if not km > 0:
+        raise ValueError(f"Rastojanje {od_stanice}-{do_stanice}: km mora biti pozitivan broj.")
+    return od_stanice, do_stanice, km
+
+# --- PROVERA TURNUSA ---
+
+def razdvoji_vozove(vozovi_text):
+    """Brojevi vozova iz teksta razdvojenog zarezima, bez praznih."""
+    return [v.strip() for v in vozovi_text.split(",") if v.strip()]
+
+# Vrste nalaza provere turnusa
+NEMA_VOZA = "nema voza"
+SERIJA = "serija"
+STANICA = "stanica"
+VREME = "vreme"
+KRUG = "krug"
+
+class Nalaz(NamedTuple):
+    """Jedna greška u turnusu: vrsta (NEMA_VOZA, SERIJA, ...), voz na koji se odnosi i poruka."""
+    vrsta: str
+    broj_voza: str
+    poruka: str
+
+def nalazi_serije(vozovi, vozovi_info, serija_vv):
+    """Vozovi turnusa čija serija vozila nije serija VV turnusa (vozovi kojih nema se preskaču)."""
+    nalazi = []
+    for broj in dict.fromkeys(vozovi):
+        if broj not in vozovi_info:
+            continue
+        serija_vozila = vozovi_info[broj].serija or "N/A"
+        if serija_vozila != serija_vv:
+            nalazi.append(Nalaz(SERIJA, broj,
+                                f"Voz {broj} pripada seriji {serija_vozila}, a turnus je za seriju {serija_vv}!"))
+    return nalazi
+
+def nalazi_susednih(vozovi, vozovi_info):
+    """Susedne vožnje koje se ne nastavljaju po stanici ili se preklapaju po vremenu.
+
+    Dolazak prelaznog voza (preko ponoći) računa se u narednom danu. Parovi sa
+    vozom kojeg nema u vozovi_info se preskaču.
+    """
+    nalazi = []
+    for broj_trenutni, broj_sledeci in zip(vozovi, vozovi[1:]):
+        trenutni = vozovi_info.get(broj_trenutni)
+        sledeci = vozovi_info.get(broj_sledeci)
+        if trenutni is None or sledeci is None:
+            continue
+        if trenutni.krajnja != sledeci.pocetna:
+            nalazi.append(Nalaz(STANICA, broj_sledeci,
+                                f"Voz {broj_trenutni} i {broj_sledeci}: Stanica {trenutni.krajnja} ≠ {sledeci.pocetna}"))
+        dolazak = trenutni.dolazak_min + (MINUTA_U_DANU if trenutni.prelazni else 0)
+        if dolazak >= sledeci.polazak_min:
+            nalazi.append(Nalaz(VREME, broj_sledeci,
+                f"Voz {broj_trenutni} i {broj_sledeci}: Dolazak {trenutni.sat_d:02d}:{trenutni.min_d:02d} ≥ "
+                f"Polazak {sledeci.sat_p:02d}:{sledeci.min_p:02d} (preklapanje vremena u turnusu!)"))
+    return nalazi
+
+def nalaz_kruga(vozovi, vozovi_info):
+    """Nalaz ako prelazni poslednji voz stiže tek posle polaska prvog voza (sledećeg dana), inače None."""
+    if len(vozovi) < 2 or vozovi[-1] not in vozovi_info or vozovi[0] not in vozovi_info:
+        return None
+    poslednji = vozovi_info[vozovi[-1]]
+    prvi = vozovi_info[vozovi[0]]
+    if poslednji.prelazni and poslednji.dolazak_min >= prvi.polazak_min:
+        return Nalaz(KRUG, vozovi[-1],
+            f"Prelazni voz {vozovi[-1]} na kraju turnusa: Dolazak {poslednji.sat_d:02d}:{poslednji.min_d:02d} ≥ "
+            f"Polazak {vozovi[0]} {prvi.sat_p:02d}:{prvi.min_p:02d} "
+            f"(preklapanje između poslednjeg i prvog voza u turnusu!)")
+    return None
+
+def nalazi_turnusa(vozovi, vozovi_info, serija_vv=None):
+    """Sve greške niza vozova turnusa nad {broj_voza: Voz}, redom: vozovi kojih nema, serija, redosled.
+
+    Serija se proverava samo ako je serija_vv zadata, a krug poslednji-prvi samo
+    ako susedne vožnje nemaju grešaka (kao u "Proveri turnus").
+    """
+    nalazi = [Nalaz(NEMA_VOZA, broj, f"Voz {broj} ne postoji u bazi!")
+              for broj in dict.fromkeys(vozovi) if broj not in vozovi_info]
+    if serija_vv is not None:
+        nalazi.extend(nalazi_serije(vozovi, vozovi_info, serija_vv))
+    susedni = nalazi_susednih(vozovi, vozovi_info)
+    nalazi.extend(susedni)
+    if not susedni:
+        krug = nalaz_kruga(vozovi, vozovi_info)
+        if krug:
+            nalazi.append(krug)
+    return nalazi
+
+def proveri_vozove_turnusa(vozovi, vozovi_info, serija_vv=None):
+    """Proverava niz vozova turnusa nad već pročitanim {broj_voza: Voz}; greške podižu ValueError.
+
+    Prijavljuje se prva vrsta grešaka koja postoji: voz kojeg nema, pa serija, pa redosled.
+    """
+    if not vozovi:
+        raise ValueError("Greška: Morate uneti bar jedan voz!")
+    nalazi = nalazi_turnusa(vozovi, vozovi_info, serija_vv)
+    if not nalazi:
+        return
+    if nalazi[0].vrsta == NEMA_VOZA:
+        raise ValueError(f"Greška: {nalazi[0].poruka}")
+    serije = [n.poruka for n in nalazi if n.vrsta == SERIJA]
+    if serije:
+        raise ValueError("Greške u serijama:\n" + "\n".join(serije))
+    raise ValueError("Greške u redosledu/preklapanju:\n" + "\n".join(n.poruka for n in nalazi))
+
+def proveri_turnus(cursor, vozovi, serija_vv=None):
+    """Čita vozove turnusa iz baze i proverava ih (proveri_vozove_turnusa); vraća {broj_voza: Voz}."""
+    vozovi_info = procitaj_vozove_po_broju(cursor, vozovi)
+    proveri_vozove_turnusa(vozovi, vozovi_info, serija_vv)
+    return vozovi_info
@@ -0,0 +1,390 @@
+import bisect
+
+from PyQt6.QtWidgets import QApplication, QStyledItemDelegate, QStyleOptionButton, QStyle
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import (
+    Qt, QEvent, QRect, QModelIndex, QAbstractListModel, QAbstractTableModel, QSortFilterProxyModel,
+    pyqtSignal
+)
+
+# Dodatne uloge za podatke u modelima
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1  # Ključ za sortiranje (npr. vreme u minutima)
+DUGMAD_ROLE = Qt.ItemDataRole.UserRole + 2  # Nazivi dugmadi koje delegat crta u ćeliji
+
+# --- DELEGAT ZA DUGMAD U TABELI ---
+
+class DugmadDelegate(QStyledItemDelegate):
+    """Crta dugmad u ćeliji i prijavljuje klik, bez pravih QPushButton widgeta po redu."""
+    kliknuto = pyqtSignal(QModelIndex, int)  # Indeks ćelije i redni broj kliknutog dugmeta
+
+    def _pravougaonici(self, rect, broj_dugmadi):
+        """Deli ćeliju na jednake delove, po jedan za svako dugme."""
+        if broj_dugmadi <= 0:
+            return []
+        sirina = rect.width() // broj_dugmadi
+        return [
+            QRect(rect.x() + i * sirina, rect.y(), sirina, rect.height()).adjusted(2, 2, -2, -2)
+            for i in range(broj_dugmadi)
+        ]
+
+    def paint(self, painter, option, index):
+        nazivi = index.data(DUGMAD_ROLE) or ()
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        for rect, naziv in zip(self._pravougaonici(option.rect, len(nazivi)), nazivi):
+            dugme = QStyleOptionButton()
+            dugme.rect = rect
+            dugme.text = naziv
+            dugme.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, dugme, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            nazivi = index.data(DUGMAD_ROLE) or ()
+            tacka = event.position().toPoint()
+            for i, rect in enumerate(self._pravougaonici(option.rect, len(nazivi))):
+                if rect.contains(tacka):
+                    self.kliknuto.emit(index, i)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+# --- OSNOVNI MODEL TABELE ---
+
+class RedoviModel(QAbstractTableModel):
+    """Osnovni model tabele nad listom redova (torki) u memoriji.
+
+    Podklase definišu ZAGLAVLJA, DUGMAD (kolona -> nazivi dugmadi), KLJUC (pozicija
+    jedinstvenog ključa u redu) i metode _tekst/_kljuc.
+    """
+    ZAGLAVLJA = []
+    DUGMAD = {}
+    KLJUC = 0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._redovi = []
+        self._sortiranje = None  # (kolona, redosled) poslednjeg sortiranja
+
+    def postavi_redove(self, redovi):
+        """Zamenjuje sve redove modela novim redovima (zadržava sortiranje)."""
+        self.beginResetModel()
+        self._redovi = list(redovi)
+        if self._sortiranje is not None:
+            self._sortiraj_listu(*self._sortiranje)
+        self.endResetModel()
+
+    def zameni_red(self, stari_kljuc, novi_red):
+        """Uklanja red sa ključem stari_kljuc (ako postoji) i umeće novi_red na sortirano mesto.
+
+        Bilo koji od argumenata može biti None (samo dodavanje ili samo brisanje), pa
+        izmena jednog reda ne zahteva ponovno učitavanje celog modela.
+        """
+        if stari_kljuc is not None:
+            for i, red in enumerate(self._redovi):
+                if red[self.KLJUC] == stari_kljuc:
+                    self.beginRemoveRows(QModelIndex(), i, i)
+                    del self._redovi[i]
+                    self.endRemoveRows()
+                    break
+        if novi_red is not None:
+            i = self._pozicija_za(novi_red)
+            self.beginInsertRows(QModelIndex(), i, i)
+            self._redovi.insert(i, novi_red)
+            self.endInsertRows()
+
+    def _pozicija_za(self, novi_red):
+        """Pozicija na koju novi red ide da bi lista ostala sortirana (iza jednakih ključeva)."""
+        if self._sortiranje is None:
+            return len(self._redovi)
+        column, order = self._sortiranje
+        kljuc = self._kljuc(novi_red, column)
+        opadajuce = order == Qt.SortOrder.DescendingOrder
+        for i, red in enumerate(self._redovi):
+            postojeci = self._kljuc(red, column)
+            if (postojeci < kljuc) if opadajuce else (kljuc < postojeci):
+                return i
+        return len(self._redovi)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sortira redove u memoriji jednim pozivom list.sort sa ključem kolone."""
+        self.layoutAboutToBeChanged.emit()
+        stari = {id(red): i for i, red in enumerate(self._redovi)}
+        self._sortiraj_listu(column, order)
+        # Prebaci postojeće indekse (selekcija, proxy) na nove pozicije redova
+        stari_indeksi = self.persistentIndexList()
+        if stari_indeksi:
+            nove_pozicije = {stari[id(red)]: i for i, red in enumerate(self._redovi)}
+            self.changePersistentIndexList(stari_indeksi, [
+                self.index(nove_pozicije[idx.row()], idx.column()) for idx in stari_indeksi
+            ])
+        self.layoutChanged.emit()
+
+    def _sortiraj_listu(self, column, order):
+        self._sortiranje = (column, order)
+        self._redovi.sort(
+            key=lambda red: self._kljuc(red, column),
+            reverse=order == Qt.SortOrder.DescendingOrder,
+        )
+
+    def red(self, row):
+        """Vraća originalni red za dati red modela."""
+        return self._redovi[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._redovi)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ZAGLAVLJA)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.ZAGLAVLJA[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        red = self._redovi[index.row()]
+        kolona = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._tekst(red, kolona)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == SORT_ROLE:
+            return self._kljuc(red, kolona)
+        if role == DUGMAD_ROLE:
+            return self.DUGMAD.get(kolona)
+        return None
+
+    @staticmethod
+    def _tekst(red, kolona):
+        raise NotImplementedError
+
+    @classmethod
+    def _kljuc(cls, red, kolona):
+        return cls._tekst(red, kolona) or ""
+
+class RedoviProxyModel(QSortFilterProxyModel):
+    """Proxy za sortiranje; filtriranje radi baza (model sadrži samo prikazane redove)."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(False)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sortiranje prepušta izvornom modelu (jedan list.sort umesto poređenja kroz lessThan)."""
+        self.sourceModel().sort(column, order)
+
+# --- MODEL TABELE VOZOVA ---
+
+class VozoviModel(RedoviModel):
+    """Model tabele vozova; red je Voz (kolone KOLONE_VOZA iz procitaj_vozove)."""
+    ZAGLAVLJA = [
+        "Broj voza", "Poč. st.", "Kraj. st.", "Polazak", "Dolazak",
+        "Serija", "Status", "Sekcija", "Uredi", "Obriši"
+    ]
+    KOLONA_UREDI = 8
+    KOLONA_OBRISI = 9
+    DUGMAD = {KOLONA_UREDI: ("Uredi",), KOLONA_OBRISI: ("Obriši",)}
+
+    @staticmethod
+    def _tekst(red, kolona):
+        """Tekst ćelije u istom formatu kao ranija QTableWidget tabela."""
+        if kolona == 0:
+            return str(red[0])
+        if kolona in (1, 2):
+            return str(red[kolona] or "")
+        if kolona == 3:
+            return f"{red[3] or 0:02}:{red[4] or 0:02}"
+        if kolona == 4:
+            return f"{red[5] or 0:02}:{red[6] or 0:02}"
+        if kolona == 5:
+            return str(red[7]) if red[7] is not None else ""
+        if kolona == 6:
+            return str(red[8]) if red[8] is not None else "R"
+        if kolona == 7:
+            return str(red[9]) if red[9] is not None else ""
+        return None
+
+    @classmethod
+    def _kljuc(cls, red, kolona):
+        """Ključ za sortiranje: vremena u minutima, ostalo kao tekst."""
+        if kolona == 3:
+            return (red[3] or 0) * 60 + (red[4] or 0)
+        if kolona == 4:
+            return (red[5] or 0) * 60 + (red[6] or 0)
+        return cls._tekst(red, kolona) or ""
+
+# --- MODEL TABELE TURNUSA ---
+
+class TurnusiModel(RedoviModel):
+    """Model tabele turnusa; red je (id, naziv, serija_vv, sekcija, (broj_voza, ...))."""
+    ZAGLAVLJA = ["Naziv", "Serija VV", "Vozovi", "Sekcija", "Akcije"]
+    KOLONA_VOZOVI = 2
+    KOLONA_AKCIJE = 4
+    AKCIJE = ("Uredi", "Obriši", "Grafik")
+    DUGMAD = {KOLONA_AKCIJE: AKCIJE}
+    BOJA_NEISPRAVNOG = QColor("#ffcccc")  # Kao status_label kad provera nađe grešku
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._neispravni = {}  # turnus_id -> tekst grešaka (vidi postavi_neispravne)
+
+    def postavi_neispravne(self, neispravni):
+        """Označava turnuse sa greškama: {turnus_id: tekst} boji red i daje tekst kao opis alata."""
+        self._neispravni = dict(neispravni)
+        if self._redovi:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._redovi) - 1, self.KOLONA_AKCIJE - 1),
+                                  [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole])
+
+    def oznaci_turnus(self, turnus_id, greske):
+        """Označava jedan turnus kao neispravan (tekst grešaka) ili ispravan (None)."""
+        if greske is None:
+            if self._neispravni.pop(turnus_id, None) is None:
+                return
+        else:
+            self._neispravni[turnus_id] = greske
+        for i, red in enumerate(self._redovi):
+            if red[0] == turnus_id:
+                self.dataChanged.emit(self.index(i, 0), self.index(i, self.KOLONA_AKCIJE - 1),
+                                      [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole])
+                break
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and index.column() != self.KOLONA_AKCIJE and role in (
+                Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole):
+            greske = self._neispravni.get(self._redovi[index.row()][0])
+            if greske is None:
+                return None
+            return self.BOJA_NEISPRAVNOG if role == Qt.ItemDataRole.BackgroundRole else greske
+        return super().data(index, role)
+
+    @staticmethod
+    def _tekst(red, kolona):
+        if kolona == 0:
+            return str(red[1])
+        if kolona == 1:
+            return str(red[2]) if red[2] else ""
+        if kolona == 2:
+            return ", ".join(red[4])
+        if kolona == 3:
+            return str(red[3]) if red[3] else ""
+        return None
+
+    @classmethod
+    def _kljuc(cls, red, kolona):
+        """Ključ za sortiranje: vozovi po redosledu u turnusu, ostalo kao tekst."""
+        if kolona == 2:
+            return red[4]
+        return cls._tekst(red, kolona) or ""
+
+# --- MODEL LISTE ZA FILTERE ---
+
+class FilterModel(QAbstractListModel):
+    """Sortirana lista vrednosti filtera sa checkboxom u svakom redu.
+
+    Čekiranost se vodi kao skup nečekiranih vrednosti, pa je provera 'sve čekirano'
+    O(1), a popunjavanje ne pravi nijedan widget po vrednosti. Uz svaku vrednost može
+    da stoji i proizvoljan podatak (npr. id, sekcija i serija VV turnusa).
+    """
+    promenjeno = pyqtSignal()  # Korisnik je promenio čekiranost neke vrednosti
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._vrednosti = []
+        self._podaci = {}
+        self._neoznaceni = set()
+
+    def postavi_vrednosti(self, vrednosti, podaci=None):
+        """Zamenjuje sve vrednosti (već sortirane) novima; sve su čekirane."""
+        podaci = podaci or {}
+        self.beginResetModel()
+        self._vrednosti = list(vrednosti)
+        self._podaci = {v: podaci.get(v) for v in self._vrednosti}
+        self._neoznaceni = set()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._vrednosti)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        vrednost = self._vrednosti[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return vrednost
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Unchecked if vrednost in self._neoznaceni else Qt.CheckState.Checked
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        vrednost = self._vrednosti[index.row()]
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._neoznaceni.discard(vrednost)
+        else:
+            self._neoznaceni.add(vrednost)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.promenjeno.emit()
+        return True
+
+    def vrednosti(self):
+        return list(self._vrednosti)
+
+    def sadrzi(self, vrednost):
+        return vrednost in self._podaci
+
+    def je_cekirano(self, vrednost):
+        return vrednost in self._podaci and vrednost not in self._neoznaceni
+
+    def sve_cekirano(self):
+        return not self._neoznaceni
+
+    def cekirane(self):
+        """Vraća čekirane vrednosti po redu iz liste."""
+        return [v for v in self._vrednosti if v not in self._neoznaceni]
+
+    def postavi_cekirane(self, vrednosti):
+        """Čekira tačno zadate vrednosti (ostale rasčekira), bez signala 'promenjeno'."""
+        cekirane = set(vrednosti)
+        self._neoznaceni = {v for v in self._vrednosti if v not in cekirane}
+        if self._vrednosti:
+            self.dataChanged.emit(self.index(0), self.index(len(self._vrednosti) - 1),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+    def podatak(self, vrednost):
+        return self._podaci.get(vrednost)
+
+    def postavi_podatak(self, vrednost, podatak):
+        if vrednost in self._podaci:
+            self._podaci[vrednost] = podatak
+
+    def dodaj(self, vrednost, podatak=None, cekirano=True):
+        """Umeće vrednost na sortirano mesto (ako već ne postoji)."""
+        if vrednost in self._podaci:
+            return
+        i = bisect.bisect_right(self._vrednosti, vrednost)
+        self.beginInsertRows(QModelIndex(), i, i)
+        self._vrednosti.insert(i, vrednost)
+        self._podaci[vrednost] = podatak
+        if not cekirano:
+            self._neoznaceni.add(vrednost)
+        self.endInsertRows()
+
+    def ukloni(self, vrednost):
+        """Uklanja vrednost iz liste (ako postoji)."""
+        if vrednost not in self._podaci:
+            return
+        i = self._vrednosti.index(vrednost)
+        self.beginRemoveRows(QModelIndex(), i, i)
+        del self._vrednosti[i]
+        del self._podaci[vrednost]
+        self._neoznaceni.discard(vrednost)
+        self.endRemoveRows()
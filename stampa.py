@@ -0,0 +1,333 @@
+import argparse
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtGui import QFont, QGuiApplication, QPageLayout, QPageSize, QPainter, QPdfWriter
+from PyQt6.QtCore import Qt, QMarginsF, QRect, QRectF
+from PyQt6.QtSvg import QSvgGenerator
+
+try:
+    from pypdf import PdfWriter
+except ImportError:  # Bez pypdf paketni izvoz radi u jednom procesu
+    PdfWriter = None
+
+from jezgro import (
+    Baza, DB_PATH, SIRINA_SATA, VISINA_TURNUSA, procitaj_nazive_turnusa, procitaj_turnuse_za_stampu,
+    procitaj_vozove_za_grafik, vozovi_po_turnusu
+)
+from grafik import TurnusGraphicItem, crtaj_linije_puta, crtaj_vremensku_osu
+
+# --- RASPORED STRANE ---
+# Strana se crta u istim jedinicama kao grafik na ekranu (px pri 96 DPI), pa se
+# skalira na papir; tako linije, natpisi i fontovi zadržavaju odnos kao na ekranu.
+
+REZOLUCIJA = 96  # DPI izvoza; PDF i SVG su vektorski, pa ovo određuje samo jedinice
+MARGINA_MM = 10
+TURNUSA_PO_STRANI = 7  # toliko staje na A4 (položeno) bez smanjivanja grafika
+KOLONA_NAZIVA = 120  # levo od ose 00, za naziv turnusa
+ZAGLAVLJE = 70  # naslov i vremenska osa
+RAZMAK_ISPOD_OSE = 20  # stanice prvog turnusa su iznad njegovog reda
+
+def _a4(orijentacija=QPageLayout.Orientation.Landscape):
+    """Raspored A4 strane sa marginama (položena strana, zbog 24 sata po širini)."""
+    return QPageLayout(
+        QPageSize(QPageSize.PageSizeId.A4), orijentacija,
+        QMarginsF(MARGINA_MM, MARGINA_MM, MARGINA_MM, MARGINA_MM), QPageLayout.Unit.Millimeter
+    )
+
+def naslov_stampe(godina=""):
+    """Naslov strane, sa godinom reda vožnje ako je zadata (vidi godina_za_grafik)."""
+    godina = godina.strip()
+    if not godina:
+        return "GRAFIČKI TURNUS VUČNIH VOZILA ZA RED VOŽNJE"
+    return f"GRAFIČKI TURNUS VUČNIH VOZILA ZA RED VOŽNJE {godina} GODINU"
+
+def velicina_sadrzaja(turnusa_po_strani):
+    """Širina i visina jedne strane grafika u jedinicama grafika."""
+    sirina = KOLONA_NAZIVA + 25 * SIRINA_SATA
+    visina = ZAGLAVLJE + RAZMAK_ISPOD_OSE + turnusa_po_strani * VISINA_TURNUSA
+    return sirina, visina
+
+def broj_strana(broj_turnusa, turnusa_po_strani=TURNUSA_PO_STRANI):
+    """Broj strana potreban za dati broj turnusa."""
+    return math.ceil(broj_turnusa / turnusa_po_strani)
+
+def procitaj_stranu(cursor, turnus_ids):
+    """Turnusi jedne strane kao [(naziv, vozovi), ...], redom kao turnus_ids."""
+    nazivi = procitaj_nazive_turnusa(cursor, turnus_ids)
+    vozovi = vozovi_po_turnusu(procitaj_vozove_za_grafik(cursor, turnus_ids))
+    return [(nazivi.get(turnus_id, ""), vozovi.get(turnus_id, [])) for turnus_id in turnus_ids]
+
+def strane_za_stampu(cursor, turnus_ids, turnusa_po_strani=TURNUSA_PO_STRANI):
+    """Generator strana: za svaku stranu čita iz baze samo njene turnuse (vidi procitaj_stranu)."""
+    for pocetak in range(0, len(turnus_ids), turnusa_po_strani):
+        yield procitaj_stranu(cursor, turnus_ids[pocetak:pocetak + turnusa_po_strani])
+
+# --- CRTANJE STRANE ---
+
+def crtaj_stranu(painter, sirina, visina, turnusi, turnusa_po_strani, naslov="", strana=1, ukupno_strana=1):
+    """Crta jednu stranu grafika u pravougaonik (0, 0, sirina, visina) paintera.
+
+    Sadržaj se umanjuje (ili uvećava) da stane, sa zadržanim odnosom stranica. Svaka
+    strana ima naslov, broj strane i vremensku osu; turnusi su parovi (naziv, vozovi).
+    """
+    sirina_sadrzaja, visina_sadrzaja = velicina_sadrzaja(turnusa_po_strani)
+    razmera = min(sirina / sirina_sadrzaja, visina / visina_sadrzaja)
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(razmera, razmera)
+    painter.translate(KOLONA_NAZIVA, 0)
+
+    # Naslov levo, broj strane desno
+    font = QFont("Arial", 12)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(Qt.GlobalColor.black)
+    painter.drawText(QRectF(-KOLONA_NAZIVA, 0, sirina_sadrzaja, 24), Qt.AlignmentFlag.AlignLeft, naslov)
+    painter.setFont(QFont("Arial", 9))
+    painter.drawText(
+        QRectF(-KOLONA_NAZIVA, 0, sirina_sadrzaja, 24), Qt.AlignmentFlag.AlignRight,
+        f"Strana {strana}/{ukupno_strana}"
+    )
+    crtaj_vremensku_osu(painter, lambda h: h * SIRINA_SATA, ZAGLAVLJE - 10)
+
+    font_grafika = QFont()  # isti font kao natpisi na ekranu
+    font_naziva = QFont("Arial", 9)
+    font_naziva.setBold(True)
+    y = ZAGLAVLJE + RAZMAK_ISPOD_OSE
+    for naziv, vozovi in turnusi:
+        painter.translate(0, y)
+        painter.setFont(font_grafika)
+        crtaj_linije_puta(painter)
+        if vozovi:
+            TurnusGraphicItem(None, vozovi).crtaj(painter)
+        painter.setFont(font_naziva)
+        painter.setPen(Qt.GlobalColor.black)
+        painter.drawText(
+            QRectF(-KOLONA_NAZIVA, 0, KOLONA_NAZIVA - 10, VISINA_TURNUSA),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextWordWrap, naziv
+        )
+        painter.translate(0, -y)
+        y += VISINA_TURNUSA
+    painter.restore()
+
+# --- IZVOZ ---
+
+def izvezi_pdf(cursor, turnus_ids, putanja, turnusa_po_strani=TURNUSA_PO_STRANI, naslov="", napredak=None,
+               prva_strana=1, ukupno_strana=None):
+    """Izvozi grafik turnusa u PDF sa A4 stranama; vraća broj strana.
+
+    Strane se čitaju iz baze i crtaju jedna po jedna, pa memorija ne raste sa brojem
+    turnusa. napredak(strana, ukupno) se poziva posle svake strane. prva_strana i
+    ukupno_strana menjaju samo brojeve strana u zaglavlju (kad je ovo deo većeg izvoza).
+    """
+    ukupno = broj_strana(len(turnus_ids), turnusa_po_strani)
+    if not ukupno:
+        return 0
+    pisac = QPdfWriter(putanja)
+    pisac.setResolution(REZOLUCIJA)
+    pisac.setPageLayout(_a4())
+    pisac.setTitle(naslov)
+    painter = QPainter(pisac)
+    try:
+        for indeks, turnusi in enumerate(strane_za_stampu(cursor, turnus_ids, turnusa_po_strani)):
+            if indeks:
+                pisac.newPage()
+            crtaj_stranu(painter, pisac.width(), pisac.height(), turnusi, turnusa_po_strani,
+                         naslov, prva_strana + indeks, ukupno_strana or ukupno)
+            if napredak:
+                napredak(indeks + 1, ukupno)
+    finally:
+        painter.end()
+    return ukupno
+
+def putanja_svg_strane(putanja, strana, ukupno):
+    """Putanja SVG fajla strane: ista putanja za jednu stranu, inače sa rednim brojem (ime_01.svg)."""
+    if ukupno == 1:
+        return putanja
+    osnova, ekstenzija = os.path.splitext(putanja)
+    return f"{osnova}_{strana:0{len(str(ukupno))}d}{ekstenzija or '.svg'}"
+
+def izvezi_svg(cursor, turnus_ids, putanja, turnusa_po_strani=TURNUSA_PO_STRANI, naslov="", napredak=None):
+    """Izvozi grafik turnusa u SVG, jedan fajl po A4 strani; vraća listu napravljenih fajlova."""
+    ukupno = broj_strana(len(turnus_ids), turnusa_po_strani)
+    raspored = _a4()
+    strana_px = raspored.fullRectPixels(REZOLUCIJA)
+    sadrzaj_px = raspored.paintRectPixels(REZOLUCIJA)
+    fajlovi = []
+    for indeks, turnusi in enumerate(strane_za_stampu(cursor, turnus_ids, turnusa_po_strani)):
+        fajl = putanja_svg_strane(putanja, indeks + 1, ukupno)
+        generator = QSvgGenerator()
+        generator.setFileName(fajl)
+        generator.setResolution(REZOLUCIJA)
+        generator.setSize(strana_px.size())
+        generator.setViewBox(QRect(0, 0, strana_px.width(), strana_px.height()))
+        generator.setTitle(naslov)
+        painter = QPainter(generator)
+        try:
+            painter.translate(sadrzaj_px.topLeft().toPointF())
+            crtaj_stranu(painter, sadrzaj_px.width(), sadrzaj_px.height(), turnusi, turnusa_po_strani,
+                         naslov, indeks + 1, ukupno)
+        finally:
+            painter.end()
+        fajlovi.append(fajl)
+        if napredak:
+            napredak(indeks + 1, ukupno)
+    return fajlovi
+
+# --- PREGLED ZA ŠTAMPU ---
+
+class StranaStampe(QGraphicsItem):
+    """Jedna A4 strana za pregled u tabu 'Štampa turnusa', crtana isto kao pri izvozu."""
+    def __init__(self, turnusi, turnusa_po_strani, naslov="", strana=1, ukupno_strana=1):
+        super().__init__()
+        self.turnusi = turnusi
+        self.turnusa_po_strani = turnusa_po_strani
+        self.naslov = naslov
+        self.strana = strana
+        self.ukupno_strana = ukupno_strana
+        raspored = _a4()
+        self._strana = QRectF(raspored.fullRectPixels(REZOLUCIJA))
+        self._sadrzaj = QRectF(raspored.paintRectPixels(REZOLUCIJA))
+
+    def boundingRect(self):
+        return self._strana
+
+    def paint(self, painter, option, widget=None):
+        painter.fillRect(self._strana, Qt.GlobalColor.white)
+        painter.setPen(Qt.GlobalColor.gray)
+        painter.drawRect(self._strana)
+        painter.save()
+        painter.translate(self._sadrzaj.topLeft())
+        crtaj_stranu(painter, self._sadrzaj.width(), self._sadrzaj.height(), self.turnusi,
+                     self.turnusa_po_strani, self.naslov, self.strana, self.ukupno_strana)
+        painter.restore()
+
+# --- PAKETNI IZVOZ U VIŠE PROCESA ---
+# Svaki proces ima svoj (offscreen) QGuiApplication i svoju konekciju ka bazi i
+# crta grupu uzastopnih strana u privremeni PDF; grupe se na kraju spajaju redom.
+
+GRUPA_PO_PROCESU = 4  # grupa strana po procesu, da bi se posao ravnomerno raspodelio
+
+_radnik = {}
+
+def _pokreni_radnika(putanja_baze, red_napretka):
+    """Inicijalizacija procesa u pool-u: Qt bez ekrana, konekcija ka bazi i red za napredak."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    _radnik["app"] = QGuiApplication.instance() or QGuiApplication([])
+    _radnik["conn"] = Baza(putanja_baze).nova_konekcija()
+    _radnik["napredak"] = red_napretka
+
+def _izvezi_grupu(turnus_ids, putanja, turnusa_po_strani, naslov, prva_strana, ukupno_strana):
+    """Crta jednu grupu strana u zaseban PDF (izvršava se u procesu iz pool-a)."""
+    red_napretka = _radnik["napredak"]
+    izvezi_pdf(_radnik["conn"].cursor(), turnus_ids, putanja, turnusa_po_strani, naslov,
+               lambda strana, ukupno: red_napretka.put(1), prva_strana, ukupno_strana)
+    return putanja
+
+def izvezi_pdf_paralelno(putanja_baze, turnus_ids, putanja, turnusa_po_strani=TURNUSA_PO_STRANI, naslov="",
+                         procesa=None, napredak=None):
+    """Izvozi grafik u jedan PDF crtajući grupe strana u više procesa; vraća broj strana.
+
+    Turnusi se dele na grupe uzastopnih strana, svaka grupa se crta u svom procesu u
+    privremeni PDF, a oni se spajaju redom (pypdf). napredak(gotovo, ukupno) se poziva
+    u ovom procesu posle svake nacrtane strane. Bez pypdf izvoz radi u jednom procesu.
+    """
+    ukupno = broj_strana(len(turnus_ids), turnusa_po_strani)
+    if not ukupno:
+        return 0
+    procesa = procesa or os.cpu_count() or 1
+    if PdfWriter is None or procesa == 1:
+        conn = Baza(putanja_baze).nova_konekcija()
+        try:
+            return izvezi_pdf(conn.cursor(), turnus_ids, putanja, turnusa_po_strani, naslov, napredak)
+        finally:
+            conn.close()
+
+    strana_po_grupi = max(1, math.ceil(ukupno / (procesa * GRUPA_PO_PROCESU)))
+    turnusa_po_grupi = strana_po_grupi * turnusa_po_strani
+    # Qt ne sme da se nasledi kroz fork, pa procesi kreću ispočetka (spawn)
+    kontekst = multiprocessing.get_context("spawn")
+    red_napretka = kontekst.Queue()
+    with tempfile.TemporaryDirectory(prefix="stampa_") as privremeni, ProcessPoolExecutor(
+        procesa, mp_context=kontekst, initializer=_pokreni_radnika, initargs=(putanja_baze, red_napretka)
+    ) as pool:
+        poslovi = []
+        for indeks, pocetak in enumerate(range(0, len(turnus_ids), turnusa_po_grupi)):
+            poslovi.append(pool.submit(
+                _izvezi_grupu, turnus_ids[pocetak:pocetak + turnusa_po_grupi],
+                os.path.join(privremeni, f"grupa_{indeks:05d}.pdf"), turnusa_po_strani, naslov,
+                indeks * strana_po_grupi + 1, ukupno
+            ))
+        gotovo = 0
+        while gotovo < ukupno:
+            try:
+                red_napretka.get(timeout=0.2)
+            except queue.Empty:
+                # Proces koji je pao ne javlja napredak; greška se vidi kroz result() ispod
+                if all(posao.done() for posao in poslovi):
+                    break
+                continue
+            gotovo += 1
+            if napredak:
+                napredak(gotovo, ukupno)
+        delovi = [posao.result() for posao in poslovi]
+
+        spojeni = PdfWriter()
+        for deo in delovi:
+            spojeni.append(deo)
+        spojeni.add_metadata({"/Title": naslov})
+        with open(putanja, "wb") as f:
+            spojeni.write(f)
+    return ukupno
+
+# --- POKRETANJE IZ KOMANDNE LINIJE ---
+
+def main(argumenti=None):
+    """Paketna štampa svih turnusa (sve sekcije i serije VV) u jedan PDF."""
+    parser = argparse.ArgumentParser(description="Izvoz grafika svih turnusa u PDF (A4).")
+    parser.add_argument("izlaz", help="putanja PDF fajla")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    parser.add_argument("--po-strani", type=int, default=TURNUSA_PO_STRANI, help="turnusa po strani")
+    parser.add_argument("--procesa", type=int, default=None, help="broj procesa (podrazumevano svi procesori)")
+    parser.add_argument("--godina", default=None,
+                        help="godina reda vožnje za naslov (podrazumevano iz data/godina_grafik.txt)")
+    args = parser.parse_args(argumenti)
+
+    godina = args.godina
+    if godina is None:
+        try:
+            with open("data/godina_grafik.txt", "r", encoding="utf-8") as f:
+                godina = f.read().strip()
+        except FileNotFoundError:
+            godina = ""
+
+    try:
+        baza = Baza.postojeca(args.baza)
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    try:
+        turnus_ids = procitaj_turnuse_za_stampu(baza.conn.cursor())
+    finally:
+        baza.zatvori()
+
+    def napredak(gotovo, ukupno):
+        print(f"\rStrana {gotovo}/{ukupno}", end="", flush=True)
+
+    # Glavni proces takođe crta ako nema pypdf ili je zadat jedan proces
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication.instance() or QGuiApplication([])
+    strana = izvezi_pdf_paralelno(args.baza, turnus_ids, args.izlaz, args.po_strani, naslov_stampe(godina),
+                                  args.procesa, napredak)
+    print(f"\n✅ Izvezeno {len(turnus_ids)} turnusa na {strana} strana u '{args.izlaz}'")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
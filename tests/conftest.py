@@ -0,0 +1,27 @@
+import pytest
+
+from jezgro import Baza, upisi_voz, upisi_vozove_turnusa
+
+@pytest.fixture
+def baza():
+    """Prazna baza u memoriji sa svim migracijama."""
+    baza = Baza(":memory:")
+    baza.migriraj()
+    yield baza
+    baza.zatvori()
+
+@pytest.fixture
+def upisi_turnus(baza):
+    """Upisuje vozove (koji još ne postoje) i turnus sa njima; vraća id turnusa."""
+    def upisi(naziv, vozovi, serija_vv="441", sekcija="KV"):
+        with baza.transakcija() as cursor:
+            for v in vozovi:
+                cursor.execute("SELECT 1 FROM vozovi WHERE broj_voza = ?", (v.broj,))
+                if cursor.fetchone() is None:
+                    upisi_voz(cursor, v)
+            cursor.execute("INSERT INTO turnusi (naziv, serija_vv, sekcija) VALUES (?, ?, ?)",
+                           (naziv, serija_vv, sekcija))
+            turnus_id = cursor.lastrowid
+            upisi_vozove_turnusa(cursor, turnus_id, [v.broj for v in vozovi])
+        return turnus_id
+    return upisi
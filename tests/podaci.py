@@ -0,0 +1,11 @@
+from jezgro import Voz
+
+def voz(broj, pocetna, krajnja, polazak, dolazak, serija="441", sekcija="KV"):
+    """Voz sa vremenima 'HH:MM'."""
+    sat_p, min_p = (int(deo) for deo in polazak.split(":"))
+    sat_d, min_d = (int(deo) for deo in dolazak.split(":"))
+    return Voz(broj, pocetna, krajnja, sat_p, min_p, sat_d, min_d, serija, 'R', sekcija)
+
+def voznje(*vozovi):
+    """(polazak, dolazak) u minutima, kao za dani_ciklusa."""
+    return [(v.polazak_min, v.dolazak_min) for v in vozovi]
@@ -0,0 +1,105 @@
+import sqlite3
+
+import pytest
+
+from jezgro import (
+    Baza, dani_ciklusa, migriraj, procitaj_dane_ciklusa, procitaj_km_turnusa, procitaj_poslednje_preglede,
+    procitaj_potrebu_lokomotiva, procitaj_projekciju_kilometraze, procitaj_vozila, procitaj_vozove_po_broju,
+    upisi_rastojanja
+)
+from jezgro.baza import MIGRACIJE
+
+from .podaci import voz, voznje
+
+def _kolone(cursor, tabela):
+    cursor.execute(f"PRAGMA table_info({tabela})")
+    return {red[1] for red in cursor.fetchall()}
+
+def test_migracije_na_praznoj_bazi(baza):
+    cursor = baza.cursor()
+    assert cursor.execute("PRAGMA user_version").fetchone()[0] == MIGRACIJE[-1][0]
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    tabele = {red[0] for red in cursor.fetchall()}
+    assert {"vozovi", "turnusi", "turnus_vozovi", "pregledi", "rastojanja", "vozila"} <= tabele
+    # Ponovno pokretanje ne menja ništa
+    assert baza.migriraj() == MIGRACIJE[-1][0]
+
+def test_migracije_stare_seme():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE turnusi (id INTEGER PRIMARY KEY AUTOINCREMENT, naziv TEXT UNIQUE)")
+    conn.execute("INSERT INTO turnusi (naziv) VALUES ('T1')")
+    conn.commit()
+    assert migriraj(conn) == MIGRACIJE[-1][0]
+    cursor = conn.cursor()
+    assert {"sekcija", "serija_vv", "opis"} <= _kolone(cursor, "turnusi")
+    assert "km" in _kolone(cursor, "vozovi")
+    assert cursor.execute("SELECT naziv FROM turnusi").fetchall() == [("T1",)]
+    conn.close()
+
+def test_pregledi_stare_seme_prelaze_na_vozila():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("PRAGMA foreign_keys = ON")
+    for _, migracija in MIGRACIJE[:4]:
+        migracija(conn.cursor())
+    conn.execute("PRAGMA user_version = 4")
+    conn.execute("INSERT INTO turnusi (naziv) VALUES ('T1')")
+    conn.executemany("INSERT INTO pregledi (turnus_id, vozilo, vrsta, datum) VALUES (1, ?, ?, ?)",
+                     [(1, "P1", "2025-07-01"), (1, "P3", "2025-06-01"), (2, "P1", "2025-07-10")])
+    conn.commit()
+    assert migriraj(conn) == MIGRACIJE[-1][0]
+    cursor = conn.cursor()
+    assert procitaj_vozila(cursor) == {(1, 1): "T1/1", (1, 2): "T1/2"}
+    assert procitaj_poslednje_preglede(cursor) == {"T1/1": {"P1": "2025-07-01", "P3": "2025-06-01"},
+                                                   "T1/2": {"P1": "2025-07-10"}}
+    conn.close()
+
+def test_postojeca_baza_mora_da_postoji(tmp_path):
+    putanja = tmp_path / "nema" / "baza.db"
+    with pytest.raises(FileNotFoundError):
+        Baza.postojeca(str(putanja))
+    assert not putanja.parent.exists()
+
+def test_dani_ciklusa_u_sql_kao_u_domenu(baza, upisi_turnus):
+    turnusi = {
+        "isti dan": [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00")],
+        "preko ponoći": [voz("201", "BG", "NS", "06:00", "10:00"), voz("202", "NS", "BG", "09:00", "11:00")],
+        "prelazni": [voz("301", "BG", "NS", "06:00", "12:00"), voz("302", "NS", "BG", "22:00", "03:00")],
+        "prelazni posle prvog": [voz("401", "BG", "NS", "02:00", "06:00"), voz("402", "NS", "BG", "22:00", "03:00")],
+        "dolazak u minutu polaska": [voz("501", "BG", "NS", "06:00", "10:00"),
+                                     voz("502", "NS", "BG", "10:00", "06:00")],
+        "ponoć": [voz("601", "BG", "NS", "00:00", "12:00"), voz("602", "NS", "BG", "12:30", "23:59")],
+    }
+    ids = {naziv: upisi_turnus(naziv, vozovi) for naziv, vozovi in turnusi.items()}
+    dani = procitaj_dane_ciklusa(baza.cursor())
+    assert {naziv: dani[ids[naziv]] for naziv in turnusi} == {
+        naziv: dani_ciklusa(voznje(*vozovi)) for naziv, vozovi in turnusi.items()}
+    assert [dani[ids[naziv]] for naziv in turnusi] == [1, 2, 2, 2, 3, 1]
+    assert procitaj_potrebu_lokomotiva(baza.cursor()) == [("KV", "441", 6, 12, 11)]
+
+def test_km_vozova_prate_rastojanja(baza, upisi_turnus):
+    upisi_turnus("T1", [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00")])
+    cursor = baza.cursor()
+
+    def km():
+        cursor.execute("SELECT broj_voza, km FROM vozovi ORDER BY broj_voza")
+        return cursor.fetchall()
+
+    assert km() == [("101", None), ("102", None)]
+    upisi_rastojanja(cursor, [("NS", "BG", 80.0)])
+    assert km() == [("101", 80.0), ("102", 80.0)]
+    upisi_rastojanja(cursor, [("BG", "NS", 77.5)])
+    assert km() == [("101", 77.5), ("102", 77.5)]
+    cursor.execute("UPDATE vozovi SET krajnja_stanica = 'SU' WHERE broj_voza = '101'")
+    assert km() == [("101", None), ("102", 77.5)]
+    assert procitaj_vozove_po_broju(cursor, ["102"])["102"].krajnja == "BG"
+
+def test_kruzni_vozovi_se_broje_posebno(baza, upisi_turnus):
+    vozovi = [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "SU", "09:00", "11:00"),
+              voz("103", "SU", "SU", "12:00", "13:00")]
+    turnus_id = upisi_turnus("T1", vozovi)
+    cursor = baza.cursor()
+    upisi_rastojanja(cursor, [("BG", "NS", 80.0)])
+    with pytest.raises(sqlite3.IntegrityError):
+        upisi_rastojanja(cursor, [("SU", "SU", 5.0)])
+    assert procitaj_km_turnusa(cursor) == {turnus_id: (80.0, 1, 1)}
+    assert procitaj_projekciju_kilometraze(cursor, 10) == [("KV", "441", 1, 80.0, 800.0, 1, 1)]
@@ -0,0 +1,67 @@
+import pytest
+
+from jezgro import dani_ciklusa, dani_puta, nalazi_turnusa, oznaka_vozila
+
+from .podaci import voz, voznje
+
+def test_prazan_turnus_nema_dana():
+    assert dani_ciklusa([]) == 0
+
+def test_voz_koji_se_vraca_isti_dan():
+    assert dani_ciklusa(voznje(voz("101", "BG", "BG", "06:00", "08:00"))) == 1
+
+def test_povratak_istog_dana():
+    tur = voznje(voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00"))
+    assert dani_ciklusa(tur) == 1
+
+def test_voz_koji_polazi_pre_dolaska_prethodnog_je_sutradan():
+    tur = voznje(voz("101", "BG", "NS", "06:00", "10:00"), voz("102", "NS", "BG", "09:00", "11:00"))
+    assert dani_ciklusa(tur) == 2
+
+def test_polazak_u_minutu_dolaska_je_sutradan():
+    tur = voznje(voz("101", "BG", "NS", "06:00", "10:00"), voz("102", "NS", "BG", "10:00", "12:00"))
+    assert dani_ciklusa(tur) == 2
+
+@pytest.mark.parametrize("dolazak, dana", [
+    ("03:00", 2),  # Prelazni poslednji stiže posle ponoći: turnus traje dva dana
+    ("06:00", 2),
+    ("07:00", 2),
+])
+def test_prelazni_poslednji_voz(dolazak, dana):
+    tur = voznje(voz("101", "BG", "NS", "06:00", "12:00"), voz("102", "NS", "BG", "22:00", dolazak))
+    assert dani_ciklusa(tur) == dana
+
+def test_ispravan_turnus_od_dva_dana():
+    # Prolazi proveru turnusa (vožnje redom, prelazna stiže pre prvog polaska), a traje dva dana
+    vozovi = {v.broj: v for v in (voz("101", "BG", "NS", "05:00", "07:00"), voz("102", "NS", "BG", "08:00", "12:00"),
+                                  voz("103", "BG", "SU", "23:10", "01:40"))}
+    assert nalazi_turnusa(list(vozovi), vozovi) == []
+    assert dani_ciklusa(voznje(*vozovi.values())) == 2
+    assert oznaka_vozila([v._asdict() for v in vozovi.values()]) == "1-2"
+
+def test_okret():
+    tur = voznje(voz("101", "BG", "NS", "06:00", "10:00"), voz("102", "NS", "BG", "10:20", "12:00"))
+    assert dani_ciklusa(tur) == 1
+    assert dani_ciklusa(tur, okret=20) == 1
+    assert dani_ciklusa(tur, okret=30) == 2
+
+def test_okret_preko_ponoci():
+    # Dolazak u 23:50, prvi polazak u 00:10: 20 minuta okreta
+    tur = voznje(voz("101", "BG", "NS", "00:10", "05:00"), voz("102", "NS", "BG", "06:00", "23:50"))
+    assert dani_ciklusa(tur, okret=15) == 1
+    assert dani_ciklusa(tur, okret=30) == 2
+
+def test_dani_puta_deli_niz():
+    a = voz("101", "BG", "NS", "06:00", "12:00")
+    b = voz("102", "NS", "SU", "11:00", "14:00")
+    c = voz("103", "SU", "BG", "22:00", "05:00")
+    assert dani_puta(voznje(a, b)) + dani_puta(voznje(b, c)) == dani_puta(voznje(a, b, c)) == 1
+    assert dani_puta(voznje(a)) == 0
+    # b je sutradan, c stiže posle ponoći, a turnus ponovo počinje dan kasnije
+    assert dani_ciklusa(voznje(a, b, c)) == 3
+
+def test_voz_preko_ponoci():
+    v = voz("101", "BG", "NS", "23:30", "01:15")
+    assert v.prelazni
+    assert v.trajanje_min == 105
+    assert not voz("102", "BG", "NS", "01:15", "23:30").prelazni
@@ -0,0 +1,27 @@
+from jezgro import Baza, upisi_voz, upisi_vozove_turnusa
+from jezgro.kilometraza import main
+
+from .podaci import voz
+
+def test_baza_mora_da_postoji(tmp_path, capsys):
+    putanja = tmp_path / "baza.db"
+    assert main(["--baza", str(putanja)]) == 1
+    assert "ne postoji" in capsys.readouterr().out
+    assert not putanja.exists()
+
+def test_projekcija_prijavljuje_kruzne_vozove(tmp_path, capsys):
+    putanja = tmp_path / "baza.db"
+    baza = Baza(str(putanja))
+    baza.migriraj()
+    with baza.transakcija() as cursor:
+        vozovi = [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "NS", "09:00", "10:00")]
+        for v in vozovi:
+            upisi_voz(cursor, v)
+        cursor.execute("INSERT INTO turnusi (naziv, serija_vv, sekcija) VALUES ('T1', '441', 'KV')")
+        upisi_vozove_turnusa(cursor, cursor.lastrowid, [v.broj for v in vozovi])
+    baza.zatvori()
+    rastojanja = tmp_path / "rastojanja.csv"
+    rastojanja.write_text("BG;NS;80\n", encoding="utf-8")
+    assert main(["--baza", str(putanja), "--uvezi", str(rastojanja), "--dana", "10"]) == 0
+    izlaz = capsys.readouterr().out
+    assert "kružnih vozova: 1" in izlaz and "800 km za 10 dana" in izlaz
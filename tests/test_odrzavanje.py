@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+import sqlite3
+
+import pytest
+
+from jezgro import dodeli_vozilo, procitaj_poslednje_preglede, upisi_pregled, upisi_rastojanja
+from jezgro.odrzavanje import (
+    INTERVALI_PREGLEDA, TOLERANCIJA, PlanPregleda, _intervali, planiraj_vozilo, rad_vozila, vrste_bez_evidencije
+)
+
+from .podaci import voz
+
+INTERVALI = _intervali(("P1", 30, 10000), ("P3", 90))
+AVGUST = (date(2025, 8, 1), date(2025, 8, 31))
+
+def test_bez_evidencije_se_ne_planira():
+    assert planiraj_vozilo(INTERVALI, {}, 100, 5, *AVGUST) == []
+    assert vrste_bez_evidencije(INTERVALI, {}) == ["P1", "P3"]
+
+def test_nizi_pregled_bez_evidencije_pokrece_visi():
+    # P3 obuhvata P1, pa P1 ide 30 dana posle P3; P3 sam nije na redu u avgustu
+    pregledi = planiraj_vozilo(INTERVALI, {"P3": date(2025, 7, 20)}, 100, 5, *AVGUST)
+    assert [(d, vrsta) for d, vrsta, *_ in pregledi] == [(date(2025, 8, 19), "P1")]
+    assert vrste_bez_evidencije(INTERVALI, {"P1": date(2025, 7, 20)}) == ["P3"]
+
+def test_tolerancija_i_kasnjenje():
+    pregledi = planiraj_vozilo(INTERVALI, {"P1": date(2025, 6, 20), "P3": date(2025, 6, 1)}, 100, 5, *AVGUST)
+    datum, vrsta, kriterijum, najkasnije, kasni = pregledi[0]
+    # Rok P1 (20.07.) je prošao: na redu je odmah, a najkasnije je rok uz toleranciju
+    assert (datum, vrsta, kriterijum, kasni) == (date(2025, 8, 1), "P1", "dana", True)
+    assert najkasnije == date(2025, 6, 20) + timedelta(days=int(30 * (1 + TOLERANCIJA)))
+    # P3 (rok 30.08.) obuhvata i P1 koji bi bio 31.08.
+    assert [(d, v) for d, v, *_ in pregledi[1:]] == [(date(2025, 8, 30), "P3")]
+
+def test_km_su_merodavni_kad_su_pre_dana():
+    pregledi = planiraj_vozilo(INTERVALI, {"P3": date(2025, 7, 31)}, 1000, 5, *AVGUST)
+    assert [(d, kriterijum) for d, _, kriterijum, *_ in pregledi] == [
+        (date(2025, 8, 10), "km"), (date(2025, 8, 20), "km"), (date(2025, 8, 30), "km")]
+
+def test_rad_vozila_deli_ciklus():
+    vozovi = [voz("101", "BG", "NS", "06:00", "10:00"), voz("102", "NS", "BG", "09:00", "11:00")]
+    vozila, km_dnevno, sati_dnevno = rad_vozila(vozovi, {"101": 80, "102": 80})
+    assert (vozila, km_dnevno, sati_dnevno) == (2, 80, 3)
+    # Voz bez km se ne procenjuje
+    assert rad_vozila(vozovi, {"101": 80, "102": None})[1] == 40
+
+def test_plan_pregleda_nad_bazom(baza, upisi_turnus):
+    t1 = upisi_turnus("T1", [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00")])
+    t2 = upisi_turnus("T2", [voz("201", "BG", "BG", "06:00", "08:00")])
+    upisi_turnus("T3", [voz("301", "BG", "BG", "06:00", "08:00")])
+    with baza.transakcija() as cursor:
+        upisi_rastojanja(cursor, [("BG", "NS", 80)])
+        dodeli_vozilo(cursor, "441-001", t1, 1)
+        dodeli_vozilo(cursor, "441-002", t2, 1)
+        upisi_pregled(cursor, "441-001", "P12", "2025-07-15")
+    plan = PlanPregleda.ucitaj(baza.cursor(), 2025, 8)
+    assert {(s.naziv, s.mesto, s.vozilo) for s in plan.stavke()} == {("T1", 1, "441-001")}
+    vrste = [i.vrsta for i in INTERVALI_PREGLEDA["441"]]
+    assert plan.bez_evidencije() == [("T2", 1, "441-002", vrste), ("T3", 1, None, vrste)]
+    # Vozovi bez rastojanja se prijavljuju umesto procene
+    assert plan.bez_km() == [("T2", ["201"]), ("T3", ["301"])]
+    sazetak = plan.sazetak()
+    assert "mesta bez dodeljenog vozila: 1" in sazetak and "vozila bez evidencije pregleda: 1" in sazetak
+    assert "vozova bez km: 2, od toga kružnih: 2" in sazetak
+    assert "bez km  T2  201 (kružni)" in list(plan.redovi())
+
+    plan.zabelezi_pregled("441-002", "P12", date(2025, 7, 20))
+    assert {s.vozilo for s in plan.stavke()} == {"441-001", "441-002"}
+    assert plan.bez_evidencije() == [("T3", 1, None, vrste)]
+
+def test_pregledi_pripadaju_vozilu(baza, upisi_turnus):
+    t1 = upisi_turnus("T1", [voz("101", "BG", "BG", "06:00", "08:00")])
+    t2 = upisi_turnus("T2", [voz("201", "BG", "BG", "06:00", "08:00")])
+    with baza.transakcija() as cursor:
+        dodeli_vozilo(cursor, "441-001", t1, 1)
+        upisi_pregled(cursor, "441-001", "P3", "2025-07-15")
+        # Vozilo prelazi u drugi turnus sa svojom evidencijom, a mesto u T1 ostaje prazno
+        dodeli_vozilo(cursor, "441-001", t2, 1)
+        cursor.execute("DELETE FROM turnus_vozovi WHERE turnus_id = ?", (t2,))
+        cursor.execute("DELETE FROM turnusi WHERE id = ?", (t2,))
+    cursor = baza.cursor()
+    assert procitaj_poslednje_preglede(cursor) == {"441-001": {"P3": "2025-07-15"}}
+    assert cursor.execute("SELECT turnus_id, mesto FROM vozila").fetchall() == [(None, 1)]
+    with pytest.raises(sqlite3.IntegrityError):
+        with baza.transakcija() as cursor:
+            cursor.execute("DELETE FROM vozila WHERE oznaka = '441-001'")
+    with pytest.raises(sqlite3.IntegrityError):
+        with baza.transakcija() as cursor:
+            upisi_pregled(cursor, "nema", "P3", "2025-07-15")
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from jezgro import dani_ciklusa, nalazi_turnusa, procitaj_id_turnusa, upisi_voz
+from jezgro.optimizacija import _lanci_dana, _spoji_lance, najvece_uparivanje, predlozi_turnuse, upisi_predlog
+
+from .podaci import voz, voznje
+
+def test_najvece_uparivanje():
+    # Pohlepno 0-0 bi ostavilo 1 neuparen; najveće uparivanje ga preusmerava
+    par = najvece_uparivanje([[0, 1], [0]], 2, [0, -1])
+    assert sorted(par) == [0, 1] and par[1] == 0
+
+def test_lanci_dana_uz_okret():
+    vozovi = [
+        voz("101", "BG", "NS", "06:00", "08:00"),
+        voz("102", "NS", "BG", "08:20", "10:00"),  # 20 min posle 101: ne stiže uz okret od 30
+        voz("103", "NS", "BG", "09:00", "11:00"),
+    ]
+    lanci = _lanci_dana(vozovi, 30)
+    assert sorted(lanci) == [[0, 2], [1]]
+    assert len(_lanci_dana(vozovi, 10)) == 2
+
+def test_prelazni_voz_zavrsava_lanac():
+    # 102 polazi iz NS posle dolaska 101, ali 101 stiže tek narednog dana
+    vozovi = [voz("101", "BG", "NS", "22:00", "01:00"), voz("102", "NS", "SU", "05:00", "07:00")]
+    assert sorted(_lanci_dana(vozovi, 30)) == [[0], [1]]
+
+def test_spoji_lance_uz_okret_preko_noci():
+    # Lanac 0 stiže u NS u 23:50; lanac 1 odatle kreće u 00:10, što je kraće od okreta
+    vozovi = [voz("101", "BG", "NS", "06:00", "23:50"), voz("102", "NS", "BG", "00:10", "05:00")]
+    assert _spoji_lance(vozovi, [[0], [1]], 30) == [([1, 0], False)]
+    assert _spoji_lance(vozovi, [[0], [1]], 15) == [([0, 1], True)]
+
+def test_petlja_koja_krsi_okret_nije_zatvorena():
+    vozovi = [voz("101", "BG", "NS", "00:10", "05:00"), voz("102", "NS", "BG", "05:40", "23:55")]
+    assert _spoji_lance(vozovi, [[0, 1]], 30) == [([0], False)]
+    assert _spoji_lance(vozovi, [[0, 1]], 10) == [([0], True)]
+
+def test_lanac_koji_ne_prolazi_krug_se_deli():
+    # 103 stiže u 06:30, posle polaska 101 u 06:00: drugi lanac počinje vozom 102
+    vozovi = [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "SU", "09:00", "11:00"),
+              voz("103", "SU", "BG", "23:00", "06:30")]
+    assert _lanci_dana(vozovi, 30) == [[0], [1, 2]]
+    vozovi[2] = voz("103", "SU", "BG", "23:00", "05:30")
+    assert _lanci_dana(vozovi, 30) == [[0, 1, 2]]
+
+def test_prelazni_kraj_se_spaja_dan_posle_dolaska():
+    # 101 stiže u NS u 03:00 narednog dana, a 102 odatle kreće u 02:00 dan posle toga
+    vozovi = [voz("101", "BG", "NS", "22:00", "03:00"), voz("102", "NS", "BG", "02:00", "06:00")]
+    assert _spoji_lance(vozovi, [[0], [1]], 30) == [([0, 1], True)]
+    # Turnus koji se završava prelaznim vozom traje dva dana, kao u dani_ciklusa
+    predlozi = predlozi_turnuse([vozovi[0], voz("103", "NS", "BG", "04:00", "08:00")], "KV", "441")
+    assert [(p.vozovi, p.lokomotiva, p.sledeci) for p in predlozi] == [(["103", "101"], 2, "KV-441-001")]
+
+def test_lokomotive_po_nizu():
+    vozovi = [voz("101", "BG", "NS", "06:00", "22:00"), voz("102", "NS", "BG", "06:00", "22:00"),
+              voz("103", "BG", "BG", "07:00", "09:00")]
+    predlozi = {p.naziv: p for p in predlozi_turnuse(vozovi, "KV", "441")}
+    assert [p.vozovi for p in predlozi.values()] == [["101"], ["102"], ["103"]]
+    prvi, drugi, treci = predlozi.values()
+    assert (prvi.sledeci, drugi.sledeci, treci.sledeci) == (drugi.naziv, prvi.naziv, treci.naziv)
+    assert prvi.lokomotiva + drugi.lokomotiva == dani_ciklusa(voznje(*vozovi[:2])) == 2
+    assert treci.lokomotiva == 1
+
+def test_kraj_otvorenog_niza_ima_lokomotivu():
+    # Iz SU ne kreće nijedan turnus, pa se niz 101, 102 ne zatvara
+    vozovi = [voz("101", "BG", "NS", "12:00", "14:00"), voz("102", "NS", "SU", "06:00", "10:00")]
+    predlozi = predlozi_turnuse(vozovi, "KV", "441")
+    assert [(p.vozovi, p.sledeci, p.lokomotiva) for p in predlozi] == [
+        (["101"], "KV-441-002", 1), (["102"], None, 1)]
+
+def test_predlozi_prolaze_proveru_turnusa():
+    stanice = ["BG", "NS", "SU", "NI", "ZR"]
+    for seme in range(20):
+        rnd = random.Random(seme)
+        vozovi = []
+        for i in range(rnd.randrange(20, 200)):
+            polazak = rnd.randrange(1440)
+            dolazak = (polazak + rnd.randrange(20, 600)) % 1440
+            pocetna, krajnja = rnd.sample(stanice, 2)
+            vozovi.append(voz(f"{i:04d}", pocetna, krajnja, f"{polazak // 60}:{polazak % 60}",
+                              f"{dolazak // 60}:{dolazak % 60}"))
+        info = {v.broj: v for v in vozovi}
+        predlozi = predlozi_turnuse(vozovi, "KV", "441", okret=rnd.choice([0, 30, 90]))
+        assert sorted(broj for p in predlozi for broj in p.vozovi) == sorted(info)
+        for predlog in predlozi:
+            assert nalazi_turnusa(predlog.vozovi, info, "441") == []
+            assert predlog.lokomotiva >= 1
+
+def test_upisi_predlog(baza):
+    vozovi = [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00")]
+    with baza.transakcija() as cursor:
+        for v in vozovi:
+            upisi_voz(cursor, v)
+        upisi_predlog(cursor, predlozi_turnuse(vozovi, "KV", "441"))
+    assert list(procitaj_id_turnusa(baza.cursor(), ["KV-441-001"])) == ["KV-441-001"]
+
+def test_upisi_predlog_odbija_postojece_nazive(baza):
+    vozovi = [voz("101", "BG", "BG", "06:00", "08:00")]
+    with baza.transakcija() as cursor:
+        upisi_voz(cursor, vozovi[0])
+        upisi_predlog(cursor, predlozi_turnuse(vozovi, "KV", "441"))
+    with pytest.raises(ValueError, match="KV-441-001"):
+        with baza.transakcija() as cursor:
+            upisi_predlog(cursor, predlozi_turnuse(vozovi, "KV", "441"))
@@ -0,0 +1,100 @@
+import random
+
+from jezgro.provera import IndeksTurnusa
+from jezgro.sukobi import (
+    DVOSTRUKI_VOZ, PREKLAPANJE, IndeksVoznji, IntervalnoStablo, segmenti_voznje, termini_voznje
+)
+
+from .podaci import voz
+
+def test_stablo_kao_pretraga_svih():
+    rnd = random.Random(7)
+    intervali = []
+    for i in range(300):
+        od = rnd.randrange(1440)
+        intervali.append((od, od + rnd.randrange(1, 240), i))
+    stablo = IntervalnoStablo(intervali)
+    assert len(stablo) == 300
+    for _ in range(200):
+        od = rnd.randrange(1500)
+        do = od + rnd.randrange(1, 120)
+        ocekivano = sorted(i for i in intervali if i[0] < do and i[1] > od)
+        assert sorted(stablo.preklapanja(od, do)) == ocekivano
+
+def test_stablo_poluotvoreni_intervali():
+    stablo = IntervalnoStablo([(10, 20, "a"), (20, 30, "b")])
+    assert [p for _, _, p in stablo.preklapanja(20, 21)] == ["b"]
+    assert [p for _, _, p in stablo.preklapanja(19, 20)] == ["a"]
+    assert stablo.preklapanja(30, 40) == []
+    assert IntervalnoStablo([]).preklapanja(0, 1440) == []
+
+def test_prelazna_voznja_se_deli_na_ponoci():
+    assert segmenti_voznje(voz("101", "BG", "NS", "23:00", "01:30")) == [(1380, 1440), (0, 90)]
+    assert segmenti_voznje(voz("102", "BG", "NS", "06:00", "08:00")) == [(360, 480)]
+    # Lokomotiva je na vožnji i u minutu dolaska
+    assert termini_voznje(voz("101", "BG", "NS", "23:00", "01:30")) == [(1380, 1440), (0, 91)]
+    assert termini_voznje(voz("102", "BG", "NS", "06:00", "08:00")) == [(360, 481)]
+
+def _sukobi(baza):
+    return {(s.vrsta, s.vozovi) for s in IndeksVoznji.ucitaj(baza.cursor()).svi_sukobi()}
+
+def test_voz_u_dva_turnusa_iste_serije(baza, upisi_turnus):
+    a, b = voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00")
+    upisi_turnus("T1", [a, b])
+    upisi_turnus("T2", [b, voz("103", "BG", "NS", "12:00", "14:00")])
+    upisi_turnus("T3", [b], serija_vv="444")  # Druga serija VV: nije sukob
+    assert _sukobi(baza) == {(DVOSTRUKI_VOZ, ("102",))}
+
+def test_istovremene_voznje_razlicitih_turnusa_nisu_sukob(baza, upisi_turnus):
+    upisi_turnus("T1", [voz("101", "BG", "NS", "06:00", "08:00")])
+    upisi_turnus("T2", [voz("201", "BG", "NS", "06:00", "08:00")])
+    assert _sukobi(baza) == set()
+
+def test_preklapanja_voznji_turnusa(baza, upisi_turnus):
+    # Ispravan turnus: vožnje redom, prelazna stiže pre prvog polaska
+    upisi_turnus("T1", [voz("101", "BG", "NS", "06:00", "08:00"), voz("102", "NS", "BG", "09:00", "11:00"),
+                        voz("103", "BG", "NS", "23:00", "05:59")])
+    # Vožnja 203 se preklapa sa 201, a ne sa susednom 202
+    upisi_turnus("T2", [voz("201", "BG", "NS", "06:00", "08:00"), voz("202", "NS", "BG", "09:00", "11:00"),
+                        voz("203", "BG", "NS", "07:00", "08:30")])
+    # Prelazna vožnja stiže u minutu prvog polaska
+    upisi_turnus("T3", [voz("301", "BG", "NS", "06:00", "08:00"), voz("302", "NS", "BG", "23:00", "06:00")])
+    assert _sukobi(baza) == {(PREKLAPANJE, ("201", "203")), (PREKLAPANJE, ("301", "302"))}
+
+def test_preklapanja_kao_pretraga_svih(baza, upisi_turnus):
+    rnd = random.Random(11)
+    turnusi = {}
+    for t in range(40):
+        vozovi = []
+        for i in range(rnd.randrange(1, 5)):
+            polazak = rnd.randrange(1440)
+            dolazak = (polazak + rnd.randrange(10, 300)) % 1440
+            vozovi.append(voz(f"{t}{i:02d}0", "BG", "BG", f"{polazak // 60}:{polazak % 60}",
+                              f"{dolazak // 60}:{dolazak % 60}"))
+        turnusi[upisi_turnus(f"T{t}", vozovi)] = vozovi
+    indeks = IndeksVoznji.ucitaj(baza.cursor())
+    for turnus_id, vozovi in turnusi.items():
+        minuti = [{m % 1440 for m in range(v.polazak_min, v.polazak_min + v.trajanje_min + 1)} for v in vozovi]
+        ocekivano = [(a.broj, b.broj) for i, a in enumerate(vozovi) for j, b in enumerate(vozovi)
+                     if i < j and minuti[i] & minuti[j]]
+        assert [s.vozovi for s in indeks.preklapanja(turnus_id)] == ocekivano
+
+def test_izmene_azuriraju_indeks(baza, upisi_turnus):
+    t1 = upisi_turnus("T1", [voz("101", "BG", "NS", "06:00", "08:00")])
+    t2 = upisi_turnus("T2", [voz("201", "BG", "SU", "06:00", "09:00")])
+    turnusi = IndeksTurnusa.ucitaj(baza.cursor())
+    indeks = IndeksVoznji(turnusi)
+    assert turnusi.pratioci == []  # Prijavljuje se izričito
+    turnusi.pratioci.append(indeks)
+    assert indeks.svi_sukobi() == []
+
+    # Izmena voza koja ne pravi sukob ne dira druge turnuse
+    assert turnusi.postavi_voz(voz("201", "NS", "SU", "09:30", "11:00")) == {t2}
+
+    # Voz 101 i u T2: dvostruki voz je nalaz oba turnusa; brisanje T2 ga uklanja
+    assert turnusi.postavi_turnus(t2, "T2", "KV", "441", ["101", "201"]) == {t1, t2}
+    assert [n.vrsta for n in turnusi.proveri(t1).nalazi] == [DVOSTRUKI_VOZ]
+    assert {s.vrsta for s in indeks.svi_sukobi()} == {DVOSTRUKI_VOZ}
+    assert turnusi.ukloni_turnus(t2) == {t1, t2}
+    assert indeks.svi_sukobi() == []
+    assert turnusi.proveri(t1).nalazi == []
@@ -0,0 +1,56 @@
+import datetime
+import os
+
+import pytest
+
+from jezgro import procitaj_sastav_turnusa, procitaj_sve_vozove
+from uvoz import uvezi
+
+PRIMER_IZVESTAJA = os.path.join(os.path.dirname(__file__), os.pardir, "Primer Dnevni izveštaj 14 09 2025.xlsx")
+
+def _csv(putanja, *redovi):
+    putanja.write_text("\n".join(";".join(red) for red in redovi) + "\n", encoding="utf-8")
+    return str(putanja)
+
+def test_fajl_koji_ne_postoji_ide_u_izvestaj(baza, tmp_path):
+    red_voznje = _csv(tmp_path / "red.csv",
+                      ("Broj voza", "Početna stanica", "Krajnja stanica", "Polazak", "Dolazak", "Sekcija"),
+                      ("1001", "BG", "NS", "06:00", "07:30", "KV"))
+    izvestaj = uvezi(baza, [str(tmp_path / "nema.csv"), red_voznje])
+    assert izvestaj.vozova == 1
+    assert [(izvor, broj_reda) for izvor, broj_reda, _ in izvestaj.greske] == [("nema.csv", None)]
+
+def test_neispravan_xlsx_ide_u_izvestaj(baza, tmp_path):
+    putanja = tmp_path / "pokvaren.xlsx"
+    putanja.write_text("nije xlsx", encoding="utf-8")
+    izvestaj = uvezi(baza, [str(putanja)])
+    assert [izvor for izvor, _, _ in izvestaj.greske] == ["pokvaren.xlsx"]
+
+def test_xlsx_sa_naslovom_i_spojenom_serijom(baza, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    knjiga = openpyxl.Workbook()
+    list_ = knjiga.active
+    list_.append(["RED VOŽNJE ZA 2025. godinu"])
+    list_.append([])
+    list_.append(["Serija VV", "Turnus", "Broj voza", "Od", "Do", "Polazak", "Dolazak", "Sekcija"])
+    list_.append(["441", "KV-1", 1001, "BG", "NS", datetime.time(6, 0), datetime.time(7, 30), "KV"])
+    list_.append([None, None, 1002, "NS", "BG", datetime.time(8, 0), datetime.time(9, 30), None])
+    list_.merge_cells("A4:A5")
+    list_.merge_cells("B4:B5")
+    list_.merge_cells("H4:H5")
+    putanja = tmp_path / "red.xlsx"
+    knjiga.save(putanja)
+
+    izvestaj = uvezi(baza, [str(putanja)])
+    assert izvestaj.greske == []
+    assert (izvestaj.vozova, izvestaj.turnusa) == (2, 1)
+    cursor = baza.cursor()
+    assert procitaj_sve_vozove(cursor)["1002"].serija == "441"
+    assert list(procitaj_sastav_turnusa(cursor).values()) == [["1001", "1002"]]
+
+def test_dnevni_izvestaj_nema_vozova(baza):
+    # Stanje vučnih vozila nema kolone vozova ni turnusa: svaki list je jedna greška zaglavlja
+    pytest.importorskip("openpyxl")
+    izvestaj = uvezi(baza, [PRIMER_IZVESTAJA])
+    assert (izvestaj.vozova, izvestaj.turnusa) == (0, 0)
+    assert [(broj_reda, "zaglavlje" in poruka) for _, broj_reda, poruka in izvestaj.greske] == [(None, True)] * 2
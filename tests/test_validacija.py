@@ -0,0 +1,56 @@
+import pytest
+
+from jezgro import KRUG, STANICA, VREME, nalaz_kruga, nalazi_turnusa, proveri_voz
+
+from .podaci import voz
+
+def test_proveri_voz_vraca_voz():
+    v = proveri_voz(" 1234 ", "BG", "NS", "6", "05", "8", "0", "", "", "KV")
+    assert v.broj == "1234"
+    assert (v.sat_p, v.min_p, v.sat_d, v.min_d) == (6, 5, 8, 0)
+    assert v.serija is None
+    assert v.status == "R"
+
+@pytest.mark.parametrize("polja, poruka", [
+    (("12", "BG", "NS", "6", "0", "8", "0"), "3-6 karaktera"),
+    (("1234", "B", "NS", "6", "0", "8", "0"), "Početna stanica"),
+    (("1234", "BG", "N5", "6", "0", "8", "0"), "Krajnja stanica"),
+    (("1234", "BG", "NS", "24", "0", "8", "0"), "Sat polaska"),
+    (("1234", "BG", "NS", "6", "60", "8", "0"), "Minut polaska"),
+    (("1234", "BG", "NS", "6", "0", "", "0"), "Sat dolaska"),
+])
+def test_proveri_voz_greske(polja, poruka):
+    with pytest.raises(ValueError, match=poruka):
+        proveri_voz(*polja, sekcija="KV")
+
+def test_proveri_voz_bez_sekcije():
+    with pytest.raises(ValueError, match="Sekcija"):
+        proveri_voz("1234", "BG", "NS", "6", "0", "8", "0")
+
+def _info(*vozovi):
+    return {v.broj: v for v in vozovi}
+
+def test_nalaz_kruga_prelazni_posle_prvog_polaska():
+    info = _info(voz("101", "BG", "NS", "02:00", "06:00"), voz("102", "NS", "BG", "22:00", "03:00"))
+    nalaz = nalaz_kruga(["101", "102"], info)
+    assert nalaz.vrsta == KRUG
+    assert nalaz.broj_voza == "102"
+
+@pytest.mark.parametrize("dolazak", ["01:00", "01:59"])
+def test_nalaz_kruga_prelazni_pre_prvog_polaska(dolazak):
+    info = _info(voz("101", "BG", "NS", "02:00", "06:00"), voz("102", "NS", "BG", "22:00", dolazak))
+    assert nalaz_kruga(["101", "102"], info) is None
+
+def test_nalaz_kruga_bez_prelaznog_i_za_jedan_voz():
+    info = _info(voz("101", "BG", "NS", "02:00", "06:00"), voz("102", "NS", "BG", "07:00", "09:00"))
+    assert nalaz_kruga(["101", "102"], info) is None
+    assert nalaz_kruga(["101"], info) is None
+
+def test_nalazi_turnusa_susedni_i_krug():
+    info = _info(voz("101", "BG", "NS", "06:00", "10:00"), voz("102", "SU", "BG", "09:00", "11:00"))
+    assert [n.vrsta for n in nalazi_turnusa(["101", "102"], info)] == [STANICA, VREME]
+
+def test_prelazni_pa_voz_narednog_dana():
+    # Dolazak prelaznog voza se računa u narednom danu, pa ga voz istog dana ne može nastaviti
+    info = _info(voz("101", "BG", "NS", "22:00", "01:00"), voz("102", "NS", "BG", "23:00", "23:50"))
+    assert [n.vrsta for n in nalazi_turnusa(["101", "102"], info)] == [VREME]
@@ -0,0 +1,114 @@
+import logging
+import sqlite3
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QCoreApplication, pyqtSignal
+
+log = logging.getLogger(__name__)
+
+# --- POZADINSKO UČITAVANJE ---
+
+class _Signali(QObject):
+    # Zadatak, rezultat, greška - stiže u GUI nit preko reda događaja
+    zavrsen = pyqtSignal(object, object, object)
+
+class UpitZadatak(QRunnable):
+    """Izvršava jedan upit u niti iz QThreadPool-a, na sopstvenoj konekciji ka bazi.
+
+    SQLite konekcija ne sme da se deli između niti, pa zadatak otvara svoju i zatvara
+    je na kraju. prekini() može da se pozove iz GUI niti i prekida upit koji je u toku.
+    """
+    def __init__(self, baza, vrsta, generacija, upit, signali):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.baza = baza
+        self.vrsta = vrsta
+        self.generacija = generacija
+        self.upit = upit
+        self.signali = signali
+        self.otkazan = False
+        self._conn = None
+
+    def run(self):
+        rezultat = greska = None
+        if not self.otkazan:
+            try:
+                conn = self.baza.nova_konekcija()
+                self._conn = conn
+                try:
+                    rezultat = self.upit(conn.cursor())
+                finally:
+                    self._conn = None
+                    conn.close()
+            except Exception as e:
+                greska = e
+        self.signali.zavrsen.emit(self, rezultat, greska)
+
+    def prekini(self):
+        self.otkazan = True
+        conn = self._conn
+        if conn is not None:
+            try:
+                conn.interrupt()
+            except sqlite3.ProgrammingError:
+                pass  # Konekcija je upravo zatvorena, upit je već završen
+
+class Ucitavac(QObject):
+    """Pokreće upite za prikaz van GUI niti i vraća rezultate preko signala.
+
+    Svaka vrsta učitavanja ('vozovi', 'turnusi', 'grafik'...) ima svoj brojač generacija:
+    novi zahtev otkazuje prethodni iste vrste, a rezultat starije generacije se odbacuje
+    umesto da pregazi noviji.
+    """
+    def __init__(self, baza, parent=None):
+        super().__init__(parent)
+        self.baza = baza
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self._signali = _Signali()
+        self._signali.zavrsen.connect(self._na_zavrsen)
+        self._generacije = {}  # vrsta -> generacija poslednjeg zahteva
+        self._zadaci = {}  # vrsta -> (zadatak, primi) za zahtev koji još čeka rezultat
+        self._aktivni = set()  # Svi pokrenuti zadaci, dok ne jave da su završeni
+
+    def pokreni(self, vrsta, upit, primi):
+        """Pokreće upit(cursor) u pozadini; primi(rezultat) se poziva u GUI niti."""
+        self.otkazi(vrsta)
+        generacija = self._generacije.get(vrsta, 0) + 1
+        self._generacije[vrsta] = generacija
+        zadatak = UpitZadatak(self.baza, vrsta, generacija, upit, self._signali)
+        self._zadaci[vrsta] = (zadatak, primi)
+        self._aktivni.add(zadatak)
+        self.pool.start(zadatak)
+        return generacija
+
+    def otkazi(self, vrsta):
+        """Otkazuje zahtev date vrste koji je u toku (njegov rezultat se neće primeniti)."""
+        self._generacije[vrsta] = self._generacije.get(vrsta, 0) + 1
+        zadatak, _ = self._zadaci.pop(vrsta, (None, None))
+        if zadatak is not None:
+            zadatak.prekini()
+            if self.pool.tryTake(zadatak):
+                self._aktivni.discard(zadatak)
+
+    def otkazi_sve(self):
+        for vrsta in list(self._zadaci):
+            self.otkazi(vrsta)
+
+    def u_toku(self, vrsta):
+        """Da li se čeka rezultat zahteva date vrste."""
+        return vrsta in self._zadaci
+
+    def sacekaj(self):
+        """Čeka da se završe svi zadaci i primenjuje njihove rezultate (npr. pri zatvaranju)."""
+        self.pool.waitForDone()
+        QCoreApplication.processEvents()
+
+    def _na_zavrsen(self, zadatak, rezultat, greska):
+        self._aktivni.discard(zadatak)
+        if zadatak.generacija != self._generacije.get(zadatak.vrsta):
+            return  # Zastareo ili otkazan zahtev
+        _, primi = self._zadaci.pop(zadatak.vrsta)
+        if greska is not None:
+            log.error("Greška pri učitavanju (%s)", zadatak.vrsta, exc_info=greska)
+            return
+        primi(rezultat)
@@ -0,0 +1,339 @@
+import argparse
+import csv
+import datetime
+import os
+import re
+import sys
+import unicodedata
+import zipfile
+
+try:
+    import openpyxl
+except ImportError:  # Bez openpyxl uvoze se samo CSV fajlovi
+    openpyxl = None
+
+from jezgro import (
+    Baza, DB_PATH, postojeci_vozovi, procitaj_id_turnusa, procitaj_vozove_po_broju, proveri_obavezna_polja,
+    proveri_voz, proveri_vozove_turnusa, razdvoji_vozove, upisi_vozove, upisi_vozove_turnusa
+)
+
+# --- KOLONE ---
+# Zaglavlje se prepoznaje po nazivima kolona (bez razlike u velikim slovima,
+# dijakriticima i interpunkciji), pa redosled kolona u fajlu nije bitan.
+
+NAZIVI_KOLONA = {
+    'broj': ("broj voza", "broj", "voz", "br voza"),
+    'pocetna': ("pocetna stanica", "pocetna", "polazna stanica", "od", "od stanice"),
+    'krajnja': ("krajnja stanica", "krajnja", "dolazna stanica", "do", "do stanice"),
+    'polazak': ("polazak", "vreme polaska"),
+    'dolazak': ("dolazak", "vreme dolaska"),
+    'sat_p': ("sat polaska",),
+    'min_p': ("minut polaska",),
+    'sat_d': ("sat dolaska",),
+    'min_d': ("minut dolaska",),
+    'serija': ("serija", "serija vozila", "serija vv"),
+    'status': ("status",),
+    'sekcija': ("sekcija", "sekcija za vucu vozova"),
+    'turnus': ("turnus", "naziv turnusa"),
+    'vozovi': ("vozovi", "vozovi u turnusu"),
+    'redosled': ("redosled", "rb", "r br"),
+}
+_POLJE_KOLONE = {naziv: polje for polje, nazivi in NAZIVI_KOLONA.items() for naziv in nazivi}
+
+# Kolone spojene preko grupe redova (kao "Serija VV" u Dnevnom izveštaju): prazna
+# ćelija znači istu vrednost kao u redu iznad. Sam Dnevni izveštaj (stanje vučnih
+# vozila) nema vozove ni turnuse, pa se iz njega ništa ne uvozi.
+GRUPNE_KOLONE = ('serija', 'sekcija', 'turnus')
+
+# Zaglavlje se traži u prvih toliko redova (iznad mogu biti naslov i datum izveštaja)
+REDOVA_ZA_ZAGLAVLJE = 20
+
+VELICINA_PAKETA = 5000  # vozova po transakciji
+
+def _normalizuj(naziv):
+    """Naziv kolone bez dijakritika, malim slovima, sa jednim razmakom između reči."""
+    naziv = naziv.replace("đ", "dj").replace("Đ", "Dj")
+    naziv = unicodedata.normalize("NFKD", naziv).encode("ascii", "ignore").decode("ascii")
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", naziv.lower()).split())
+
+def _celija(vrednost):
+    """Vrednost ćelije kao tekst; celi brojevi iz XLSX-a (1001.0) bez decimala."""
+    if vrednost is None:
+        return ""
+    if isinstance(vrednost, float) and vrednost.is_integer():
+        return str(int(vrednost))
+    return str(vrednost).strip()
+
+def vreme(vrednost, naziv):
+    """Vreme iz ćelije kao (sat, minut) u tekstu, za proveri_voz.
+
+    Prima datetime.time/datetime iz XLSX-a, razlomak dana (Excel) ili tekst SS:MM / SS.MM.
+    Prazna ćelija daje ("", "") pa proveri_voz prijavljuje nepopunjeno polje.
+    """
+    if isinstance(vrednost, (datetime.time, datetime.datetime)):
+        return str(vrednost.hour), str(vrednost.minute)
+    if isinstance(vrednost, float) and 0 <= vrednost < 1:
+        minuti = round(vrednost * 24 * 60)
+        return str(minuti // 60), str(minuti % 60)
+    tekst = _celija(vrednost)
+    if not tekst:
+        return "", ""
+    delovi = re.fullmatch(r"(\d{1,2})[:.](\d{2})(?::\d{2})?", tekst)
+    if not delovi:
+        raise ValueError(f"{naziv} '{tekst}' nije u obliku SS:MM.")
+    return delovi.group(1), delovi.group(2)
+
+# --- ČITANJE FAJLOVA ---
+
+def _redovi_csv(putanja):
+    with open(putanja, newline="", encoding="utf-8-sig") as f:
+        uzorak = f.read(4096)
+        f.seek(0)
+        try:
+            dijalekt = csv.Sniffer().sniff(uzorak, delimiters=",;\t")
+        except csv.Error:
+            dijalekt = csv.excel
+        for broj_reda, red in enumerate(csv.reader(f, dijalekt), 1):
+            yield broj_reda, red
+
+def _redovi_lista(list_):
+    for broj_reda, red in enumerate(list_.iter_rows(values_only=True), 1):
+        yield broj_reda, list(red)
+
+def tabele(putanja):
+    """Tabele iz fajla kao (izvor, redovi); redovi su generator (broj_reda, ćelije).
+
+    CSV je jedna tabela, a XLSX po jedna za svaki list. Redovi se čitaju redom,
+    bez učitavanja celog fajla u memoriju.
+    """
+    if os.path.splitext(putanja)[1].lower() in (".xlsx", ".xlsm"):
+        if openpyxl is None:
+            raise RuntimeError("Za uvoz XLSX fajlova potreban je paket openpyxl (pip install openpyxl).")
+        knjiga = openpyxl.load_workbook(putanja, read_only=True, data_only=True)
+        try:
+            for list_ in knjiga.worksheets:
+                yield f"{os.path.basename(putanja)} [{list_.title}]", _redovi_lista(list_)
+        finally:
+            knjiga.close()
+    else:
+        yield os.path.basename(putanja), _redovi_csv(putanja)
+
+def kolone_zaglavlja(celije):
+    """Rečnik {polje: indeks kolone} za red zaglavlja; prva kolona istog polja ima prednost."""
+    kolone = {}
+    for indeks, celija in enumerate(celije):
+        polje = _POLJE_KOLONE.get(_normalizuj(_celija(celija)))
+        if polje is not None:
+            kolone.setdefault(polje, indeks)
+    return kolone
+
+def _je_zaglavlje(kolone):
+    return 'broj' in kolone or {'turnus', 'vozovi'} <= kolone.keys()
+
+def _ima_vremena(kolone):
+    return ({'polazak', 'dolazak'} <= kolone.keys()
+            or {'sat_p', 'min_p', 'sat_d', 'min_d'} <= kolone.keys())
+
+# --- UVOZ ---
+
+class Izvestaj:
+    """Rezultat uvoza: broj upisanih vozova i turnusa i greške po redovima."""
+    def __init__(self):
+        self.vozova = 0
+        self.turnusa = 0
+        self.greske = []  # (izvor, broj_reda, poruka)
+
+    def greska(self, izvor, broj_reda, poruka):
+        self.greske.append((izvor, broj_reda, poruka))
+
+class Uvoz:
+    """Uvoz vozova i turnusa iz jednog ili više fajlova u bazu.
+
+    Vozovi se proveravaju kao u formi (proveri_voz) i upisuju u paketima od
+    VELICINA_PAKETA po transakciji. Turnusi se skupljaju dok se čitaju fajlovi i
+    upisuju na kraju (zavrsi), kad su svi vozovi u bazi, uz iste provere kao
+    "Proveri turnus". Neispravan red se preskače i beleži u izveštaj.
+    """
+    def __init__(self, baza, azuriraj=False):
+        self.baza = baza
+        self.azuriraj = azuriraj
+        self.izvestaj = Izvestaj()
+        self._paket = []  # (izvor, broj_reda, Voz)
+        self._vozovi_u_uvozu = {}  # broj_voza -> (izvor, broj_reda) prvog pojavljivanja
+        self._turnusi = {}  # naziv -> rečnik turnusa (vidi _dodaj_u_turnus)
+
+    def uvezi_fajl(self, putanja):
+        """Uvozi sve tabele fajla; fajl koji ne može da se pročita beleži se u izveštaj."""
+        try:
+            for izvor, redovi in tabele(putanja):
+                self.uvezi_tabelu(izvor, redovi)
+        except (OSError, RuntimeError, UnicodeDecodeError, zipfile.BadZipFile) as e:
+            self.izvestaj.greska(os.path.basename(putanja), None, f"Fajl nije moguće pročitati: {e}")
+
+    def uvezi_tabelu(self, izvor, redovi):
+        kolone = None
+        for broj_reda, celije in redovi:
+            kolone = kolone_zaglavlja(celije)
+            if _je_zaglavlje(kolone):
+                break
+            if broj_reda >= REDOVA_ZA_ZAGLAVLJE:
+                kolone = None
+                break
+        if not kolone or not _je_zaglavlje(kolone):
+            self.izvestaj.greska(izvor, None, "Nije pronađeno zaglavlje sa kolonama vozova ili turnusa "
+                                              "(npr. 'Broj voza', 'Polazak', 'Dolazak' ili 'Turnus', 'Vozovi').")
+            return
+        sa_vremenima = _ima_vremena(kolone)
+        if 'broj' in kolone and not sa_vremenima and 'turnus' not in kolone:
+            self.izvestaj.greska(izvor, None, "Tabela vozova mora imati kolone polaska i dolaska.")
+            return
+
+        grupa = {}
+        for broj_reda, celije in redovi:
+            polja = {polje: celije[indeks] if indeks < len(celije) else None for polje, indeks in kolone.items()}
+            if not any(_celija(v) for v in polja.values()):
+                continue  # prazan red (razmak između grupa)
+            for polje in GRUPNE_KOLONE:
+                if polje in polja:
+                    if _celija(polja[polje]):
+                        grupa[polje] = polja[polje]
+                    else:
+                        polja[polje] = grupa.get(polje)
+            # Voz ostaje u turnusu i kad sam nije ispravan, pa turnus prijavljuje da ga nema u bazi
+            if 'turnus' in polja:
+                try:
+                    self._dodaj_u_turnus(izvor, broj_reda, polja)
+                except ValueError as e:
+                    self.izvestaj.greska(izvor, broj_reda, str(e))
+            if sa_vremenima and _celija(polja.get('broj')):
+                try:
+                    self._dodaj_voz(izvor, broj_reda, polja)
+                except ValueError as e:
+                    self.izvestaj.greska(izvor, broj_reda, str(e))
+        self._upisi_paket()
+
+    def _dodaj_voz(self, izvor, broj_reda, polja):
+        if 'polazak' in polja:
+            sat_p, min_p = vreme(polja['polazak'], "Polazak")
+            sat_d, min_d = vreme(polja['dolazak'], "Dolazak")
+        else:
+            sat_p, min_p, sat_d, min_d = (_celija(polja[p]) for p in ('sat_p', 'min_p', 'sat_d', 'min_d'))
+        voz = proveri_voz(
+            _celija(polja['broj']), _celija(polja.get('pocetna')), _celija(polja.get('krajnja')),
+            sat_p, min_p, sat_d, min_d,
+            _celija(polja.get('serija')), _celija(polja.get('status')), _celija(polja.get('sekcija'))
+        )
+        prvi = self._vozovi_u_uvozu.get(voz.broj)
+        if prvi is not None:
+            raise ValueError(f"Voz broj {voz.broj} se ponavlja (prvi put u {prvi[0]}, red {prvi[1]}).")
+        self._vozovi_u_uvozu[voz.broj] = (izvor, broj_reda)
+        self._paket.append((izvor, broj_reda, voz))
+        if len(self._paket) >= VELICINA_PAKETA:
+            self._upisi_paket()
+
+    def _upisi_paket(self):
+        if not self._paket:
+            return
+        paket, self._paket = self._paket, []
+        with self.baza.transakcija() as cursor:
+            if not self.azuriraj:
+                postojeci = postojeci_vozovi(cursor, (voz.broj for _, _, voz in paket))
+                for izvor, broj_reda, voz in paket:
+                    if voz.broj in postojeci:
+                        self.izvestaj.greska(izvor, broj_reda, f"Voz broj {voz.broj} već postoji!")
+                paket = [stavka for stavka in paket if stavka[2].broj not in postojeci]
+            upisi_vozove(cursor, (voz for _, _, voz in paket), self.azuriraj)
+        self.izvestaj.vozova += len(paket)
+
+    def _dodaj_u_turnus(self, izvor, broj_reda, polja):
+        naziv = _celija(polja['turnus'])
+        if not naziv:
+            raise ValueError("Nije naveden naziv turnusa.")
+        turnus = self._turnusi.get(naziv)
+        if turnus is None:
+            # Serija VV i sekcija turnusa su iz njegovog prvog reda
+            turnus = self._turnusi[naziv] = {
+                'izvor': izvor, 'red': broj_reda, 'vozovi': [],
+                'serija_vv': _celija(polja.get('serija')), 'sekcija': _celija(polja.get('sekcija')),
+            }
+        if 'vozovi' in polja:
+            brojevi = razdvoji_vozove(_celija(polja['vozovi']))
+        else:
+            brojevi = [_celija(polja.get('broj'))] if _celija(polja.get('broj')) else []
+        redosled = _celija(polja.get('redosled'))
+        for broj in brojevi:
+            kljuc = (int(redosled) if redosled.isdigit() else len(turnus['vozovi']) + 1, len(turnus['vozovi']))
+            turnus['vozovi'].append((kljuc, broj))
+
+    def zavrsi(self):
+        """Upisuje preostale vozove i sve prikupljene turnuse; vraća izveštaj."""
+        self._upisi_paket()
+        if not self._turnusi:
+            return self.izvestaj
+        turnusi = self._turnusi
+        self._turnusi = {}
+        with self.baza.transakcija() as cursor:
+            postojeci = procitaj_id_turnusa(cursor, turnusi)
+            svi_brojevi = {broj for turnus in turnusi.values() for _, broj in turnus['vozovi']}
+            vozovi_info = procitaj_vozove_po_broju(cursor, svi_brojevi)
+            for naziv, turnus in turnusi.items():
+                vozovi = [broj for _, broj in sorted(turnus['vozovi'])]
+                try:
+                    if naziv in postojeci and not self.azuriraj:
+                        raise ValueError(f"Turnus '{naziv}' već postoji!")
+                    proveri_obavezna_polja([
+                        ("Vozovi u turnusu", vozovi),
+                        ("Sekcija za vuču vozova", turnus['sekcija']),
+                        ("Serija VV", turnus['serija_vv'])
+                    ])
+                    ponovljeni = sorted({broj for broj in vozovi if vozovi.count(broj) > 1})
+                    if ponovljeni:
+                        raise ValueError(f"Vozovi se ponavljaju u turnusu '{naziv}': {', '.join(ponovljeni)}")
+                    proveri_vozove_turnusa(vozovi, vozovi_info, turnus['serija_vv'])
+                except ValueError as e:
+                    self.izvestaj.greska(turnus['izvor'], turnus['red'], f"Turnus '{naziv}': {e}")
+                    continue
+                turnus_id = postojeci.get(naziv)
+                if turnus_id is not None:
+                    cursor.execute("UPDATE turnusi SET serija_vv = ?, sekcija = ? WHERE id = ?",
+                                   (turnus['serija_vv'], turnus['sekcija'], turnus_id))
+                else:
+                    cursor.execute("INSERT INTO turnusi (naziv, serija_vv, sekcija) VALUES (?, ?, ?)",
+                                   (naziv, turnus['serija_vv'], turnus['sekcija']))
+                    turnus_id = cursor.lastrowid
+                upisi_vozove_turnusa(cursor, turnus_id, vozovi)
+                self.izvestaj.turnusa += 1
+        return self.izvestaj
+
+def uvezi(baza, putanje, azuriraj=False):
+    """Uvozi vozove i turnuse iz datih CSV/XLSX fajlova; vraća Izvestaj."""
+    uvoz = Uvoz(baza, azuriraj)
+    for putanja in putanje:
+        uvoz.uvezi_fajl(putanja)
+    return uvoz.zavrsi()
+
+def main(argumenti=None):
+    """Paketni uvoz vozova i turnusa iz komandne linije."""
+    parser = argparse.ArgumentParser(
+        description="Uvoz vozova i turnusa iz CSV/XLSX fajlova (red vožnje ili spisak turnusa).")
+    parser.add_argument("fajlovi", nargs="+", help="CSV ili XLSX fajlovi; uvoze se redom")
+    parser.add_argument("--baza", default=DB_PATH, help=f"SQLite baza (podrazumevano {DB_PATH})")
+    parser.add_argument("--azuriraj", action="store_true",
+                        help="postojeće vozove i turnuse (isti broj/naziv) zameni podacima iz fajla")
+    args = parser.parse_args(argumenti)
+
+    baza = Baza(args.baza)
+    try:
+        baza.migriraj()
+        izvestaj = uvezi(baza, args.fajlovi, args.azuriraj)
+    finally:
+        baza.zatvori()
+
+    for izvor, broj_reda, poruka in izvestaj.greske:
+        mesto = f"{izvor}, red {broj_reda}" if broj_reda is not None else izvor
+        print(f"❌ {mesto}: {poruka.replace(':' + chr(10), ': ').replace(chr(10), '; ')}")
+    print(f"✅ Uvezeno {izvestaj.vozova} vozova i {izvestaj.turnusa} turnusa, grešaka: {len(izvestaj.greske)}")
+    return 1 if izvestaj.greske else 0
+
+if __name__ == "__main__":
+    sys.exit(main())